@@ -0,0 +1,109 @@
+"""
+벤치마크용 다국어(ko/en/ja/tw) 회사/태그 CSV 생성기.
+
+init_db_from_csv 와 같은 컬럼 형식(+ 선택 컬럼 company_tw, tag_tw)으로 출력하므로
+bulk_load_from_csv 로 바로 적재할 수 있다.
+
+    python -m backend.benchmarks.generate --companies 1000000 --tags 5000 --out bench.csv
+    python -m backend.utils.bulk_load_from_csv --csv bench.csv
+"""
+import argparse
+import csv
+import random
+from typing import Dict, Iterator, List, Optional
+
+COLUMNS = ("company_ko", "company_en", "company_ja", "company_tw", "tag_ko", "tag_en", "tag_ja", "tag_tw")
+
+# 회사명 조각 (언어별로 같은 의미의 조각을 같은 위치에 둔다)
+_STEMS = [
+    ("원티드", "Wanted", "ウォンテッド", "旺得"),
+    ("링크", "Link", "リンク", "連結"),
+    ("코드", "Code", "コード", "代碼"),
+    ("클라우드", "Cloud", "クラウド", "雲端"),
+    ("데이터", "Data", "データ", "數據"),
+    ("스마트", "Smart", "スマート", "智慧"),
+    ("네오", "Neo", "ネオ", "新"),
+    ("블루", "Blue", "ブルー", "藍"),
+    ("그린", "Green", "グリーン", "綠"),
+    ("하이", "High", "ハイ", "高"),
+    ("모빌", "Mobile", "モバイル", "行動"),
+    ("페이", "Pay", "ペイ", "支付"),
+    ("헬스", "Health", "ヘルス", "健康"),
+    ("에듀", "Edu", "エデュ", "教育"),
+    ("게임", "Game", "ゲーム", "遊戲"),
+    ("푸드", "Food", "フード", "美食"),
+]
+_SUFFIXES = [
+    ("랩", "Lab", "ラボ", "實驗室"),
+    ("소프트", "Soft", "ソフト", "軟體"),
+    ("테크", "Tech", "テック", "科技"),
+    ("웍스", "Works", "ワークス", "工作室"),
+    ("시스템즈", "Systems", "システムズ", "系統"),
+    ("코리아", "Korea", "コリア", "韓國"),
+]
+_TAG_PREFIX = ("태그", "tag", "タグ", "標籤")
+
+# 언어별 이름이 채워질 확률 (샘플 CSV 처럼 일부 언어만 있는 회사가 섞이도록)
+LANGUAGE_COVERAGE = {"ko": 0.9, "en": 0.8, "ja": 0.4, "tw": 0.3}
+LANGUAGES = ("ko", "en", "ja", "tw")
+
+
+def company_names(index: int, rng: random.Random) -> Dict[str, Optional[str]]:
+    """index 가 다르면 이름도 다르도록 조각 조합 뒤에 번호를 붙인다"""
+    stem = rng.choice(_STEMS)
+    suffix = rng.choice(_SUFFIXES)
+    names = {}
+    for i, lang in enumerate(LANGUAGES):
+        sep = " " if lang == "en" else ""
+        names[lang] = f"{stem[i]}{sep}{suffix[i]}{sep}{index}" if rng.random() < LANGUAGE_COVERAGE[lang] else None
+    if not any(names.values()):
+        names["ko"] = f"{stem[0]}{suffix[0]}{index}"
+    return names
+
+
+def tag_names(index: int) -> Dict[str, str]:
+    return {lang: f"{_TAG_PREFIX[i]}_{index}" for i, lang in enumerate(LANGUAGES)}
+
+
+def generate_rows(companies: int, tags: int, tags_per_company: int = 3, seed: int = 0) -> Iterator[dict]:
+    """
+    CSV 행을 스트리밍으로 생성. 태그 인기도는 Zipf 분포(1/rank)를 따르므로
+    일부 태그에 회사가 몰리는 실제 분포와 비슷한 부하가 만들어진다.
+    """
+    rng = random.Random(seed)
+    tag_ids = list(range(1, tags + 1))
+    weights = [1 / rank for rank in tag_ids]
+    for index in range(1, companies + 1):
+        names = company_names(index, rng)
+        picked: List[int] = list(dict.fromkeys(rng.choices(tag_ids, weights, k=tags_per_company)))
+        row = {f"company_{lang}": names[lang] or "" for lang in LANGUAGES}
+        for lang in LANGUAGES:
+            row[f"tag_{lang}"] = "|".join(tag_names(t)[lang] for t in picked)
+        yield row
+
+
+def write_csv(path: str, companies: int, tags: int, tags_per_company: int = 3, seed: int = 0) -> int:
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        for row in generate_rows(companies, tags, tags_per_company, seed):
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 다국어 회사/태그 CSV 생성")
+    parser.add_argument("--companies", type=int, default=100000)
+    parser.add_argument("--tags", type=int, default=1000)
+    parser.add_argument("--tags-per-company", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="bench_company_tag.csv")
+    args = parser.parse_args()
+    count = write_csv(args.out, args.companies, args.tags, args.tags_per_company, args.seed)
+    print(f"{count} rows written to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+동시 HTTP 부하 생성기.
+
+generate 로 만든 CSV 에서 회사/태그 이름을 샘플링해 /search, /tags, GET /companies/{name},
+POST /companies 를 가중치대로 섞어 호출하고, 엔드포인트별 p50/p95/p99 와 처리량을 JSON 으로 출력한다.
+
+    python -m backend.benchmarks.load --base-url http://localhost:8080 --csv bench.csv \\
+        --concurrency 32 --duration 30 --out load.json
+"""
+import argparse
+import asyncio
+import csv
+import itertools
+import json
+import random
+import time
+import uuid
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import httpx
+
+from backend.benchmarks.stats import summarize
+from backend.utils.init_db_from_csv import parse_row
+from backend.utils.util import SUPPORTED_LANGUAGES
+
+# 엔드포인트별 기본 호출 비율 (읽기 위주)
+DEFAULT_WEIGHTS = {"search": 50, "company": 30, "tags": 19, "create": 1}
+SAMPLE_ROWS = 10000
+
+
+def load_samples(csv_path: str, size: int = SAMPLE_ROWS) -> Tuple[List[tuple], List[tuple]]:
+    companies, tags = [], []
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in itertools.islice(csv.DictReader(f), size):
+            company_names, tag_list = parse_row(row)
+            companies.extend((lang, name) for lang, name in company_names.items() if name)
+            tags.extend((lang, name) for names in tag_list for lang, name in names.items() if name)
+    return companies, tags
+
+
+class Scenario:
+    def __init__(self, companies: List[tuple], tags: List[tuple], weights: Dict[str, int], seed: int = 0):
+        self.companies = companies
+        self.tags = tags
+        self.rng = random.Random(seed)
+        self.kinds = [kind for kind, weight in weights.items() if weight > 0]
+        self.weights = [weights[kind] for kind in self.kinds]
+
+    def next_request(self) -> Tuple[str, str, str, dict]:
+        """(종류, HTTP 메서드, 경로, httpx 요청 인자)"""
+        kind = self.rng.choices(self.kinds, self.weights)[0]
+        headers = {"x-wanted-language": self.rng.choice(SUPPORTED_LANGUAGES)}
+        if kind == "search":
+            lang, name = self.rng.choice(self.companies)
+            return kind, "GET", "/search", {"params": {"query": name[:max(len(name) // 2, 1)]},
+                                            "headers": {"x-wanted-language": lang}}
+        if kind == "company":
+            _, name = self.rng.choice(self.companies)
+            return kind, "GET", f"/companies/{name}", {"headers": headers}
+        if kind == "tags":
+            lang, name = self.rng.choice(self.tags)
+            return kind, "GET", "/tags", {"params": {"query": name, "limit": 100},
+                                          "headers": {"x-wanted-language": lang}}
+        suffix = uuid.uuid4().hex[:12]
+        body = {
+            "company_name": {"ko": f"부하회사_{suffix}", "en": f"Load {suffix}"},
+            "tags": [{"tag_name": {lang: name}} for lang, name in self.rng.sample(self.tags, 2)],
+        }
+        return kind, "POST", "/companies", {"json": body, "headers": headers}
+
+
+async def _worker(client: httpx.AsyncClient, scenario: Scenario, deadline: float,
+                  latencies: Dict[str, List[float]], errors: Dict[str, int]) -> None:
+    while time.perf_counter() < deadline:
+        kind, method, path, kwargs = scenario.next_request()
+        begin = time.perf_counter()
+        try:
+            resp = await client.request(method, path, **kwargs)
+            failed = resp.status_code >= 500
+        except httpx.HTTPError:
+            failed = True
+        latencies[kind].append(time.perf_counter() - begin)
+        if failed:
+            errors[kind] += 1
+
+
+async def run(base_url: str, scenario: Scenario, concurrency: int, duration: float,
+              timeout: float = 10.0) -> Dict[str, Dict[str, float]]:
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*(_worker(client, scenario, deadline, latencies, errors) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    report = {kind: summarize(values, elapsed, errors[kind]) for kind, values in sorted(latencies.items())}
+    report["total"] = summarize([v for values in latencies.values() for v in values], elapsed, sum(errors.values()))
+    return report
+
+
+def _parse_weights(value: str) -> Dict[str, int]:
+    weights = dict(DEFAULT_WEIGHTS)
+    for item in filter(None, value.split(",")):
+        kind, weight = item.split("=")
+        if kind not in DEFAULT_WEIGHTS:
+            raise argparse.ArgumentTypeError(f"unknown endpoint: {kind}")
+        weights[kind] = int(weight)
+    return weights
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 HTTP 부하 생성기")
+    parser.add_argument("--base-url", default="http://localhost:8080")
+    parser.add_argument("--csv", required=True, help="이름 샘플링에 사용할 CSV (generate 출력)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=30.0, help="초")
+    parser.add_argument("--weights", type=_parse_weights, default=dict(DEFAULT_WEIGHTS),
+                        help="예: search=60,company=30,tags=10,create=0")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="결과 JSON 파일 경로 (기본: stdout)")
+    args = parser.parse_args()
+
+    companies, tags = load_samples(args.csv)
+    scenario = Scenario(companies, tags, args.weights, args.seed)
+    report = asyncio.run(run(args.base_url, scenario, args.concurrency, args.duration))
+    report["config"] = {"concurrency": args.concurrency, "duration": args.duration, "weights": args.weights}
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
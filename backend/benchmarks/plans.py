@@ -0,0 +1,291 @@
+"""
+CompanyService 읽기 쿼리 실행 계획 회귀 검사.
+
+합성 데이터(generate + bulk_load_from_csv)를 적재한 DB 에서 서비스 메서드를 실행하며 나간 SELECT 문을
+같은 bind 값으로 EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) 하고, 케이스별로 다음을 검사한다.
+  - 기대한 인덱스가 계획에 쓰였는지
+  - PLAN_MAX_SEQ_SCAN_ROWS 행을 넘게 읽는 Seq Scan 이 없는지
+  - 공유 버퍼(hit + read) 수와 반환 행 수가 케이스 예산 이내인지
+  - 계획 모양(노드 종류/테이블/인덱스 트리)이 baseline(plan_baselines.json)과 같은지
+    baseline 이 없는 케이스도 실패이며, --update 로 실행했을 때만 현재 계획을 baseline 파일에 기록한다.
+    --bootstrap 은 baseline 이 없는 케이스만 현재 계획으로 기록하고(실패로 보지 않음) 있는 케이스는 그대로 비교한다.
+    (baseline 파일이 아직 없거나 케이스를 새로 추가했을 때 CI 에서 사용. 기록된 파일은 커밋해야 이후 비교됨)
+쓰기 없이 읽기 메서드만 실행하지만 데이터를 적재하므로 버릴 수 있는 로컬 DB 에서 실행한다.
+
+    python -m backend.benchmarks.plans --seed-companies 50000 [--update | --bootstrap]
+"""
+import argparse
+import csv
+import difflib
+import json
+import os
+import tempfile
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event, func, select, text
+from sqlalchemy.orm import Session
+
+from backend import models, schemas
+from backend.benchmarks.generate import COLUMNS, generate_rows
+from backend.database import SessionLocal
+from backend.services.impl.company import CompanyService
+from backend.services.impl.name_cache import company_name_cache, tag_name_cache
+from backend.services.interfaces.company import CompanyServiceInterface
+
+PLAN_BASELINE_PATH = os.environ.get(
+    "PLAN_BASELINE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "plan_baselines.json")
+)
+# 이보다 많은 행을 읽는 Seq Scan 은 인덱스를 놓친 것으로 본다 (작은 테이블의 Seq Scan 은 정상)
+PLAN_MAX_SEQ_SCAN_ROWS = int(os.environ.get("PLAN_MAX_SEQ_SCAN_ROWS", "1000"))
+PLAN_SEED_COMPANIES = int(os.environ.get("PLAN_SEED_COMPANIES", "50000"))
+PLAN_SEED_TAGS = int(os.environ.get("PLAN_SEED_TAGS", "2000"))
+
+# 케이스별 기대치. indexes: 계획에 모두 나와야 하는 인덱스, max_buffers: 모든 문장의 공유 버퍼 합,
+# max_rows: 한 문장이 반환하는 최대 행 수
+CASES: Dict[str, Dict[str, object]] = {
+    "autocomplete_company": {"indexes": ["idx_company_names_name_trgm"], "max_buffers": 2000, "max_rows": 100},
+    "autocomplete_company_fts": {"indexes": ["idx_company_names_name_tsv"], "max_buffers": 2000, "max_rows": 100},
+    "autocomplete_company_fuzzy": {"indexes": ["idx_company_names_name_trgm"], "max_buffers": 5000, "max_rows": 10},
+    "get_company": {"indexes": ["idx_company_names_name"], "max_buffers": 500, "max_rows": 100},
+    "lookup_companies": {"indexes": ["idx_company_names_name"], "max_buffers": 3000, "max_rows": 100},
+    "search_by_tag_page": {
+        "indexes": ["idx_tag_names_name_trgm", "idx_company_tags_tag_company"], "max_buffers": 5000, "max_rows": 101,
+    },
+    "search_by_tag_page_boolean": {
+        "indexes": ["idx_tag_names_name", "idx_company_tags_tag_company"], "max_buffers": 5000, "max_rows": 101,
+    },
+    "tag_facets": {"indexes": ["idx_tag_counts_company_count"], "max_buffers": 500, "max_rows": 50},
+}
+
+
+def seed(db: Session, companies: int = PLAN_SEED_COMPANIES, tags: int = PLAN_SEED_TAGS) -> int:
+    """회사 수가 companies 보다 적으면 합성 데이터를 적재하고 통계를 갱신. 현재 회사 수를 반환"""
+    from backend.utils.bulk_load_from_csv import load
+
+    current = db.execute(select(func.count()).select_from(models.Company)).scalar_one()
+    if current < companies:
+        fd, path = tempfile.mkstemp(suffix=".csv")
+        try:
+            with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=COLUMNS)
+                writer.writeheader()
+                # 이미 있는 데이터와 이름이 겹치지 않도록 seed 를 회사 수로 바꿔 생성
+                writer.writerows(generate_rows(companies - current, tags, seed=current))
+            load(path, checkpoint_path=path + ".checkpoint")
+        finally:
+            for p in (path, path + ".checkpoint"):
+                if os.path.exists(p):
+                    os.remove(p)
+        current = companies
+    # 적재 직후 통계가 없으면 계획이 실제 운영과 달라지므로 항상 갱신
+    db.execute(text("ANALYZE"))
+    db.commit()
+    return current
+
+
+def _walk(node: dict, depth: int = 0) -> Iterator[Tuple[int, dict]]:
+    yield depth, node
+    for child in node.get("Plans", []):
+        yield from _walk(child, depth + 1)
+
+
+def _label(node: dict) -> str:
+    label = node["Node Type"]
+    if "Relation Name" in node:
+        label += f" on {node['Relation Name']}"
+    if "Index Name" in node:
+        label += f" using {node['Index Name']}"
+    return label
+
+
+def summarize_plan(explain: list) -> Dict[str, object]:
+    """EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) 결과 한 건을 검사/비교용 요약으로 변환"""
+    root = explain[0]["Plan"]
+    nodes = list(_walk(root))
+    seq_scans = []
+    for _, node in nodes:
+        if node["Node Type"] == "Seq Scan":
+            # 필터로 버려진 행까지 실제로 읽은 행 수
+            scanned = node.get("Actual Rows", 0) + node.get("Rows Removed by Filter", 0)
+            seq_scans.append({"relation": node.get("Relation Name"), "rows": scanned * node.get("Actual Loops", 1)})
+    return {
+        "shape": ["  " * depth + _label(node) for depth, node in nodes],
+        "indexes": sorted({node["Index Name"] for _, node in nodes if "Index Name" in node}),
+        "seq_scans": seq_scans,
+        "buffers": root.get("Shared Hit Blocks", 0) + root.get("Shared Read Blocks", 0),
+        "rows": root.get("Actual Rows", 0),
+        "execution_ms": explain[0].get("Execution Time"),
+    }
+
+
+def explain_calls(db: Session, call: Callable[[], object]) -> List[Dict[str, object]]:
+    """call 이 실행한 SELECT 문을 같은 bind 값으로 EXPLAIN ANALYZE 하여 문장별 요약을 반환"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", capture)
+    try:
+        call()
+    finally:
+        event.remove(bind, "before_cursor_execute", capture)
+    summaries = []
+    for statement, parameters in statements:
+        result = db.connection().exec_driver_sql(
+            "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + statement, parameters
+        ).scalar_one()
+        if isinstance(result, str):
+            result = json.loads(result)
+        summaries.append({"statement": statement, **summarize_plan(result)})
+    db.rollback()
+    return summaries
+
+
+def check_case(summaries: List[Dict[str, object]], expectation: Dict[str, object],
+               max_seq_scan_rows: int = PLAN_MAX_SEQ_SCAN_ROWS) -> List[str]:
+    """예산/인덱스 위반 목록 (비어 있으면 통과)"""
+    errors = []
+    used = {index for summary in summaries for index in summary["indexes"]}
+    for index in expectation.get("indexes", []):
+        if index not in used:
+            errors.append(f"index {index} not used (used: {sorted(used)})")
+    for i, summary in enumerate(summaries):
+        for scan in summary["seq_scans"]:
+            if scan["rows"] > max_seq_scan_rows:
+                errors.append(f"statement {i}: seq scan on {scan['relation']} read {scan['rows']} rows")
+        if "max_rows" in expectation and summary["rows"] > expectation["max_rows"]:
+            errors.append(f"statement {i}: returned {summary['rows']} rows > {expectation['max_rows']}")
+    buffers = sum(summary["buffers"] for summary in summaries)
+    if "max_buffers" in expectation and buffers > expectation["max_buffers"]:
+        errors.append(f"shared buffers {buffers} > {expectation['max_buffers']}")
+    return errors
+
+
+def diff_shapes(baseline: List[List[str]], current: List[List[str]]) -> List[str]:
+    """문장별 계획 모양 diff (같으면 빈 리스트)"""
+    before = [line for i, shape in enumerate(baseline) for line in [f"-- statement {i}"] + shape]
+    after = [line for i, shape in enumerate(current) for line in [f"-- statement {i}"] + shape]
+    return list(difflib.unified_diff(before, after, "baseline", "current", lineterm=""))
+
+
+def load_baselines(path: str = PLAN_BASELINE_PATH) -> Dict[str, List[List[str]]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baselines(baselines: Dict[str, List[List[str]]], path: str = PLAN_BASELINE_PATH) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baselines, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def build_calls(db: Session, service: CompanyServiceInterface) -> Dict[str, Callable[[], object]]:
+    """적재된 데이터에서 고른 입력으로 케이스별 서비스 호출을 만든다 (같은 데이터면 항상 같은 입력)"""
+    total = db.execute(select(func.count()).select_from(models.CompanyName)).scalar_one()
+    names = db.execute(
+        select(models.CompanyName.name).where(models.CompanyName.language_code == "en")
+        .order_by(models.CompanyName.id).offset(total // 4).limit(100)
+    ).scalars().all()
+    top_tag = db.execute(
+        select(models.TagName.name).join(models.TagCount, models.TagCount.tag_id == models.TagName.tag_id)
+        .where(models.TagName.language_code == "en")
+        .order_by(models.TagCount.company_count.desc(), models.TagCount.tag_id).limit(2)
+    ).scalars().all()
+    if not names or len(top_tag) < 2:
+        raise SystemExit("DB 가 비어 있습니다. seed 로 먼저 데이터를 적재하세요.")
+    name = names[0]
+    words = name.split()
+    return {
+        # 전체 이름의 뒷부분(번호 포함) 부분 일치 → 선택도가 높아 trigram 인덱스를 타야 함
+        "autocomplete_company": lambda: service.autocomplete_company(db, name[1:], "en", 100),
+        "autocomplete_company_fts": lambda: service.autocomplete_company(
+            db, words[-1], "en", 100, schemas.SearchMode.FTS),
+        "autocomplete_company_fuzzy": lambda: service.autocomplete_company(
+            db, name[:-1], "en", 10, schemas.SearchMode.FUZZY),
+        "get_company": lambda: service.get_company(db, name, "en"),
+        "lookup_companies": lambda: service.lookup_companies(db, names, "en"),
+        "search_by_tag_page": lambda: service.search_by_tag_page(db, top_tag[0], "en", limit=100),
+        "search_by_tag_page_boolean": lambda: service.search_by_tag_page(
+            db, f"{top_tag[0]} OR {top_tag[1]}", "en", schemas.SearchMode.BOOLEAN, limit=100),
+        "tag_facets": lambda: service.tag_facets(db, "en"),
+    }
+
+
+def run(update: bool = False, only: Optional[List[str]] = None,
+        service: Optional[CompanyServiceInterface] = None, bootstrap: bool = False) -> Dict[str, Dict[str, object]]:
+    """
+    케이스별 {"errors", "diff", "bootstrapped", "buffers", "rows", "statements"} 보고서. errors 나 diff 가 있으면 회귀.
+    baseline 이 없는 케이스는 오류로 보고하고, update=True 일 때만 현재 계획을 baseline 으로 기록하여 저장한다.
+    bootstrap=True 이면 baseline 이 없는 케이스만 기록하여 저장하고 bootstrapped 로 표시한다.
+    buffers(문장 합)/rows(문장별 최대)는 CASES 예산을 조정할 때 참고하는 실측값.
+    """
+    service = service or CompanyService()
+    baselines = load_baselines()
+    report = {}
+    with SessionLocal() as db:
+        calls = build_calls(db, service)
+        for name, expectation in CASES.items():
+            if only and name not in only:
+                continue
+            # 이름 → id 캐시 적중으로 조회 문장이 빠지지 않도록 매번 비움
+            company_name_cache.clear()
+            tag_name_cache.clear()
+            summaries = explain_calls(db, calls[name])
+            shapes = [summary["shape"] for summary in summaries]
+            errors = check_case(summaries, expectation)
+            diff = []
+            bootstrapped = bootstrap and not update and name not in baselines
+            if update or bootstrapped:
+                baselines[name] = shapes
+            elif name not in baselines:
+                errors.append(f"no baseline in {PLAN_BASELINE_PATH} (run with --update on a seeded DB and commit it)")
+            else:
+                diff = diff_shapes(baselines[name], shapes)
+            report[name] = {
+                "errors": errors, "diff": diff, "bootstrapped": bootstrapped,
+                "buffers": sum(summary["buffers"] for summary in summaries),
+                "rows": max((summary["rows"] for summary in summaries), default=0),
+                "statements": summaries,
+            }
+    if update or any(result["bootstrapped"] for result in report.values()):
+        save_baselines(baselines)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서비스 쿼리 실행 계획 회귀 검사")
+    parser.add_argument("--seed-companies", type=int, default=PLAN_SEED_COMPANIES,
+                        help="회사가 이 수보다 적으면 합성 데이터 적재")
+    parser.add_argument("--seed-tags", type=int, default=PLAN_SEED_TAGS)
+    parser.add_argument("--update", action="store_true", help="현재 계획으로 baseline 갱신")
+    parser.add_argument("--bootstrap", action="store_true", help="baseline 이 없는 케이스만 현재 계획으로 기록")
+    parser.add_argument("--only", nargs="*", help="실행할 케이스 이름")
+    parser.add_argument("--out", default=None, help="전체 보고서(JSON) 경로")
+    args = parser.parse_args()
+    with SessionLocal() as db:
+        seed(db, args.seed_companies, args.seed_tags)
+    report = run(args.update, args.only, bootstrap=args.bootstrap)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    failed = False
+    for name, result in report.items():
+        status = "FAIL" if result["errors"] or result["diff"] else "new" if result["bootstrapped"] else "ok"
+        failed = failed or status == "FAIL"
+        expectation = CASES[name]
+        print(f"[{status}] {name} (buffers {result['buffers']}/{expectation.get('max_buffers')}, "
+              f"rows {result['rows']}/{expectation.get('max_rows')})")
+        for error in result["errors"]:
+            print(f"    {error}")
+        for line in result["diff"]:
+            print(f"    {line}")
+    raise SystemExit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
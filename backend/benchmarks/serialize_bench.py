@@ -0,0 +1,112 @@
+"""
+목록 응답(/search, /tags) 직렬화의 행당 CPU 시간 벤치마크.
+
+DB 없이 SQLite 메모리 DB 의 결과 행(SQLAlchemy Row)을 만들어, 쿼리 이후 응답 bytes 가 나올 때까지의 단계만 잰다.
+  - before: 행마다 스키마 생성자 → response_model 검증 + dict 변환(fastapi serialize_response) → JSONResponse(json.dumps)
+  - fast: 목록 단위 변환(rows_to_models) → ModelListResponse (RESPONSE_VALIDATION_ENABLED=true 와 같음)
+  - fast_trusted: fast 에서 직렬화 전 검증 생략 (RESPONSE_VALIDATION_ENABLED=false)
+결과는 엔드포인트별 단계마다 행당 CPU 시간(µs, 반복 중앙값)과 before/fast 배율이다.
+
+    python -m backend.benchmarks.serialize_bench --rows 5000 --iterations 20 --out serialize_bench.json
+"""
+import argparse
+import asyncio
+import gc
+import json
+import time
+from typing import Callable, Dict, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from sqlalchemy import create_engine, text
+
+from backend import schemas
+from backend.benchmarks.stats import percentile
+from backend.routers.company import router
+from backend.utils.fast_json import ModelListResponse, rows_to_models
+
+# 엔드포인트별 (스키마, exclude_none, 행의 matched_tags 값)
+ENDPOINTS = {
+    "/search": (schemas.CompanyAutocompleteSchema, False, None),
+    "/tags": (schemas.TagSearchResponseSchema, True, None),
+    "/tags?mode=boolean": (schemas.TagSearchResponseSchema, True, 2),
+}
+
+
+def make_rows(count: int, matched_tags=None) -> List[object]:
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        return conn.execute(text(
+            "WITH RECURSIVE s(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM s WHERE i < :count) "
+            "SELECT i AS company_id, '벤치회사_' || i AS company_name, :matched_tags AS matched_tags FROM s"
+        ), {"count": count, "matched_tags": matched_tags}).all()
+
+
+def _response_field(path: str):
+    return next(r.response_field for r in router.routes if isinstance(r, APIRoute) and r.path == path)
+
+
+def build_stages(path: str, rows: List[object]) -> Dict[str, Callable[[], bytes]]:
+    schema, exclude_none, _ = ENDPOINTS[path]
+    field = _response_field(path.split("?")[0])
+    fields = list(schema.model_fields)
+
+    def before():
+        items = [schema(**{name: getattr(row, name) for name in fields}) for row in rows]
+        content = asyncio.run(serialize_response(field=field, response_content=items, exclude_none=exclude_none))
+        return JSONResponse(content).body
+
+    def fast():
+        return ModelListResponse(schema, rows_to_models(schema, rows), exclude_none, validate=True).body
+
+    def fast_trusted():
+        return ModelListResponse(schema, rows_to_models(schema, rows), exclude_none, validate=False).body
+
+    return {"before": before, "fast": fast, "fast_trusted": fast_trusted}
+
+
+def run(row_count: int, iterations: int, warmup: int = 2) -> Dict[str, Dict[str, float]]:
+    report = {}
+    for path, (_, _, matched_tags) in ENDPOINTS.items():
+        rows = make_rows(row_count, matched_tags)
+        stages = build_stages(path, rows)
+        bodies = {name: stage() for name, stage in stages.items()}
+        if len({json.dumps(json.loads(body), sort_keys=True) for body in bodies.values()}) != 1:
+            raise SystemExit(f"{path}: 단계별 응답 본문이 다릅니다")
+        result = {}
+        for name, stage in stages.items():
+            for _ in range(warmup):
+                stage()
+            # timeit 처럼 측정 중에는 GC 를 끄고, 반복별 CPU 시간의 중앙값으로 보고 (다른 프로세스 영향 완화)
+            samples = []
+            gc.disable()
+            try:
+                for _ in range(iterations):
+                    begin = time.process_time()
+                    stage()
+                    samples.append(time.process_time() - begin)
+            finally:
+                gc.enable()
+            result[f"{name}_cpu_us_per_row"] = round(percentile(sorted(samples), 50) / row_count * 1e6, 3)
+        result["speedup"] = round(result["before_cpu_us_per_row"] / max(result["fast_cpu_us_per_row"], 1e-9), 1)
+        report[path] = result
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 행당 CPU 시간 벤치마크")
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--out", default=None, help="결과 JSON 파일 경로 (기본: stdout)")
+    args = parser.parse_args()
+    report = run(args.rows, args.iterations, args.warmup)
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
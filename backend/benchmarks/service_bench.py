@@ -0,0 +1,121 @@
+"""
+CompanyService 메서드별 마이크로 벤치마크.
+
+HTTP/직렬화 없이 서비스 메서드만 반복 호출하여 p50/p95/p99 를 JSON 으로 출력한다.
+쓰기 메서드도 실행하므로 반드시 버릴 수 있는 로컬 DB 에서 돌린다.
+
+    python -m backend.benchmarks.service_bench --iterations 200 --out service_bench.json
+"""
+import argparse
+import json
+import random
+import time
+import uuid
+from typing import Callable, Dict, List
+
+from sqlalchemy.orm import Session
+
+from backend import models, schemas
+from backend.benchmarks.stats import summarize
+from backend.database import SessionLocal
+from backend.services.impl.company import CompanyService
+from backend.services.interfaces.company import CompanyServiceInterface
+from backend.utils.util import SUPPORTED_LANGUAGES
+
+SAMPLE_SIZE = 1000
+
+
+def _sample_names(db: Session, model, size: int) -> List[tuple]:
+    return [(row.language_code, row.name) for row in db.query(model.language_code, model.name).limit(size)]
+
+
+def _new_company_payload() -> schemas.CompanyCreateSchema:
+    suffix = uuid.uuid4().hex[:12]
+    return schemas.CompanyCreateSchema(
+        company_name=schemas.CompanyNameSchema(ko=f"벤치회사_{suffix}", en=f"Bench {suffix}"),
+        tags=[schemas.TagCreateSchema(tag_name=schemas.TagNameSchema(ko=f"벤치태그_{i}", en=f"bench_tag_{i}"))
+              for i in range(3)],
+    )
+
+
+def build_cases(db: Session, service: CompanyServiceInterface, rng: random.Random) -> Dict[str, Callable[[], object]]:
+    companies = _sample_names(db, models.CompanyName, SAMPLE_SIZE)
+    tags = _sample_names(db, models.TagName, SAMPLE_SIZE)
+    if not companies or not tags:
+        raise SystemExit("DB 가 비어 있습니다. generate + bulk_load_from_csv 로 먼저 데이터를 적재하세요.")
+
+    def prefix(name: str) -> str:
+        return name[:max(len(name) // 2, 1)]
+
+    def autocomplete():
+        lang, name = rng.choice(companies)
+        return service.autocomplete_company(db, prefix(name), lang)
+
+    def get_company():
+        lang, name = rng.choice(companies)
+        return service.get_company(db, name, rng.choice(SUPPORTED_LANGUAGES))
+
+    def search_by_tag():
+        lang, name = rng.choice(tags)
+        return service.search_by_tag_page(db, name, lang, limit=100)
+
+    def create_company():
+        return service.create_company(db, _new_company_payload(), "ko")
+
+    def add_and_delete_tag():
+        _, name = rng.choice(companies)
+        tag = schemas.TagCreateSchema(tag_name=schemas.TagNameSchema(ko="벤치태그_추가", en="bench_tag_added"))
+        service.add_tags_to_company(db, name, [tag], "ko")
+        return service.delete_tag_from_company(db, name, "벤치태그_추가", "ko")
+
+    return {
+        "autocomplete_company": autocomplete,
+        "get_company": get_company,
+        "search_by_tag_page": search_by_tag,
+        "create_company": create_company,
+        "add_tags_to_company+delete_tag_from_company": add_and_delete_tag,
+    }
+
+
+def run(service: CompanyServiceInterface, iterations: int, warmup: int = 10, seed: int = 0,
+        only: List[str] = None) -> Dict[str, Dict[str, float]]:
+    rng = random.Random(seed)
+    report = {}
+    with SessionLocal() as db:
+        cases = build_cases(db, service, rng)
+        for name, case in cases.items():
+            if only and name not in only:
+                continue
+            for _ in range(warmup):
+                case()
+                db.expire_all()
+            latencies = []
+            started = time.perf_counter()
+            for _ in range(iterations):
+                begin = time.perf_counter()
+                case()
+                latencies.append(time.perf_counter() - begin)
+                # identity map 재사용으로 쿼리가 생략되지 않도록 매 반복마다 비움
+                db.expire_all()
+            report[name] = summarize(latencies, time.perf_counter() - started)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CompanyService 메서드별 마이크로 벤치마크")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="*", help="실행할 케이스 이름")
+    parser.add_argument("--out", default=None, help="결과 JSON 파일 경로 (기본: stdout)")
+    args = parser.parse_args()
+    report = run(CompanyService(), args.iterations, args.warmup, args.seed, args.only)
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(output)
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,11 @@
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from backend.utils.pool_metrics import PoolMetrics, instrumented_pool_class
+from backend.utils.util import get_env_bool
 
 DB_USER = os.environ.get("POSTGRES_USER", "postgres")
 DB_PASSWORD = os.environ.get("POSTGRES_PASSWORD", "postgres")
@@ -8,15 +13,57 @@ DB_HOST = os.environ.get("POSTGRES_HOST", "localhost")
 DB_PORT = os.environ.get("POSTGRES_PORT", "5432")
 DB_NAME = os.environ.get("POSTGRES_DB", "company_db")
 
-SQLALCHEMY_DATABASE_URL = (
-    f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-)
+# 읽기 전용 엔드포인트(/search, /tags, GET /companies/{name})를 보낼 replica (미설정 시 primary 사용)
+DB_REPLICA_HOST = os.environ.get("POSTGRES_REPLICA_HOST")
+DB_REPLICA_PORT = os.environ.get("POSTGRES_REPLICA_PORT", DB_PORT)
+
+# 커넥션 풀 설정
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "-1"))
+DB_POOL_PRE_PING = get_env_bool("DB_POOL_PRE_PING")
+
+
+def _database_url(driver: str, host: str, port: str) -> str:
+    return f"postgresql+{driver}://{DB_USER}:{DB_PASSWORD}@{host}:{port}/{DB_NAME}"
+
+
+SQLALCHEMY_DATABASE_URL = _database_url("psycopg2", DB_HOST, DB_PORT)
+ASYNC_SQLALCHEMY_DATABASE_URL = _database_url("asyncpg", DB_HOST, DB_PORT)
+
+# true 이면 asyncpg + AsyncSession 기반 async 라우터로 요청을 처리
+ASYNC_DB_ENABLED = get_env_bool("ASYNC_DB_ENABLED")
+
+pool_metrics = {}
+
+
+def _pool_options(name: str, pool_class):
+    pool_metrics[name] = PoolMetrics(name)
+    return dict(
+        poolclass=instrumented_pool_class(pool_class, pool_metrics[name]),
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+
 
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL
+    SQLALCHEMY_DATABASE_URL,
+    **_pool_options("primary", QueuePool)
 )
+if DB_REPLICA_HOST:
+    read_engine = create_engine(
+        _database_url("psycopg2", DB_REPLICA_HOST, DB_REPLICA_PORT),
+        **_pool_options("replica", QueuePool)
+    )
+else:
+    read_engine = engine
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 
 def get_db():
@@ -24,4 +71,52 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    **_pool_options("async_primary", AsyncAdaptedQueuePool)
+)
+if DB_REPLICA_HOST:
+    async_read_engine = create_async_engine(
+        _database_url("asyncpg", DB_REPLICA_HOST, DB_REPLICA_PORT),
+        **_pool_options("async_replica", AsyncAdaptedQueuePool)
+    )
+else:
+    async_read_engine = async_engine
+
+AsyncSessionLocal = async_sessionmaker(autoflush=False, bind=async_engine)
+AsyncReadSessionLocal = async_sessionmaker(autoflush=False, bind=async_read_engine)
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db():
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+
+def get_pool_stats():
+    """엔진별 커넥션 풀 상태 (checkout 대기 시간, 사용 중 커넥션, overflow)"""
+    engines = {
+        "primary": engine,
+        "replica": read_engine,
+        "async_primary": async_engine.sync_engine,
+        "async_replica": async_read_engine.sync_engine,
+    }
+    return {
+        name: pool_metrics[name].snapshot(engines[name].pool)
+        for name in pool_metrics
+    }
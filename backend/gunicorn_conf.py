@@ -0,0 +1,48 @@
+"""
+운영용 gunicorn 설정 (uvicorn worker 여러 개 + preload).
+
+    python -m backend.migrate
+    gunicorn -c backend/gunicorn_conf.py backend.main:app
+
+preload_app 이면 master 가 앱을 한 번만 import 하고 (자동완성 인덱스도 master 에서 빌드) worker 를 fork 하므로
+worker 시작이 빠르고 읽기 전용 메모리를 공유한다. 각 worker 는 lifespan 에서 커넥션 풀/쿼리를 warmup 한다.
+나중에 다시 뜬 worker(max_requests, crash, timeout)는 부팅 때의 인덱스/스냅샷을 물려받으므로,
+PRELOAD_MAX_AGE_SECONDS 보다 오래되었으면 lifespan 에서 그 뒤 생성된 회사를 인덱스에 추가하고 스냅샷 재빌드를 예약한다.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:8080")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = os.environ.get("GUNICORN_PRELOAD", "true").lower() in ("1", "true", "yes", "on")
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", "5"))
+# 메모리 누수 대비 주기적 재시작 (0 이면 비활성), jitter 로 동시에 재시작하지 않도록 함
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = int(os.environ.get("GUNICORN_MAX_REQUESTS_JITTER", "0"))
+
+# worker 는 migrate 를 하지 않는다 (배포 시 python -m backend.migrate 로 한 번만)
+os.environ.setdefault("AUTO_MIGRATE", "false")
+
+
+def _engines():
+    from backend.database import async_engine, async_read_engine, engine, read_engine
+    return {engine, read_engine, async_engine.sync_engine, async_read_engine.sync_engine}
+
+
+def pre_fork(server, worker):
+    # 첫 fork 전에 master 에서 자동완성 인덱스/카탈로그 스냅샷을 한 번만 빌드해 worker 들이 copy-on-write 로 공유
+    if preload_app:
+        from backend.main import build_autocomplete_index, build_catalog_snapshot
+        build_autocomplete_index()
+        build_catalog_snapshot()
+        for e in _engines():
+            e.dispose()
+
+
+def post_fork(server, worker):
+    # master 에서 연 커넥션을 worker 가 공유하지 않도록 pool 을 새로 만든다 (부모 커넥션은 닫지 않음)
+    for e in _engines():
+        e.dispose(close=False)
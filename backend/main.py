@@ -1,24 +1,92 @@
+import os
+import time
 from contextlib import asynccontextmanager
+from datetime import datetime
 
 from fastapi import FastAPI
 
-from backend.database import engine
-from backend.models import Base
-from backend.routers import company
-from backend.services.impl.company import CompanyService
+from backend import migrate
+from backend.database import (
+    ASYNC_DB_ENABLED, SessionLocal, async_engine, async_read_engine, engine, read_engine
+)
+from backend.routers import async_company, company, monitoring
+from backend.services.impl.autocomplete_index import AUTOCOMPLETE_INDEX_ENABLED, autocomplete_index
+from backend.services.impl.catalog_snapshot import CATALOG_SNAPSHOT_ENABLED, catalog_snapshot
+from backend.services.factory import company_service, outbox_dispatcher
+from backend.utils import warmup
+from backend.utils.request_metrics import (
+    REQUEST_METRICS_ENABLED, RequestMetricsMiddleware, TimedJSONResponse, install_serialization_timer,
+    install_sql_hooks
+)
+from backend.utils.util import get_env_bool
+
+# 개발용 단일 프로세스 실행 시 시작할 때 migrate 를 자동 실행 (운영에서는 false 로 두고 `python -m backend.migrate`)
+AUTO_MIGRATE = get_env_bool("AUTO_MIGRATE", True)
+# fork 로 물려받은 자동완성 인덱스/카탈로그 스냅샷이 이보다 오래되었으면 worker 시작 시 따라잡는다
+# (gunicorn 이 나중에 다시 띄운 worker 는 master 가 부팅 때 만든 사본을 받으므로)
+PRELOAD_MAX_AGE_SECONDS = float(os.environ.get("PRELOAD_MAX_AGE_SECONDS", "30"))
+
+
+def build_autocomplete_index() -> None:
+    if not AUTOCOMPLETE_INDEX_ENABLED:
+        return
+    if not autocomplete_index.ready:
+        print("Building autocomplete index...")
+        with SessionLocal() as db:
+            autocomplete_index.build(db)
+    elif (datetime.utcnow() - autocomplete_index.built_at).total_seconds() > PRELOAD_MAX_AGE_SECONDS:
+        with SessionLocal() as db:
+            added = autocomplete_index.catch_up(db)
+        print(f"Autocomplete index caught up ({added} names)")
+
+
+def build_catalog_snapshot() -> None:
+    if not CATALOG_SNAPSHOT_ENABLED:
+        return
+    if not catalog_snapshot.ready:
+        print("Building catalog snapshot...")
+        catalog_snapshot.refresh()
+    elif time.time() - catalog_snapshot.snapshot.built_at > PRELOAD_MAX_AGE_SECONDS:
+        # 이전 스냅샷으로 응답하면서 재빌드 스레드가 바로 다시 빌드
+        catalog_snapshot.mark_dirty()
 
-company_service = CompanyService()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 애플리케이션 시작 시 실행
-    print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    if AUTO_MIGRATE:
+        print("Running migrations...")
+        migrate.run()
+    # gunicorn preload 시에는 master 에서 이미 빌드되어 fork 로 공유된다 (backend/gunicorn_conf.py).
+    # 오래된 사본이면 인덱스는 그 뒤 생성된 회사를 추가하고, 스냅샷은 재빌드를 예약한다
+    build_autocomplete_index()
+    build_catalog_snapshot()
+    if CATALOG_SNAPSHOT_ENABLED:
+        # 재빌드 스레드는 worker 마다 (fork 로 스레드는 복제되지 않음)
+        catalog_snapshot.start()
+    if outbox_dispatcher is not None:
+        outbox_dispatcher.start()
+    await warmup.run()
     yield
     # 애플리케이션 종료 시 실행
+    catalog_snapshot.stop()
+    if outbox_dispatcher is not None:
+        outbox_dispatcher.stop()
+    await async_engine.dispose()
+    await async_read_engine.dispose()
     print("Application shutdown")
 
 
-app = FastAPI(lifespan=lifespan)
+if REQUEST_METRICS_ENABLED:
+    install_sql_hooks(engine, read_engine, async_engine, async_read_engine)
+    install_serialization_timer()
+    app = FastAPI(lifespan=lifespan, default_response_class=TimedJSONResponse)
+    app.add_middleware(RequestMetricsMiddleware)
+else:
+    app = FastAPI(lifespan=lifespan)
 
-app.include_router(company.router)
\ No newline at end of file
+if ASYNC_DB_ENABLED:
+    app.include_router(async_company.router)
+else:
+    app.include_router(company.router)
+app.include_router(monitoring.router)
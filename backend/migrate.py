@@ -0,0 +1,85 @@
+"""
+스키마 생성/마이그레이션 명령. 서버 시작(lifespan)과 분리하여 배포 시 한 번만 실행한다.
+
+    python -m backend.migrate
+
+1. pg_trgm 확장과 models 의 테이블/인덱스를 create_all 로 만든다. (새 DB)
+2. migrations/*.sql 중 schema_migrations 에 기록되지 않은 파일을 이름 순서대로 적용한다. (기존 DB)
+3. read model 에 영향을 주는 파일을 적용했으면 company_read_models 를 다시 계산한다.
+   (SQL 파일은 LANGUAGE_FALLBACK_* 설정을 모르므로 read_model.py 의 계산식으로 덮어씀)
+여러 replica 가 동시에 실행해도 advisory lock 으로 한 번에 하나만 진행된다.
+"""
+import os
+from typing import List
+
+from sqlalchemy import text
+
+from backend.database import engine
+from backend.models import Base
+from backend.services.impl.name_cache import company_name_cache, tag_name_cache
+from backend.services.impl.read_model import read_model_params, rebuild_statement
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+# pg_advisory_lock 키 (임의의 고정값)
+MIGRATION_LOCK_KEY = 7_421_001
+# 적용 후 read model 을 다시 계산해야 하는 파일 (004: 언어 fallback 없는 백필, 008: 중복 태그 병합)
+READ_MODEL_REBUILD_MIGRATIONS = {"004_company_read_models.sql", "008_tag_names_unique.sql"}
+
+
+def _migration_files() -> List[str]:
+    return sorted(f for f in os.listdir(MIGRATIONS_DIR) if f.endswith(".sql"))
+
+
+def run() -> List[str]:
+    """적용한 마이그레이션 파일 목록을 반환"""
+    applied = []
+    with engine.connect() as conn:
+        # session 단위 lock 이므로 아래 트랜잭션들이 커밋되어도 unlock 전까지 유지된다
+        conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        conn.commit()
+        try:
+            with conn.begin():
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                conn.execute(text(
+                    "CREATE TABLE IF NOT EXISTS schema_migrations "
+                    "(version varchar(255) PRIMARY KEY, applied_at timestamp NOT NULL DEFAULT now())"
+                ))
+            Base.metadata.create_all(bind=conn)
+            conn.commit()
+
+            done = set(conn.execute(text("SELECT version FROM schema_migrations")).scalars())
+            conn.commit()
+            for filename in _migration_files():
+                if filename in done:
+                    continue
+                with open(os.path.join(MIGRATIONS_DIR, filename), encoding="utf-8") as f:
+                    sql = f.read()
+                with conn.begin():
+                    # 파일 내용을 그대로 실행 (% 를 파라미터 자리로 해석하지 않도록 no_parameters)
+                    conn.execution_options(no_parameters=True).exec_driver_sql(sql)
+                    conn.execute(text("INSERT INTO schema_migrations (version) VALUES (:version)"),
+                                 {"version": filename})
+                applied.append(filename)
+            if READ_MODEL_REBUILD_MIGRATIONS & set(applied):
+                with conn.begin():
+                    conn.execute(rebuild_statement, read_model_params())
+            if applied:
+                # 008 처럼 이름을 옮기거나 지우는 마이그레이션 후 같은 프로세스(AUTO_MIGRATE)의 이름 → id 캐시를 비운다
+                company_name_cache.clear()
+                tag_name_cache.clear()
+        finally:
+            conn.rollback()
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+            conn.commit()
+    return applied
+
+
+def main():
+    applied = run()
+    for filename in applied:
+        print(f"applied {filename}")
+    print(f"migrate 완료 ({len(applied)} applied)")
+
+
+if __name__ == "__main__":
+    main()
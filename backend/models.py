@@ -1,10 +1,33 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint, Table
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy import BigInteger, Column, Computed, Integer, String, DateTime, ForeignKey, Index, UniqueConstraint, Table
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import deferred, relationship, declarative_base
 from datetime import datetime
 
 NAME_LENGTH = 255
 LANGUAGE_CODE_LENGTH = 8
 
+# 언어별 full-text search 설정 (없는 언어는 simple)
+FTS_CONFIGS = {
+    "ko": "simple",
+    "en": "english",
+    "ja": "simple",
+    "tw": "simple",
+}
+DEFAULT_FTS_CONFIG = "simple"
+
+
+def fts_config_sql(language_column: str) -> str:
+    """language_code 컬럼 값에 따라 regconfig 를 고르는 SQL 식"""
+    whens = " ".join(
+        f"WHEN '{lang}' THEN '{config}'::regconfig" for lang, config in FTS_CONFIGS.items()
+    )
+    return f"CASE {language_column} {whens} ELSE '{DEFAULT_FTS_CONFIG}'::regconfig END"
+
+
+def _name_tsv_column():
+    """행의 언어 설정으로 만든 name 의 tsvector (generated column, 일반 조회 시에는 로딩하지 않음)"""
+    return deferred(Column(TSVECTOR, Computed(f"to_tsvector({fts_config_sql('language_code')}, name)", persisted=True)))
+
 Base = declarative_base()
 
 
@@ -14,8 +37,13 @@ class Company(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    names = relationship("CompanyName", back_populates="company", cascade="all, delete-orphan")
+    names = relationship("CompanyName", back_populates="company", cascade="all, delete-orphan",
+                         order_by="CompanyName.id")
     tags = relationship("CompanyTag", back_populates="company", cascade="all, delete-orphan")
+    __table_args__ = (
+        # export 의 updated_since 증분 조회용
+        Index('idx_companies_updated_at', 'updated_at'),
+    )
 
 
 class CompanyName(Base):
@@ -24,9 +52,18 @@ class CompanyName(Base):
     company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
     language_code = Column(String(LANGUAGE_CODE_LENGTH), nullable=False)
     name = Column(String(NAME_LENGTH), nullable=False)
+    name_tsv = _name_tsv_column()
 
     company = relationship("Company", back_populates="names")
-    __table_args__ = (UniqueConstraint('company_id', 'language_code', name='_company_lang_uc'),)
+    __table_args__ = (
+        UniqueConstraint('company_id', 'language_code', name='_company_lang_uc'),
+        Index('idx_company_names_name_tsv', 'name_tsv', postgresql_using='gin'),
+        # 이름 정확 일치 조회용 (회사 조회, 중복 체크)
+        Index('idx_company_names_name', 'name'),
+        # mode=fuzzy 자동완성(word_similarity, <%)용 trigram 인덱스
+        Index('idx_company_names_name_trgm', 'name', postgresql_using='gin',
+              postgresql_ops={'name': 'gin_trgm_ops'}),
+    )
 
 
 class Tag(Base):
@@ -35,7 +72,7 @@ class Tag(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
-    names = relationship("TagName", back_populates="tag", cascade="all, delete-orphan")
+    names = relationship("TagName", back_populates="tag", cascade="all, delete-orphan", order_by="TagName.id")
     companies = relationship("CompanyTag", back_populates="tag", cascade="all, delete-orphan")
 
 
@@ -45,9 +82,19 @@ class TagName(Base):
     tag_id = Column(Integer, ForeignKey("tags.id"), nullable=False)
     language_code = Column(String(LANGUAGE_CODE_LENGTH), nullable=False)
     name = Column(String(NAME_LENGTH), nullable=False)
+    name_tsv = _name_tsv_column()
 
     tag = relationship("Tag", back_populates="names")
-    __table_args__ = (UniqueConstraint('tag_id', 'language_code', name='_tag_lang_uc'),)
+    __table_args__ = (
+        UniqueConstraint('tag_id', 'language_code', name='_tag_lang_uc'),
+        # 언어별 태그명은 하나의 태그에만 속함 (동시 생성 시 INSERT ... ON CONFLICT 로 중복 태그 방지)
+        UniqueConstraint('language_code', 'name', name='_tag_lang_name_uc'),
+        Index('idx_tag_names_name_tsv', 'name_tsv', postgresql_using='gin'),
+        # 태그 부분 일치(LIKE '%q%') 검색용 trigram 인덱스 (pg_trgm 필요)
+        Index('idx_tag_names_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        # 이름 정확 일치 조회용 (trigram GIN 은 = 비교에 비효율적)
+        Index('idx_tag_names_name', 'name'),
+    )
 
 
 class CompanyTag(Base):
@@ -58,4 +105,61 @@ class CompanyTag(Base):
 
     company = relationship("Company", back_populates="tags")
     tag = relationship("Tag", back_populates="companies")
-    __table_args__ = (UniqueConstraint('company_id', 'tag_id', name='_company_tag_uc'),)
+    __table_args__ = (
+        UniqueConstraint('company_id', 'tag_id', name='_company_tag_uc'),
+        # 태그 → 회사 조회용 (company_id 순으로 index-only scan)
+        Index('idx_company_tags_tag_company', 'tag_id', 'company_id'),
+    )
+
+
+class TagCount(Base):
+    """
+    태그별 회사 수 카운터. company_tags 를 추가/삭제하는 쓰기 경로가 같은 트랜잭션에서 증감한다.
+    (services/impl/tag_counts.py, GET /tags/facets)
+    """
+    __tablename__ = "tag_counts"
+    tag_id = Column(Integer, ForeignKey("tags.id"), primary_key=True)
+    company_count = Column(Integer, nullable=False, server_default="0")
+    __table_args__ = (
+        # 회사 수 상위 N 개 facet 조회용 (역방향 스캔)
+        Index('idx_tag_counts_company_count', 'company_count', 'tag_id'),
+    )
+
+
+class CompanyReadModel(Base):
+    """
+    (회사, 언어) 별 조회 응답을 미리 계산해 둔 비정규화 테이블.
+    언어 fallback 이 적용된 회사명과 정렬된 태그명을 가지며, 쓰기 경로에서 갱신한다. (services/impl/read_model.py)
+    """
+    __tablename__ = "company_read_models"
+    company_id = Column(Integer, ForeignKey("companies.id"), primary_key=True)
+    language_code = Column(String(LANGUAGE_CODE_LENGTH), primary_key=True)
+    company_name = Column(String(NAME_LENGTH))
+    tags = Column(ARRAY(String(NAME_LENGTH)), nullable=False, server_default="{}")
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class OutboxEvent(Base):
+    """
+    쓰기 트랜잭션 안에서 함께 기록하는 변경 이벤트 (transactional outbox).
+    id 순서가 커밋 순서와 같도록 기록 시 advisory lock 으로 직렬화한다. (services/impl/outbox.py)
+    """
+    __tablename__ = "outbox_events"
+    id = Column(BigInteger, primary_key=True)
+    kind = Column(String(32), nullable=False)
+    company_id = Column(Integer, nullable=False)
+    tag_ids = Column(ARRAY(Integer), nullable=False, server_default="{}")
+    languages = Column(ARRAY(String(LANGUAGE_CODE_LENGTH)), nullable=False, server_default="{}")
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    __table_args__ = (
+        # 보존 기간이 지난 이벤트 정리용
+        Index('idx_outbox_events_created_at', 'created_at'),
+    )
+
+
+class OutboxOffset(Base):
+    """durable sink 별로 처리한 마지막 이벤트 id"""
+    __tablename__ = "outbox_offsets"
+    sink = Column(String(64), primary_key=True)
+    last_event_id = Column(BigInteger, nullable=False, server_default="0")
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
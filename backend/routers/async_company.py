@@ -0,0 +1,177 @@
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend import schemas
+from backend.database import AsyncReadSessionLocal, get_async_db, get_async_read_db
+from backend.services.factory import company_service as sync_company_service
+from backend.services.impl.async_company import AsyncCompanyService
+from backend.services.impl.export import aiter_export, async_export_watermark, to_utc_naive
+from backend.services.impl.singleflight import SINGLE_FLIGHT_ENABLED, SingleFlightAsyncCompanyService
+from backend.routers.company import (
+    BATCH_MAX_COMPANIES, LOOKUP_MAX_NAMES, TAG_FACET_DEFAULT_LIMIT, TAG_FACET_MAX_LIMIT, TAG_STREAM_PAGE_SIZE
+)
+from backend.utils.fast_json import list_response
+from backend.utils.tag_query import MAX_TAG_QUERY_TERMS, parse_tag_query
+from backend.utils.util import SUPPORTED_LANGUAGES, get_language
+
+router = APIRouter()
+
+company_service = (SingleFlightAsyncCompanyService if SINGLE_FLIGHT_ENABLED else AsyncCompanyService)(
+    sync_company_service)
+
+
+@router.get("/search", response_model=List[schemas.CompanyAutocompleteSchema])
+async def autocomplete_company(
+        query: str = Query(..., min_length=1),
+        limit: Optional[int] = Query(None, ge=1),
+        mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING,
+        db: AsyncSession = Depends(get_async_read_db),
+        lang: str = Depends(get_language)
+):
+    if mode == schemas.SearchMode.BOOLEAN:
+        raise HTTPException(status_code=400, detail="boolean mode is only supported for /tags")
+    return list_response(schemas.CompanyAutocompleteSchema,
+                         await company_service.autocomplete_company(db, query, lang, limit, mode))
+
+
+@router.get("/companies/{company_name}", response_model=schemas.CompanyResponseSchema)
+async def get_company(company_name: str, db: AsyncSession = Depends(get_async_read_db),
+                      lang: str = Depends(get_language)):
+    result = await company_service.get_company(db, company_name, lang)
+    if result is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Company not found")
+    return result
+
+
+@router.post("/companies", response_model=schemas.CompanyResponseSchema, status_code=status.HTTP_201_CREATED)
+async def create_company(company: schemas.CompanyCreateSchema, db: AsyncSession = Depends(get_async_db),
+                         lang: str = Depends(get_language)):
+    try:
+        result = await company_service.create_company(db, company, lang)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if result is None:
+        raise HTTPException(status_code=400, detail="Company already exists")
+    return result
+
+
+@router.post("/companies:batch", response_model=List[schemas.CompanyBatchResultSchema])
+async def create_companies(companies: List[schemas.CompanyCreateSchema], db: AsyncSession = Depends(get_async_db),
+                           lang: str = Depends(get_language)):
+    if len(companies) > BATCH_MAX_COMPANIES:
+        raise HTTPException(status_code=400, detail=f"too many companies (max {BATCH_MAX_COMPANIES})")
+    return await company_service.create_companies(db, companies, lang)
+
+
+@router.post("/companies:lookup", response_model=List[schemas.CompanyLookupResultSchema])
+async def lookup_companies(company_names: List[str], db: AsyncSession = Depends(get_async_read_db),
+                           lang: str = Depends(get_language)):
+    if len(company_names) > LOOKUP_MAX_NAMES:
+        raise HTTPException(status_code=400, detail=f"too many company names (max {LOOKUP_MAX_NAMES})")
+    return await company_service.lookup_companies(db, company_names, lang)
+
+
+async def _stream_tag_search(query: str, lang: str, mode: schemas.SearchMode):
+    """keyset 페이지를 차례로 조회하며 JSON 배열을 조각으로 내보냄 (전체 결과를 메모리에 올리지 않음)"""
+    page_size = TAG_STREAM_PAGE_SIZE if mode != schemas.SearchMode.FTS else None
+    # 응답 전송 중에도 조회가 이어지므로 요청 의존성과 별도로 세션을 연다
+    async with AsyncReadSessionLocal() as db:
+        yield "["
+        separator, cursor = "", None
+        while True:
+            page = await company_service.search_by_tag_page(db, query, lang, mode, page_size, cursor)
+            for item in page.items:
+                yield separator + item.model_dump_json(exclude_none=True)
+                separator = ","
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        yield "]"
+
+
+@router.get("/tags", response_model=List[schemas.TagSearchResponseSchema], response_model_exclude_none=True)
+async def search_by_tag(response: Response, query: str, mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING,
+                        limit: Optional[int] = Query(None, ge=1), cursor: Optional[int] = Query(None, ge=0),
+                        stream: bool = False, db: AsyncSession = Depends(get_async_read_db),
+                        lang: str = Depends(get_language)):
+    if mode == schemas.SearchMode.FUZZY:
+        raise HTTPException(status_code=400, detail="fuzzy mode is only supported for /search")
+    if cursor is not None and mode == schemas.SearchMode.FTS:
+        raise HTTPException(status_code=400, detail="cursor is not supported in fts mode")
+    if mode == schemas.SearchMode.BOOLEAN:
+        # 스트리밍 도중 실패하지 않도록 응답 전에 쿼리 식을 검증
+        try:
+            parse_tag_query(query)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    if stream:
+        return StreamingResponse(_stream_tag_search(query, lang, mode), media_type="application/json")
+    if limit is None and cursor is None:
+        items = await company_service.search_by_tag(db, query, lang, mode)
+        return list_response(schemas.TagSearchResponseSchema, items, exclude_none=True)
+    page = await company_service.search_by_tag_page(db, query, lang, mode, limit, cursor)
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(page.next_cursor)
+    return list_response(schemas.TagSearchResponseSchema, page.items, response, exclude_none=True)
+
+
+@router.get("/tags/facets", response_model=List[schemas.TagFacetSchema])
+async def tag_facets(prefix: Optional[str] = Query(None, min_length=1), tag: Optional[List[str]] = Query(None),
+                     limit: int = Query(TAG_FACET_DEFAULT_LIMIT, ge=1, le=TAG_FACET_MAX_LIMIT),
+                     db: AsyncSession = Depends(get_async_read_db), lang: str = Depends(get_language)):
+    """태그별 회사 수. prefix(회사명 prefix), tag(함께 가진 태그, 여러 번 지정 가능) 로 회사를 좁힐 수 있다"""
+    if tag and len(tag) > MAX_TAG_QUERY_TERMS:
+        raise HTTPException(status_code=400, detail=f"too many tags (max {MAX_TAG_QUERY_TERMS})")
+    return await company_service.tag_facets(db, lang, prefix, tag, limit)
+
+
+async def _stream_export(db: AsyncSession, lang: Optional[str], updated_since: Optional[datetime]):
+    try:
+        async for record in aiter_export(db, lang, updated_since):
+            yield record.model_dump_json() + "\n"
+    finally:
+        await db.close()
+
+
+@router.get("/export")
+async def export_companies(lang: Optional[str] = None, updated_since: Optional[datetime] = None):
+    """
+    전체 회사(모든 언어 이름 + 태그)를 NDJSON 으로 스트리밍.
+    lang 을 주면 해당 언어 이름이 있는 회사만, 그 언어 이름만 내보낸다.
+    X-Export-Watermark 헤더 값을 다음 요청의 updated_since 로 쓰면 변경분만 받을 수 있다.
+    """
+    if lang is not None and lang not in SUPPORTED_LANGUAGES:
+        raise HTTPException(status_code=400, detail="Unsupported language")
+    # 응답 전송이 끝날 때까지 server-side cursor 를 유지해야 하므로 요청 의존성과 별도로 세션을 연다
+    db = AsyncReadSessionLocal()
+    try:
+        watermark = await async_export_watermark(db)
+    except Exception:
+        await db.close()
+        raise
+    return StreamingResponse(
+        _stream_export(db, lang, to_utc_naive(updated_since)), media_type="application/x-ndjson",
+        headers={"X-Export-Watermark": watermark.isoformat()},
+    )
+
+
+@router.put("/companies/{company_name}/tags", response_model=schemas.CompanyResponseSchema)
+async def add_tags_to_company(company_name: str, tags: List[schemas.TagCreateSchema],
+                              db: AsyncSession = Depends(get_async_db), lang: str = Depends(get_language)):
+    result = await company_service.add_tags_to_company(db, company_name, tags, lang)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Company not found")
+    return result
+
+
+@router.delete("/companies/{company_name}/tags/{tag_name}", response_model=schemas.CompanyResponseSchema)
+async def delete_tag_from_company(company_name: str, tag_name: str, db: AsyncSession = Depends(get_async_db),
+                                  lang: str = Depends(get_language)):
+    result = await company_service.delete_tag_from_company(db, company_name, tag_name, lang)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Company or Tag not found")
+    return result
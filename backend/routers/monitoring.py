@@ -0,0 +1,62 @@
+from fastapi import APIRouter, Response, status
+from fastapi.responses import PlainTextResponse
+
+from backend.database import get_pool_stats
+from backend.services.factory import outbox_dispatcher, response_cache
+from backend.services.impl.catalog_snapshot import catalog_snapshot
+from backend.services.impl.name_cache import company_name_cache, tag_name_cache
+from backend.services.impl.singleflight import SINGLE_FLIGHT_ENABLED, async_single_flight, single_flight
+from backend.utils import warmup
+from backend.utils.request_metrics import render_metrics
+
+router = APIRouter()
+
+
+@router.get("/monitoring/pool")
+def pool_stats():
+    return get_pool_stats()
+
+
+@router.get("/monitoring/cache")
+def cache_stats():
+    if response_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **response_cache.stats()}
+
+
+@router.get("/monitoring/name-cache")
+def name_cache_stats():
+    return {"companies": company_name_cache.stats(), "tags": tag_name_cache.stats()}
+
+
+@router.get("/monitoring/snapshot")
+def snapshot_stats():
+    return catalog_snapshot.stats()
+
+
+@router.get("/monitoring/outbox")
+def outbox_stats():
+    """sink 별 offset/lag (lag 은 아직 전달되지 않은 이벤트 수)"""
+    if outbox_dispatcher is None:
+        return {"enabled": False}
+    return outbox_dispatcher.stats()
+
+
+@router.get("/monitoring/single-flight")
+def single_flight_stats():
+    """지금 실행 중인 leader 호출 수 (합쳐진 호출 수는 /metrics 의 single_flight_requests_total)"""
+    return {"enabled": SINGLE_FLIGHT_ENABLED, "sync": single_flight.stats(), "async": async_single_flight.stats()}
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Prometheus text exposition 포맷 (프로세스 단위)"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@router.get("/monitoring/ready")
+def ready(response: Response):
+    """warmup 이 끝난 worker 만 200 (로드밸런서 readiness probe 용)"""
+    if not warmup.state["ready"]:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return warmup.state
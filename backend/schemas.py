@@ -1,6 +1,14 @@
-from typing import List, Optional
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 
+class SearchMode(str, Enum):
+    SUBSTRING = "substring"
+    FTS = "fts"
+    FUZZY = "fuzzy"
+    BOOLEAN = "boolean"
+
 class TagNameSchema(BaseModel):
     ko: Optional[str] = None
     en: Optional[str] = None
@@ -28,4 +36,49 @@ class CompanyAutocompleteSchema(BaseModel):
     company_name: str
 
 class TagSearchResponseSchema(BaseModel):
-    company_name: str
\ No newline at end of file
+    company_name: str
+    # mode=boolean 에서 회사가 가진 쿼리 태그(NOT 제외) 수
+    matched_tags: Optional[int] = None
+
+class TagFacetSchema(BaseModel):
+    tag_name: str
+    company_count: int
+
+class BatchItemStatus(str, Enum):
+    CREATED = "created"
+    EXISTS = "exists"
+    DUPLICATE = "duplicate"
+    # 회사명이 하나도 없는 항목 (생성하지 않음)
+    INVALID = "invalid"
+
+class CompanyBatchResultSchema(BaseModel):
+    index: int
+    status: BatchItemStatus
+    company: Optional[CompanyResponseSchema] = None
+
+class CompanyLookupResultSchema(BaseModel):
+    # 요청한 회사명 (요청 순서대로 반환, 없는 회사는 company 가 None)
+    query: str
+    company: Optional[CompanyResponseSchema] = None
+
+class TagSearchPageSchema(BaseModel):
+    items: List[TagSearchResponseSchema]
+    next_cursor: Optional[int] = None
+
+class ChangeEventSchema(BaseModel):
+    id: int
+    kind: str
+    company_id: int
+    tag_ids: List[int]
+    languages: List[str]
+    created_at: datetime
+
+class ExportTagSchema(BaseModel):
+    id: int
+    names: Dict[str, str]
+
+class ExportCompanySchema(BaseModel):
+    id: int
+    names: Dict[str, str]
+    tags: List[ExportTagSchema]
+    updated_at: Optional[datetime] = None
@@ -0,0 +1,36 @@
+from backend.services.impl.cache import RESPONSE_CACHE_ENABLED, build_cache_backend
+from backend.services.impl.cached_company import CachedCompanyService
+from backend.services.impl.catalog_snapshot import CATALOG_SNAPSHOT_ENABLED, catalog_snapshot
+from backend.database import ASYNC_DB_ENABLED
+from backend.services.impl.company import CompanyService
+from backend.services.impl.instrumented_company import InstrumentedCompanyService
+from backend.services.impl.outbox import OUTBOX_ENABLED, OutboxDispatcher
+from backend.services.impl.outbox_sinks import build_sinks
+from backend.services.impl.singleflight import SINGLE_FLIGHT_ENABLED, SingleFlightCompanyService
+from backend.services.impl.snapshot_company import SnapshotCompanyService
+from backend.services.interfaces.company import CompanyServiceInterface
+from backend.utils.request_metrics import REQUEST_METRICS_ENABLED
+
+response_cache = build_cache_backend(ASYNC_DB_ENABLED) if RESPONSE_CACHE_ENABLED else None
+# 변경 이벤트를 sink 로 전달하는 dispatcher (lifespan 에서 worker 마다 시작)
+outbox_dispatcher = OutboxDispatcher(build_sinks(response_cache)) if OUTBOX_ENABLED else None
+
+
+def build_company_service() -> CompanyServiceInterface:
+    """설정에 따라 CompanyService 앞에 캐시 등의 계층을 씌워 반환"""
+    service = CompanyService()
+    if response_cache is not None:
+        service = CachedCompanyService(service, response_cache)
+    if CATALOG_SNAPSHOT_ENABLED:
+        # 스냅샷 응답은 캐시보다 싸므로 캐시 바깥에서 먼저 답한다
+        service = SnapshotCompanyService(service, catalog_snapshot)
+    if SINGLE_FLIGHT_ENABLED and not ASYNC_DB_ENABLED:
+        # async 경로는 run_sync 가 루프 스레드에서 돌아 threading 대기가 루프를 막으므로 라우터에서 따로 합친다
+        service = SingleFlightCompanyService(service)
+    if REQUEST_METRICS_ENABLED:
+        # 캐시 적중도 포함한 호출 단위 시간을 재도록 가장 바깥에 둔다
+        service = InstrumentedCompanyService(service)
+    return service
+
+
+company_service = build_company_service()
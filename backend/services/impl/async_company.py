@@ -0,0 +1,73 @@
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend import schemas
+from backend.services.impl.company import CompanyService
+from backend.services.interfaces.async_company import AsyncCompanyServiceInterface
+from backend.services.interfaces.company import CompanyServiceInterface
+
+
+class AsyncCompanyService(AsyncCompanyServiceInterface):
+    """
+    AsyncSession.run_sync 로 동기 서비스 로직을 그대로 실행한다.
+    쿼리 로직은 CompanyService 한 곳에만 두고, DB I/O 는 asyncpg 로 이벤트 루프에서 대기한다.
+    """
+
+    def __init__(self, service: Optional[CompanyServiceInterface] = None):
+        self.service = service or CompanyService()
+
+    async def autocomplete_company(
+            self, db: AsyncSession, query: str, lang: str, limit: Optional[int] = None,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
+    ) -> List[schemas.CompanyAutocompleteSchema]:
+        return await db.run_sync(self.service.autocomplete_company, query, lang, limit, mode)
+
+    async def get_company(
+            self, db: AsyncSession, company_name: str, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        return await db.run_sync(self.service.get_company, company_name, lang)
+
+    async def lookup_companies(
+            self, db: AsyncSession, company_names: List[str], lang: str
+    ) -> List[schemas.CompanyLookupResultSchema]:
+        return await db.run_sync(self.service.lookup_companies, company_names, lang)
+
+    async def create_company(
+            self, db: AsyncSession, company: schemas.CompanyCreateSchema, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        return await db.run_sync(self.service.create_company, company, lang)
+
+    async def create_companies(
+            self, db: AsyncSession, companies: List[schemas.CompanyCreateSchema], lang: str
+    ) -> List[schemas.CompanyBatchResultSchema]:
+        return await db.run_sync(self.service.create_companies, companies, lang)
+
+    async def search_by_tag(
+            self, db: AsyncSession, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
+    ) -> List[schemas.TagSearchResponseSchema]:
+        return await db.run_sync(self.service.search_by_tag, query, lang, mode)
+
+    async def search_by_tag_page(
+            self, db: AsyncSession, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING,
+            limit: Optional[int] = None, cursor: Optional[int] = None
+    ) -> schemas.TagSearchPageSchema:
+        return await db.run_sync(self.service.search_by_tag_page, query, lang, mode, limit, cursor)
+
+    async def tag_facets(
+            self, db: AsyncSession, lang: str, prefix: Optional[str] = None, tags: Optional[List[str]] = None,
+            limit: int = 50
+    ) -> List[schemas.TagFacetSchema]:
+        return await db.run_sync(self.service.tag_facets, lang, prefix, tags, limit)
+
+    async def add_tags_to_company(
+            self, db: AsyncSession, company_name: str, tags: List[schemas.TagCreateSchema], lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        return await db.run_sync(self.service.add_tags_to_company, company_name, tags, lang)
+
+    async def delete_tag_from_company(
+            self, db: AsyncSession, company_name: str, tag_name: str, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        return await db.run_sync(self.service.delete_tag_from_company, company_name, tag_name, lang)
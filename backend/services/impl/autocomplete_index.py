@@ -0,0 +1,167 @@
+import heapq
+import threading
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend import models, schemas
+from backend.utils.util import get_env_bool
+
+AUTOCOMPLETE_INDEX_ENABLED = get_env_bool("AUTOCOMPLETE_INDEX_ENABLED")
+
+# catch_up 시 빌드 시각보다 이만큼 앞서 만들어진 회사도 다시 확인 (빌드 중 커밋된 트랜잭션 대비, 중복 추가는 무시됨)
+CATCH_UP_MARGIN = timedelta(minutes=1)
+
+# 1글자 쿼리는 unigram, 2글자 이상은 bigram posting 교집합으로 후보를 좁힌다.
+GRAM_SIZE = 2
+
+
+def _ngrams(text: str) -> Set[str]:
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+def _grams(text: str) -> Set[str]:
+    """인덱싱용 gram: unigram + bigram"""
+    return set(text) | _ngrams(text)
+
+
+def _query_grams(query: str) -> Set[str]:
+    """검색용 gram: 쿼리 길이가 GRAM_SIZE 미만이면 unigram, 아니면 bigram"""
+    return set(query) if len(query) < GRAM_SIZE else _ngrams(query)
+
+
+class _LanguageIndex:
+    """한 언어의 회사명 인덱스 (prefix 용 정렬 배열 + infix 용 n-gram posting)"""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.lowered: List[str] = []
+        self.entry_keys: Set[Tuple[int, str]] = set()
+        self.sorted_keys: List[Tuple[str, int]] = []
+        self.postings: Dict[str, Set[int]] = {}
+
+    def add(self, company_id: int, name: str, keep_sorted: bool = True) -> None:
+        if (company_id, name) in self.entry_keys:
+            return
+        self.entry_keys.add((company_id, name))
+        entry_id = len(self.names)
+        lowered = name.lower()
+        self.names.append(name)
+        self.lowered.append(lowered)
+        if keep_sorted:
+            insort(self.sorted_keys, (lowered, entry_id))
+        else:
+            self.sorted_keys.append((lowered, entry_id))
+        for gram in _grams(lowered):
+            self.postings.setdefault(gram, set()).add(entry_id)
+
+    def search(self, query: str, limit: Optional[int]) -> List[str]:
+        q = query.lower()
+        prefix_ids = []
+        pos = bisect_left(self.sorted_keys, (q, -1))
+        while pos < len(self.sorted_keys) and self.sorted_keys[pos][0].startswith(q):
+            prefix_ids.append(self.sorted_keys[pos][1])
+            pos += 1
+
+        candidates = None
+        # 가장 짧은 posting 부터 교집합
+        for gram in sorted(_query_grams(q), key=lambda g: len(self.postings.get(g, ()))):
+            posting = self.postings.get(gram)
+            if not posting:
+                candidates = set()
+                break
+            candidates = set(posting) if candidates is None else candidates & posting
+        prefix_set = set(prefix_ids)
+        infix_ids = [
+            i for i in (candidates or ())
+            if i not in prefix_set and q in self.lowered[i]
+        ]
+
+        # 순위: prefix 일치 > infix 일치, 같은 그룹 내에서는 짧은 이름 우선
+        ranked = [(0, len(self.names[i]), self.names[i], i) for i in prefix_ids]
+        ranked += [(1, len(self.names[i]), self.names[i], i) for i in infix_ids]
+        if limit is not None:
+            ranked = heapq.nsmallest(limit, ranked)
+        else:
+            ranked.sort()
+        return [self.names[r[3]] for r in ranked]
+
+
+class AutocompleteIndex:
+    """
+    회사명 자동완성을 위한 인메모리 인덱스.
+    시작 시 company_names 전체로 빌드하고, 회사 생성 시 증분 갱신한다.
+    다른 프로세스에서 만든 인덱스를 물려받은 경우(gunicorn preload 후 재시작된 worker)는 catch_up 으로 그 뒤 생성된 회사를 반영한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._languages: Dict[str, _LanguageIndex] = {}
+        self.ready = False
+        # 마지막 빌드/catch_up 시작 시각 (UTC, companies.created_at 과 비교)
+        self.built_at: Optional[datetime] = None
+
+    def build_from_rows(self, rows: Iterable[Tuple[int, str, str]]) -> None:
+        """(company_id, language_code, name) 목록으로 인덱스를 새로 만들어 교체"""
+        languages: Dict[str, _LanguageIndex] = {}
+        for company_id, language_code, name in rows:
+            languages.setdefault(language_code, _LanguageIndex()).add(company_id, name, keep_sorted=False)
+        for index in languages.values():
+            index.sorted_keys.sort()
+        with self._lock:
+            self._languages = languages
+            self.ready = True
+
+    def build(self, db: Session) -> None:
+        started = datetime.utcnow()
+        rows = db.query(
+            models.CompanyName.company_id,
+            models.CompanyName.language_code,
+            models.CompanyName.name
+        ).yield_per(10000)
+        self.build_from_rows(rows)
+        self.built_at = started
+
+    def add_rows(self, rows: Iterable[Tuple[int, str, str]]) -> int:
+        """(company_id, language_code, name) 목록을 인덱스에 추가하고 처리한 행 수를 반환"""
+        count = 0
+        with self._lock:
+            for company_id, language_code, name in rows:
+                self._languages.setdefault(language_code, _LanguageIndex()).add(company_id, name)
+                count += 1
+        return count
+
+    def catch_up(self, db: Session) -> int:
+        """마지막 빌드/catch_up 이후 생성된 회사의 이름을 추가 (회사명은 생성 때만 추가되므로 created_at 으로 충분)"""
+        if not self.ready or self.built_at is None:
+            return 0
+        started = datetime.utcnow()
+        rows = db.query(
+            models.CompanyName.company_id,
+            models.CompanyName.language_code,
+            models.CompanyName.name
+        ).join(models.Company, models.Company.id == models.CompanyName.company_id).filter(
+            models.Company.created_at >= self.built_at - CATCH_UP_MARGIN
+        ).yield_per(10000)
+        count = self.add_rows(rows)
+        self.built_at = started
+        return count
+
+    def add_company_names(self, company_id: int, names: Dict[str, str]) -> None:
+        """새로 커밋된 회사명({언어: 이름})을 인덱스에 반영"""
+        if not self.ready:
+            return
+        self.add_rows((company_id, language_code, name) for language_code, name in names.items() if name)
+
+    def search(
+            self, query: str, lang: str, limit: Optional[int] = None
+    ) -> List[schemas.CompanyAutocompleteSchema]:
+        with self._lock:
+            index = self._languages.get(lang)
+            names = index.search(query, limit) if index else []
+        return [schemas.CompanyAutocompleteSchema(company_name=name) for name in names]
+
+
+autocomplete_index = AutocompleteIndex()
@@ -0,0 +1,176 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set
+
+from backend.services.interfaces.cache import CacheBackendInterface
+from backend.utils.util import get_env_bool
+
+RESPONSE_CACHE_ENABLED = get_env_bool("RESPONSE_CACHE_ENABLED")
+# memory | redis
+RESPONSE_CACHE_BACKEND = os.environ.get("RESPONSE_CACHE_BACKEND", "memory")
+RESPONSE_CACHE_TTL = float(os.environ.get("RESPONSE_CACHE_TTL", "60"))
+RESPONSE_CACHE_MAX_SIZE = int(os.environ.get("RESPONSE_CACHE_MAX_SIZE", "10000"))
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+
+
+class CacheStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "sets": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += amount
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.counters)
+
+
+class LRUCacheBackend(CacheBackendInterface):
+    """프로세스 내 LRU 캐시 (TTL + 최대 항목 수). 항목은 (만료 시각, 값, deps)"""
+
+    def __init__(self, max_size: int = RESPONSE_CACHE_MAX_SIZE, ttl: float = RESPONSE_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[str, tuple]" = OrderedDict()
+        # dep → 그 dep 에 의존하는 키 (항목이 빠질 때 함께 정리)
+        self._deps: Dict[str, Set[str]] = {}
+        self._stats = CacheStats()
+
+    def _pop(self, key: str) -> Optional[tuple]:
+        """lock 안에서 호출"""
+        item = self._items.pop(key, None)
+        if item is not None:
+            for dep in item[2]:
+                keys = self._deps.get(dep)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._deps[dep]
+        return item
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None and item[0] <= time.monotonic():
+                self._pop(key)
+                self._stats.incr("expirations")
+                item = None
+            if item is None:
+                self._stats.incr("misses")
+                return None
+            self._items.move_to_end(key)
+            self._stats.incr("hits")
+            return item[1]
+
+    def set(self, key: str, value: str, deps: Iterable[str] = ()) -> None:
+        deps = tuple(deps)
+        with self._lock:
+            self._pop(key)
+            self._items[key] = (time.monotonic() + self.ttl, value, deps)
+            for dep in deps:
+                self._deps.setdefault(dep, set()).add(key)
+            self._stats.incr("sets")
+            while len(self._items) > self.max_size:
+                self._pop(next(iter(self._items)))
+                self._stats.incr("evictions")
+
+    def delete(self, keys: Iterable[str]) -> int:
+        with self._lock:
+            deleted = sum(1 for key in keys if self._pop(key) is not None)
+        self._stats.incr("invalidations", deleted)
+        return deleted
+
+    def invalidate(self, deps: Iterable[str]) -> int:
+        with self._lock:
+            keys = {key for dep in deps for key in self._deps.get(dep, ())}
+            deleted = sum(1 for key in keys if self._pop(key) is not None)
+        self._stats.incr("invalidations", deleted)
+        return deleted
+
+    def keys(self, prefix: str) -> List[str]:
+        with self._lock:
+            return [key for key in self._items if key.startswith(prefix)]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            size = len(self._items)
+        return {**self._stats.snapshot(), "size": size, "max_size": self.max_size}
+
+
+class RedisCacheBackend(CacheBackendInterface):
+    """
+    Redis 호환 캐시. client 는 get/set(ex=)/delete/scan_iter/sadd/expire/sunion/pipeline 을 지원하면 되므로
+    테스트에서는 로컬 fake 로 교체할 수 있다.
+    deps 는 DEP_PREFIX + dep 이름의 set 에 키를 담아 두고 (TTL 은 마지막 set 기준), invalidate 는 그 set 만 읽는다.
+    """
+    DEP_PREFIX = "cache-dep:"
+
+    def __init__(self, client=None, ttl: float = RESPONSE_CACHE_TTL, url: str = REDIS_URL):
+        if client is None:
+            import redis  # 선택 의존성: redis 백엔드를 쓸 때만 필요
+            client = redis.Redis.from_url(url, decode_responses=True)
+        self.client = client
+        self.ttl = ttl
+        self._stats = CacheStats()
+
+    @staticmethod
+    def _decode(value):
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(key)
+        self._stats.incr("hits" if value is not None else "misses")
+        return self._decode(value)
+
+    def set(self, key: str, value: str, deps: Iterable[str] = ()) -> None:
+        ex = max(int(self.ttl), 1)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.set(key, value, ex=ex)
+        for dep in deps:
+            pipe.sadd(self.DEP_PREFIX + dep, key)
+            pipe.expire(self.DEP_PREFIX + dep, ex)
+        pipe.execute()
+        self._stats.incr("sets")
+
+    def delete(self, keys: Iterable[str]) -> int:
+        keys = list(keys)
+        deleted = self.client.delete(*keys) if keys else 0
+        self._stats.incr("invalidations", deleted)
+        return deleted
+
+    def invalidate(self, deps: Iterable[str]) -> int:
+        dep_keys = [self.DEP_PREFIX + dep for dep in set(deps)]
+        if not dep_keys:
+            return 0
+        # 읽기와 삭제를 한 트랜잭션으로 하여 그 사이에 등록된 키를 잃지 않는다
+        pipe = self.client.pipeline()
+        pipe.sunion(*dep_keys)
+        pipe.delete(*dep_keys)
+        keys, _ = pipe.execute()
+        return self.delete(self._decode(key) for key in keys)
+
+    def keys(self, prefix: str) -> List[str]:
+        return [self._decode(key) for key in self.client.scan_iter(match=f"{prefix}*")]
+
+    def stats(self) -> Dict[str, int]:
+        stats = self._stats.snapshot()
+        # eviction 은 Redis 서버가 하므로 서버 통계를 사용
+        info = getattr(self.client, "info", None)
+        if info is not None:
+            stats["evictions"] = int(info("stats").get("evicted_keys", 0))
+        return stats
+
+
+def build_cache_backend(async_db: bool = False) -> CacheBackendInterface:
+    if RESPONSE_CACHE_BACKEND == "redis":
+        if async_db:
+            # async 라우터는 sync 서비스 계층을 run_sync 로 이벤트 루프 스레드에서 실행하므로
+            # 동기 Redis 호출이 루프를 막아 다른 모든 요청이 멈춘다
+            raise ValueError("RESPONSE_CACHE_BACKEND=redis is not supported with ASYNC_DB_ENABLED")
+        return RedisCacheBackend()
+    return LRUCacheBackend()
@@ -0,0 +1,177 @@
+from typing import Iterable, List, Optional, Set, Tuple
+
+from pydantic import TypeAdapter
+from sqlalchemy.orm import Session
+
+from backend import models, schemas
+from backend.services.impl.proxy import CompanyServiceProxy
+from backend.services.interfaces.cache import CacheBackendInterface
+from backend.services.interfaces.company import CompanyServiceInterface
+
+KEY_PREFIX = "resp"
+COMPANY = "company"
+SEARCH = "search"
+TAGS = "tags"
+
+_company_adapter = TypeAdapter(Optional[schemas.CompanyResponseSchema])
+_autocomplete_adapter = TypeAdapter(List[schemas.CompanyAutocompleteSchema])
+_tag_search_adapter = TypeAdapter(List[schemas.TagSearchResponseSchema])
+_tag_page_adapter = TypeAdapter(schemas.TagSearchPageSchema)
+
+
+def _prefix(kind: str, lang: Optional[str] = None) -> str:
+    return f"{KEY_PREFIX}:{kind}:" if lang is None else f"{KEY_PREFIX}:{kind}:{lang}:"
+
+
+def _substrings(text: str) -> Set[str]:
+    """비어 있지 않은 모든 부분 문자열 (이름 길이의 제곱에 비례하며 캐시 크기와는 무관)"""
+    return {text[i:j] for i in range(len(text)) for j in range(i + 1, len(text) + 1)}
+
+
+class CachedCompanyService(CompanyServiceProxy):
+    """
+    읽기 메서드(get_company, autocomplete_company, search_by_tag[_page]) 응답을 캐시하는 서비스.
+    키는 (메서드, x-wanted-language, 쿼리) 이며, 쓰기 메서드가 커밋된 뒤 영향받는 키만 무효화한다.
+      - company: 변경된 회사의 모든 언어 이름으로 조회한 키
+      - search: 새 회사명(같은 언어)에 쿼리가 부분 일치하는 키
+      - tags: 추가/삭제된 태그의 이름(모든 언어)에 쿼리가 부분 일치하는 키
+    부분 일치로 판단할 수 없는 fts 모드 키는 해당 언어/종류 전체를 무효화한다.
+    캐시 키를 훑지 않도록 값마다 의존 이름(조회한 회사명, 쿼리)을 deps 로 저장하고,
+    무효화는 바뀐 이름의 부분 문자열에 해당하는 deps 만 조회한다.
+    """
+
+    def __init__(self, service: CompanyServiceInterface, cache: CacheBackendInterface):
+        super().__init__(service)
+        self.cache = cache
+
+    def _cached(self, key: str, adapter: TypeAdapter, compute, deps: List[str]):
+        cached = self.cache.get(key)
+        if cached is not None:
+            return adapter.validate_json(cached)
+        result = compute()
+        self.cache.set(key, adapter.dump_json(result).decode("utf-8"), deps)
+        return result
+
+    # 읽기
+
+    def autocomplete_company(
+            self, db: Session, query: str, lang: str, limit: Optional[int] = None,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
+    ) -> List[schemas.CompanyAutocompleteSchema]:
+        key = f"{_prefix(SEARCH, lang)}{mode.value}:{limit or ''}:{query}"
+        deps = [f"{SEARCH}:{lang}:{query.lower()}" if mode == schemas.SearchMode.SUBSTRING else f"{SEARCH}:{lang}"]
+        return self._cached(key, _autocomplete_adapter,
+                            lambda: self.service.autocomplete_company(db, query, lang, limit, mode), deps)
+
+    def get_company(
+            self, db: Session, company_name: str, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        key = f"{_prefix(COMPANY, lang)}{company_name}"
+        return self._cached(key, _company_adapter,
+                            lambda: self.service.get_company(db, company_name, lang), [f"{COMPANY}:{company_name}"])
+
+    def search_by_tag(
+            self, db: Session, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
+    ) -> List[schemas.TagSearchResponseSchema]:
+        key = f"{_prefix(TAGS, lang)}{mode.value}:::{query}"
+        return self._cached(key, _tag_search_adapter,
+                            lambda: self.service.search_by_tag(db, query, lang, mode), _tag_deps(query, mode))
+
+    def search_by_tag_page(
+            self, db: Session, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING,
+            limit: Optional[int] = None, cursor: Optional[int] = None
+    ) -> schemas.TagSearchPageSchema:
+        key = f"{_prefix(TAGS, lang)}{mode.value}:{limit or ''}:{'' if cursor is None else cursor}:{query}"
+        return self._cached(key, _tag_page_adapter,
+                            lambda: self.service.search_by_tag_page(db, query, lang, mode, limit, cursor),
+                            _tag_deps(query, mode))
+
+    # 쓰기
+
+    def create_company(
+            self, db: Session, company: schemas.CompanyCreateSchema, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        result = self.service.create_company(db, company, lang)
+        if result is not None:
+            names = [n for n in company.company_name.dict().values() if n]
+            self.invalidate(self._company_names(db, names[0]), self._tag_names(db, _payload_tag_names(company.tags)))
+        return result
+
+    def create_companies(
+            self, db: Session, companies: List[schemas.CompanyCreateSchema], lang: str
+    ) -> List[schemas.CompanyBatchResultSchema]:
+        results = self.service.create_companies(db, companies, lang)
+        company_names, tags = set(), []
+        for result in results:
+            if result.status == schemas.BatchItemStatus.CREATED:
+                company = companies[result.index]
+                names = [n for n in company.company_name.dict().values() if n]
+                company_names.update(self._company_names(db, names[0]))
+                tags.extend(company.tags or [])
+        if company_names:
+            self.invalidate(company_names, self._tag_names(db, _payload_tag_names(tags)))
+        return results
+
+    def add_tags_to_company(
+            self, db: Session, company_name: str, tags: List[schemas.TagCreateSchema], lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        result = self.service.add_tags_to_company(db, company_name, tags, lang)
+        if result is not None:
+            self.invalidate(self._company_names(db, company_name), self._tag_names(db, _payload_tag_names(tags)),
+                            new_company=False)
+        return result
+
+    def delete_tag_from_company(
+            self, db: Session, company_name: str, tag_name: str, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        result = self.service.delete_tag_from_company(db, company_name, tag_name, lang)
+        if result is not None:
+            self.invalidate(self._company_names(db, company_name), self._tag_names(db, [tag_name]),
+                            new_company=False)
+        return result
+
+    # 무효화
+
+    def _company_names(self, db: Session, company_name: str) -> Set[Tuple[str, str]]:
+        """company_name 을 가진 회사의 (언어, 이름) 전체"""
+        company_ids = db.query(models.CompanyName.company_id).filter(models.CompanyName.name == company_name)
+        return set(db.query(models.CompanyName.language_code, models.CompanyName.name).filter(
+            models.CompanyName.company_id.in_(company_ids.scalar_subquery())
+        ))
+
+    def _tag_names(self, db: Session, tag_names: Iterable[str]) -> Set[str]:
+        """tag_names 중 하나라도 가진 태그들의 모든 언어 이름"""
+        tag_names = list(tag_names)
+        if not tag_names:
+            return set()
+        tag_ids = db.query(models.TagName.tag_id).filter(models.TagName.name.in_(tag_names))
+        return {row.name for row in db.query(models.TagName.name).filter(
+            models.TagName.tag_id.in_(tag_ids.scalar_subquery())
+        )}
+
+    def invalidate(self, company_names: Iterable[Tuple[str, str]], tag_names: Iterable[str],
+                   new_company: bool = True) -> int:
+        company_names = set(company_names)
+        tag_names = set(tag_names)
+        deps = {f"{COMPANY}:{name}" for _, name in company_names}
+        if new_company:
+            # 회사명이 새로 생긴 경우에만 자동완성 결과가 바뀐다
+            for lang, name in company_names:
+                deps.add(f"{SEARCH}:{lang}")
+                deps.update(f"{SEARCH}:{lang}:{part}" for part in _substrings(name.lower()))
+        if tag_names:
+            deps.add(TAGS)
+            for name in tag_names:
+                deps.update(f"{TAGS}:{part}" for part in _substrings(name))
+        return self.cache.invalidate(deps)
+
+
+def _tag_deps(query: str, mode: schemas.SearchMode) -> List[str]:
+    # 태그 검색 결과는 요청 언어와 무관하게 모든 언어의 태그명에 영향받는다
+    return [f"{TAGS}:{query}" if mode == schemas.SearchMode.SUBSTRING else TAGS]
+
+
+def _payload_tag_names(tags: Optional[List[schemas.TagCreateSchema]]) -> List[str]:
+    return [n for tag in tags or [] for n in tag.tag_name.dict().values() if n]
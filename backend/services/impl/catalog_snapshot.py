@@ -0,0 +1,353 @@
+"""
+회사/태그 카탈로그 전체의 불변(immutable) 인메모리 스냅샷.
+
+ORM 객체 대신 정수 배열과 문자열 테이블로만 저장한다.
+  - 회사/태그는 id 오름차순의 dense index(0..N-1)로 표현하고 id 는 array('I') 에 둔다.
+  - 이름은 중복 제거(intern)된 문자열 테이블 하나에 두고, 언어별로 array('i') 문자열 번호를 둔다. (-1 = 없음)
+    get_localized_name 과 같게 언어 우선순위(language_priority) 순으로 찾고, 없으면 가장 먼저 등록된 이름(fallback)을 쓴다.
+  - 회사 → 태그, 태그 → 회사 관계는 CSR(offsets + members) 배열이며, 태그 → 회사 posting 은 회사 index
+    (= company_id) 오름차순이라 교집합/합집합을 정렬 병합으로 계산한다.
+  - 이름 → 회사 조회는 정렬된 이름 목록 + bisect.
+스냅샷은 만들어진 뒤 바뀌지 않고, 갱신 시에는 새로 빌드해 참조만 교체한다. (CatalogSnapshotHolder)
+"""
+import heapq
+import os
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy.orm import Session
+
+from backend import models, schemas
+from backend.utils.tag_query import TagQueryGroup
+from backend.utils.util import SUPPORTED_LANGUAGES, get_env_bool, language_priority
+
+CATALOG_SNAPSHOT_ENABLED = get_env_bool("CATALOG_SNAPSHOT_ENABLED")
+# 주기적 재빌드 간격(초). 쓰기가 있으면 간격과 무관하게 다음 재빌드를 앞당긴다
+CATALOG_SNAPSHOT_REFRESH_SECONDS = float(os.environ.get("CATALOG_SNAPSHOT_REFRESH_SECONDS", "300"))
+# 쓰기 직후 재빌드 전 최소 대기(초). 연속된 쓰기를 한 번의 재빌드로 묶는다
+CATALOG_SNAPSHOT_DEBOUNCE_SECONDS = float(os.environ.get("CATALOG_SNAPSHOT_DEBOUNCE_SECONDS", "1"))
+
+NameRow = Tuple[int, str, str]
+
+
+def _csr(pairs: List[Tuple[int, int]], size: int) -> Tuple[array, array]:
+    """(row, member) 쌍을 row 별 정렬된 members 의 CSR 배열로 변환"""
+    pairs.sort()
+    offsets = array("I", [0]) * (size + 1)
+    members = array("I")
+    previous = None
+    for row, member in pairs:
+        if (row, member) == previous:
+            continue
+        previous = (row, member)
+        offsets[row + 1] += 1
+        members.append(member)
+    for i in range(size):
+        offsets[i + 1] += offsets[i]
+    return offsets, members
+
+
+class _NameTable:
+    """한 종류(회사 또는 태그)의 언어별 이름 번호 배열 + fallback"""
+
+    def __init__(self, size: int):
+        self.by_language = {lang: array("i", [-1]) * size for lang in SUPPORTED_LANGUAGES}
+        self.fallback = array("i", [-1]) * size
+
+    def localized(self, strings: List[str], index: int, lang: str) -> Optional[str]:
+        for l in language_priority(lang):
+            by_language = self.by_language.get(l)
+            if by_language is not None and by_language[index] >= 0:
+                return strings[by_language[index]]
+        string_id = self.fallback[index]
+        return strings[string_id] if string_id >= 0 else None
+
+
+class CatalogSnapshot:
+    def __init__(self, company_ids: Sequence[int], tag_ids: Sequence[int],
+                 company_names: Iterable[NameRow], tag_names: Iterable[NameRow],
+                 company_tags: Iterable[Tuple[int, int]]):
+        """
+        company_names / tag_names: (소유 id, 언어, 이름) — 이름 행 id 순 (fallback/중복 이름 우선순위 결정)
+        company_tags: (company_id, tag_id)
+        """
+        self.company_ids = array("I", sorted(company_ids))
+        self.tag_ids = array("I", sorted(tag_ids))
+        self.strings: List[str] = []
+        string_ids: Dict[str, int] = {}
+
+        def intern(name: str) -> int:
+            string_id = string_ids.get(name)
+            if string_id is None:
+                string_id = string_ids[name] = len(self.strings)
+                self.strings.append(sys.intern(name))
+            return string_id
+
+        self.company_names = _NameTable(len(self.company_ids))
+        company_lookup: Dict[str, int] = {}
+        for company_id, lang, name in company_names:
+            index = self._company_index(company_id)
+            if index is None:
+                continue
+            string_id = intern(name)
+            if lang in self.company_names.by_language and self.company_names.by_language[lang][index] < 0:
+                self.company_names.by_language[lang][index] = string_id
+            if self.company_names.fallback[index] < 0:
+                self.company_names.fallback[index] = string_id
+            # 같은 이름의 회사가 여럿이면 먼저 등록된 이름의 회사 (DB 조회와 동일)
+            company_lookup.setdefault(name, index)
+        self._lookup_names = sorted(company_lookup)
+        self._lookup_companies = array("I", (company_lookup[name] for name in self._lookup_names))
+
+        self.tag_names = _NameTable(len(self.tag_ids))
+        # 태그 부분 일치 검색용 (태그 index, 이름) 목록. 이름 행 순서대로
+        self._tag_name_entries: List[Tuple[int, str]] = []
+        tag_lookup: Dict[str, int] = {}
+        for tag_id, lang, name in tag_names:
+            index = self._tag_index(tag_id)
+            if index is None:
+                continue
+            string_id = intern(name)
+            if lang in self.tag_names.by_language and self.tag_names.by_language[lang][index] < 0:
+                self.tag_names.by_language[lang][index] = string_id
+            if self.tag_names.fallback[index] < 0:
+                self.tag_names.fallback[index] = string_id
+            self._tag_name_entries.append((index, self.strings[string_id]))
+            tag_lookup.setdefault(name, index)
+        self._tag_lookup = tag_lookup
+
+        pairs = []
+        for company_id, tag_id in company_tags:
+            company_index, tag_index = self._company_index(company_id), self._tag_index(tag_id)
+            if company_index is not None and tag_index is not None:
+                pairs.append((company_index, tag_index))
+        self.tag_offsets, self.tag_members = _csr(pairs, len(self.company_ids))
+        self.posting_offsets, self.postings = _csr([(t, c) for c, t in pairs], len(self.tag_ids))
+        self.built_at = time.time()
+
+    @staticmethod
+    def _index(ids: array, value: int) -> Optional[int]:
+        index = bisect_left(ids, value)
+        return index if index < len(ids) and ids[index] == value else None
+
+    def _company_index(self, company_id: int) -> Optional[int]:
+        return self._index(self.company_ids, company_id)
+
+    def _tag_index(self, tag_id: int) -> Optional[int]:
+        return self._index(self.tag_ids, tag_id)
+
+    # 조회
+
+    def find_company(self, name: str) -> Optional[int]:
+        pos = bisect_left(self._lookup_names, name)
+        if pos < len(self._lookup_names) and self._lookup_names[pos] == name:
+            return self._lookup_companies[pos]
+        return None
+
+    def company_response(self, index: int, lang: str) -> schemas.CompanyResponseSchema:
+        tags = self.tag_members[self.tag_offsets[index]:self.tag_offsets[index + 1]]
+        tag_names = {self.tag_names.localized(self.strings, t, lang) for t in tags}
+        tag_names.discard(None)
+        return schemas.CompanyResponseSchema(
+            company_name=self.company_names.localized(self.strings, index, lang),
+            tags=sorted(tag_names),
+        )
+
+    def get_company(self, name: str, lang: str) -> Optional[schemas.CompanyResponseSchema]:
+        index = self.find_company(name)
+        return self.company_response(index, lang) if index is not None else None
+
+    def match_tags(self, query: str) -> List[int]:
+        """이름(어느 언어든)에 query 가 포함된 태그 index (DB 의 LIKE '%q%' 와 같이 대소문자 구분)"""
+        return sorted({index for index, name in self._tag_name_entries if query in name})
+
+    def _posting(self, tag_index: int) -> array:
+        return self.postings[self.posting_offsets[tag_index]:self.posting_offsets[tag_index + 1]]
+
+    def companies_with_any(self, tag_indexes: Iterable[int]) -> List[int]:
+        """태그 중 하나라도 가진 회사 index (오름차순). posting 들을 정렬 병합"""
+        return self.merge(self._posting(t) for t in tag_indexes)
+
+    def companies_with_all(self, tag_indexes: Iterable[int]) -> List[int]:
+        """태그를 모두 가진 회사 index (오름차순). 가장 짧은 posting 을 나머지에서 이분 탐색"""
+        postings = sorted((self._posting(t) for t in tag_indexes), key=len)
+        if not postings:
+            return []
+        result = list(postings[0])
+        for posting in postings[1:]:
+            result = [c for c in result if self._index(posting, c) is not None]
+            if not result:
+                break
+        return result
+
+    def companies_matching(self, groups: List[TagQueryGroup]) -> List[int]:
+        """다중 태그 쿼리 그룹(OR) 각각의 (포함 AND, 제외 NOT) 을 평가한 회사 index (오름차순)"""
+        matched = []
+        for include, exclude in groups:
+            include_tags = [self._tag_lookup.get(name) for name in include]
+            if None in include_tags:
+                continue
+            companies = self.companies_with_all(include_tags)
+            exclude_tags = [self._tag_lookup[name] for name in exclude if name in self._tag_lookup]
+            if companies and exclude_tags:
+                excluded = set(self.companies_with_any(exclude_tags))
+                companies = [c for c in companies if c not in excluded]
+            matched.append(companies)
+        return self.merge(matched)
+
+    @staticmethod
+    def merge(company_lists: Iterable[Iterable[int]]) -> List[int]:
+        """오름차순 목록들의 중복 없는 합집합"""
+        result = []
+        for company in heapq.merge(*company_lists):
+            if not result or result[-1] != company:
+                result.append(company)
+        return result
+
+    def matched_tag_count(self, company_index: int, tag_indexes: Iterable[int]) -> int:
+        members = self.tag_members[self.tag_offsets[company_index]:self.tag_offsets[company_index + 1]]
+        return sum(1 for t in set(tag_indexes) if self._index(members, t) is not None)
+
+    def search_by_tags(self, groups: List[TagQueryGroup], lang: str, limit: Optional[int] = None,
+                       cursor: Optional[int] = None) -> schemas.TagSearchPageSchema:
+        selected, next_cursor = self._select_page(self.companies_matching(groups), limit, cursor)
+        include_tags = {self._tag_lookup[name] for include, _ in groups for name in include
+                        if name in self._tag_lookup}
+        return schemas.TagSearchPageSchema(
+            items=[schemas.TagSearchResponseSchema(
+                company_name=self.company_names.localized(self.strings, i, lang),
+                matched_tags=self.matched_tag_count(i, include_tags),
+            ) for i in selected],
+            next_cursor=next_cursor,
+        )
+
+    def _select_page(self, company_indexes: List[int], limit: Optional[int],
+                     cursor: Optional[int]) -> Tuple[List[int], Optional[int]]:
+        """회사 index 목록(오름차순)에서 company_id keyset 페이지 구간과 next_cursor"""
+        start = 0
+        if cursor is not None:
+            # cursor(company_id) 보다 큰 첫 회사 index
+            start = bisect_left(company_indexes, bisect_right(self.company_ids, cursor))
+        end = len(company_indexes) if limit is None else min(start + limit, len(company_indexes))
+        selected = company_indexes[start:end]
+        next_cursor = self.company_ids[selected[-1]] if selected and end < len(company_indexes) else None
+        return selected, next_cursor
+
+    def page(self, company_indexes: List[int], lang: str, limit: Optional[int] = None,
+             cursor: Optional[int] = None) -> schemas.TagSearchPageSchema:
+        """회사 index 목록(오름차순)을 company_id keyset 페이지로 변환"""
+        selected, next_cursor = self._select_page(company_indexes, limit, cursor)
+        return schemas.TagSearchPageSchema(
+            items=[schemas.TagSearchResponseSchema(company_name=self.company_names.localized(self.strings, i, lang))
+                   for i in selected],
+            next_cursor=next_cursor,
+        )
+
+    def search_by_tag_page(self, query: str, lang: str, limit: Optional[int] = None,
+                           cursor: Optional[int] = None) -> schemas.TagSearchPageSchema:
+        return self.page(self.companies_with_any(self.match_tags(query)), lang, limit, cursor)
+
+    def stats(self) -> Dict[str, int]:
+        arrays = [self.company_ids, self.tag_ids, self.company_names.fallback, self.tag_names.fallback,
+                  self.tag_offsets, self.tag_members, self.posting_offsets, self.postings,
+                  self._lookup_companies,
+                  *self.company_names.by_language.values(), *self.tag_names.by_language.values()]
+        array_bytes = sum(a.itemsize * len(a) for a in arrays)
+        string_bytes = sum(sys.getsizeof(s) for s in self.strings)
+        # 리스트는 포인터(8바이트)만 계산 (문자열 자체는 string_bytes 에 포함)
+        list_bytes = 8 * (len(self.strings) + len(self._lookup_names)) + 72 * len(self._tag_name_entries)
+        return {
+            "companies": len(self.company_ids),
+            "tags": len(self.tag_ids),
+            "company_tags": len(self.tag_members),
+            "strings": len(self.strings),
+            "approx_bytes": array_bytes + string_bytes + list_bytes,
+            "built_at": int(self.built_at),
+        }
+
+
+def build_snapshot(db: Session) -> CatalogSnapshot:
+    """ORM 객체를 만들지 않고 컬럼 튜플만 스트리밍으로 읽어 스냅샷 생성"""
+    return CatalogSnapshot(
+        company_ids=[row[0] for row in db.query(models.Company.id).yield_per(10000)],
+        tag_ids=[row[0] for row in db.query(models.Tag.id).yield_per(10000)],
+        company_names=db.query(
+            models.CompanyName.company_id, models.CompanyName.language_code, models.CompanyName.name
+        ).order_by(models.CompanyName.id).yield_per(10000),
+        tag_names=db.query(
+            models.TagName.tag_id, models.TagName.language_code, models.TagName.name
+        ).order_by(models.TagName.id).yield_per(10000),
+        company_tags=db.query(models.CompanyTag.company_id, models.CompanyTag.tag_id).yield_per(10000),
+    )
+
+
+class CatalogSnapshotHolder:
+    """
+    현재 스냅샷 참조를 들고 있다가 재빌드 후 원자적으로 교체한다.
+    읽기는 lock 없이 self.snapshot 을 한 번 읽어 그 객체만 사용한다.
+    """
+
+    def __init__(self, session_factory=None):
+        self.snapshot: Optional[CatalogSnapshot] = None
+        self.session_factory = session_factory
+        self.build_seconds: Optional[float] = None
+        self._dirty = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.snapshot is not None
+
+    def refresh(self) -> CatalogSnapshot:
+        if self.session_factory is None:
+            from backend.database import ReadSessionLocal
+            self.session_factory = ReadSessionLocal
+        begin = time.perf_counter()
+        with self.session_factory() as db:
+            snapshot = build_snapshot(db)
+        self.snapshot = snapshot
+        self.build_seconds = round(time.perf_counter() - begin, 3)
+        return snapshot
+
+    def mark_dirty(self) -> None:
+        """쓰기 후 호출. 백그라운드 스레드가 debounce 후 재빌드한다"""
+        self._dirty.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._dirty.wait(CATALOG_SNAPSHOT_REFRESH_SECONDS)
+            if self._stop.is_set():
+                break
+            if self._dirty.is_set():
+                time.sleep(CATALOG_SNAPSHOT_DEBOUNCE_SECONDS)
+            self._dirty.clear()
+            try:
+                self.refresh()
+            except Exception as e:  # 재빌드 실패 시 이전 스냅샷으로 계속 응답
+                print(f"catalog snapshot refresh failed: {e!r}")
+
+    def start(self) -> None:
+        """백그라운드 재빌드 스레드 시작 (worker 프로세스마다)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="catalog-snapshot", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._dirty.set()
+
+    def stats(self) -> Dict[str, object]:
+        snapshot = self.snapshot
+        if snapshot is None:
+            return {"enabled": CATALOG_SNAPSHOT_ENABLED, "ready": False}
+        return {"enabled": CATALOG_SNAPSHOT_ENABLED, "ready": True, "build_seconds": self.build_seconds,
+                **snapshot.stats()}
+
+
+catalog_snapshot = CatalogSnapshotHolder()
@@ -1,22 +1,156 @@
-from typing import List, Optional
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import String, and_, case, cast, delete, distinct, func, insert, literal, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, REGCONFIG, insert as pg_insert
+from sqlalchemy.orm import Session, aliased, selectinload
 
 from backend import models, schemas
+from backend.services.impl.autocomplete_index import autocomplete_index
+from backend.services.impl.name_cache import company_name_cache, tag_name_cache
+from backend.services.impl.outbox import COMPANY_CREATED, TAGS_ADDED, TAG_REMOVED, change, record_changes
+from backend.services.impl.read_model import (
+    READ_MODEL_ENABLED, get_company_from_read_model, lookup_company_responses, refresh_company_read_model
+)
+from backend.services.impl.tag_counts import apply_tag_count_deltas, count_deltas
 from backend.services.interfaces.company import CompanyServiceInterface
-from backend.utils.util import get_localized_name
+from backend.utils.fast_json import rows_to_models
+from backend.utils.tag_query import parse_tag_query
+from backend.utils.util import SUPPORTED_LANGUAGES, get_localized_name, language_priority
+
+# mode=fuzzy 자동완성: 최대 결과 수와 언어별 word_similarity 임계값 (FUZZY_THRESHOLD_KO 등)
+# 한글/일본어/중국어는 단어당 trigram 수가 적어 영어보다 낮게 둔다
+FUZZY_TOP_K = int(os.environ.get("FUZZY_TOP_K", "10"))
+_DEFAULT_FUZZY_THRESHOLDS = {"ko": 0.2, "en": 0.3, "ja": 0.2, "tw": 0.2}
+FUZZY_THRESHOLDS = {
+    lang: float(os.environ.get(f"FUZZY_THRESHOLD_{lang.upper()}", _DEFAULT_FUZZY_THRESHOLDS.get(lang, 0.3)))
+    for lang in SUPPORTED_LANGUAGES
+}
+
+
+def _company_load_options():
+    """응답 생성에 필요한 회사명/태그/태그명을 selectin 으로 한 번에 로딩 (N+1 방지)"""
+    return (
+        selectinload(models.Company.names),
+        selectinload(models.Company.tags).selectinload(models.CompanyTag.tag).selectinload(models.Tag.names),
+    )
+
+
+def _load_company(db: Session, company_id: int) -> Optional[models.Company]:
+    """회사 id 로 응답 그래프 전체를 로딩"""
+    return db.query(models.Company).options(*_company_load_options()).filter(
+        models.Company.id == company_id
+    ).populate_existing().first()
 
 
 def _get_company_by_name(db: Session, company_name: str) -> Optional[models.Company]:
-    """회사명(어느 언어든)으로 회사 객체 조회"""
-    company_name_obj = db.query(models.CompanyName).filter(models.CompanyName.name == company_name).first()
-    return company_name_obj.company if company_name_obj else None
+    """
+    회사명(어느 언어든)으로 회사 객체 조회.
+    캐시에 id 가 있으면 PK 로 바로 로드하고, 없으면 이름 인덱스로 조인 조회한 뒤 id 를 캐시한다.
+    """
+    company_id = company_name_cache.get(company_name)
+    if company_id is not None:
+        company = _load_company(db, company_id)
+        if company is not None:
+            return company
+        # 롤백된 트랜잭션에서 캐시된 id 등 → 캐시를 비우고 DB 에서 다시 조회
+        company_name_cache.invalidate([company_name])
+    company = db.query(models.Company).join(models.Company.names).options(*_company_load_options()).filter(
+        models.CompanyName.name == company_name
+    ).order_by(models.CompanyName.id).first()
+    if company is not None:
+        company_name_cache.put(company_name, company.id)
+    return company
 
 
 def _get_tag_by_name(db: Session, tag_name: str) -> Optional[models.Tag]:
-    """태그명(어느 언어든)으로 태그 객체 조회"""
-    tag_name_obj = db.query(models.TagName).filter(models.TagName.name == tag_name).first()
-    return tag_name_obj.tag if tag_name_obj else None
+    """태그명(어느 언어든)으로 태그 객체 조회 (이름 → id 는 캐시 사용)"""
+    tag_id = tag_name_cache.resolve(db, tag_name)
+    tag = db.get(models.Tag, tag_id) if tag_id is not None else None
+    if tag_id is not None and tag is None:
+        tag_name_cache.invalidate([tag_name])
+        tag_id = tag_name_cache.resolve(db, tag_name)
+        tag = db.get(models.Tag, tag_id) if tag_id is not None else None
+    return tag
+
+
+def _payload_names(name_schema) -> List[str]:
+    return [n for n in name_schema.dict().values() if n]
+
+
+def _fts_config(lang: str):
+    """요청 언어의 FTS 설정 (regconfig)"""
+    return cast(literal(models.FTS_CONFIGS.get(lang, models.DEFAULT_FTS_CONFIG)), REGCONFIG)
+
+
+def _fts_any_language(name_obj_model, query: str):
+    """
+    언어 구분 없는 검색용 (match 조건, rank 식).
+    설정별로 상수 tsquery 를 만들어 OR 로 묶어야 name_tsv GIN 인덱스(BitmapOr)를 탈 수 있다.
+    """
+    configs = {}
+    for lang, config in models.FTS_CONFIGS.items():
+        configs.setdefault(config, []).append(lang)
+    non_default = [lang for config, langs in configs.items() if config != models.DEFAULT_FTS_CONFIG for lang in langs]
+    configs[models.DEFAULT_FTS_CONFIG] = None
+
+    matches, ranks = [], []
+    for config, langs in configs.items():
+        lang_column = name_obj_model.language_code
+        lang_cond = lang_column.in_(langs) if langs is not None else lang_column.notin_(non_default)
+        tsquery = func.websearch_to_tsquery(cast(literal(config), REGCONFIG), query)
+        matches.append(and_(lang_cond, name_obj_model.name_tsv.op("@@")(tsquery)))
+        ranks.append((lang_cond, func.ts_rank(name_obj_model.name_tsv, tsquery)))
+    return or_(*matches), case(*ranks, else_=0)
+
+
+def _language_rank(language_column, lang: str):
+    """언어 우선순위(lang, fallback 체인) 내 순번. 체인에 없는 언어는 NULLS LAST 로 뒤에 둔다"""
+    priority = literal(list(language_priority(lang)), ARRAY(String))
+    return func.array_position(priority, language_column).nulls_last()
+
+
+def _localized_company_name(company_id_column, lang: str):
+    """
+    회사의 lang 이름, 없으면 fallback 체인 순서, 그래도 없으면 가장 먼저 등록된 이름을 고르는 스칼라 서브쿼리.
+    (get_localized_name 과 같은 규칙을 SQL 로 표현)
+    """
+    name = aliased(models.CompanyName)
+    return select(name.name).where(
+        name.company_id == company_id_column
+    ).order_by(_language_rank(name.language_code, lang), name.id).limit(1).scalar_subquery()
+
+
+def _localized_tag_name(tag_id_column, lang: str):
+    """태그의 lang 이름 (fallback 규칙은 _localized_company_name 과 같음) 스칼라 서브쿼리"""
+    name = aliased(models.TagName)
+    return select(name.name).where(
+        name.tag_id == tag_id_column
+    ).order_by(_language_rank(name.language_code, lang), name.id).limit(1).scalar_subquery()
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("/", "//").replace("%", "/%").replace("_", "/_")
+
+
+def _to_tag_search_responses(
+        db: Session, company_ids: List[int], lang: str
+) -> List[schemas.TagSearchResponseSchema]:
+    """회사 id 목록을 (순서 유지) 언어별 회사명 응답으로 변환. 회사명은 IN 쿼리 한 번으로 로딩"""
+    if not company_ids:
+        return []
+    names_by_company = {}
+    for name_obj in db.query(models.CompanyName).filter(
+            models.CompanyName.company_id.in_(company_ids)
+    ).order_by(models.CompanyName.id):
+        names_by_company.setdefault(name_obj.company_id, []).append(name_obj)
+    return [
+        schemas.TagSearchResponseSchema(
+            company_name=get_localized_name(names_by_company.get(company_id), lang)
+        )
+        for company_id in company_ids
+    ]
 
 
 def _get_company_tag_names(company: models.Company, lang: str) -> List[str]:
@@ -30,26 +164,192 @@ def _get_company_tag_names(company: models.Company, lang: str) -> List[str]:
     return sorted(set(tag_names))
 
 
+def _to_company_response(company: models.Company, lang: str) -> schemas.CompanyResponseSchema:
+    return schemas.CompanyResponseSchema(
+        company_name=get_localized_name(company.names, lang),
+        tags=_get_company_tag_names(company, lang)
+    )
+
+
+def _insert_ids(db: Session, model, count: int) -> List[int]:
+    """model 테이블에 count 개의 행을 한 번의 INSERT ... RETURNING 으로 만들고 id 를 순서대로 반환"""
+    if not count:
+        return []
+    now = datetime.utcnow()
+    return list(db.scalars(
+        insert(model).returning(model.id, sort_by_parameter_order=True),
+        [{"created_at": now, "updated_at": now} for _ in range(count)]
+    ))
+
+
+def _resolve_tag_ids(db: Session, tags: List[schemas.TagCreateSchema]) -> List[int]:
+    """
+    태그 payload 목록을 tag id 목록으로 변환 (없는 태그는 생성).
+    기존 태그명은 IN 쿼리 한 번으로 찾고, 새 태그/태그명은 묶음 INSERT ... ON CONFLICT 로 만든다.
+    (language_code, name) 이 unique 이므로 같은 태그를 동시에 만드는 요청이 있어도 중복 태그나 오류 없이
+    먼저 커밋된 태그를 쓴다. 교착을 피하도록 태그명은 항상 (language_code, name) 순으로 INSERT 한다.
+    """
+    payloads = [{l: n for l, n in tag.tag_name.dict().items() if n} for tag in tags]
+    all_names = [name for names in payloads for name in names.values()]
+    tag_id_by_name = tag_name_cache.resolve_many(db, all_names)
+
+    # 기존 태그에 매칭되지 않는 payload 는 배치 안에서 이름 기준으로 합쳐서 새 태그로 생성
+    new_tags: List[Dict[str, str]] = []
+    new_index_by_name: Dict[str, int] = {}
+    resolved = []
+    for names in payloads:
+        tag_id = next((tag_id_by_name[n] for n in names.values() if n in tag_id_by_name), None)
+        if tag_id is not None:
+            resolved.append(("existing", tag_id))
+            continue
+        new_index = next((new_index_by_name[n] for n in names.values() if n in new_index_by_name), None)
+        if new_index is None:
+            new_index = len(new_tags)
+            new_tags.append(dict(names))
+        else:
+            for l, n in names.items():
+                new_tags[new_index].setdefault(l, n)
+        for name in names.values():
+            new_index_by_name.setdefault(name, new_index)
+        resolved.append(("new", new_index))
+
+    new_tag_ids = _create_tags(db, new_tags)
+    return [value if kind == "existing" else new_tag_ids[value] for kind, value in resolved]
+
+
+def _create_tags(db: Session, new_tags: List[Dict[str, str]]) -> List[int]:
+    """
+    새 태그들을 만들고 id 를 순서대로 반환.
+    태그마다 첫 이름(대표 이름)을 먼저 ON CONFLICT DO NOTHING 으로 넣어 누가 태그를 소유할지 정한다.
+    동시에 같은 대표 이름을 넣은 트랜잭션이 있으면 그 트랜잭션이 끝날 때까지 기다렸다가, 커밋된 태그 id 를 다시 읽어 쓰고
+    미리 만든 tags 행은 지운다. 나머지 이름도 ON CONFLICT DO NOTHING 이므로 이미 다른 태그가 가진 이름은 건너뛴다.
+    """
+    if not new_tags:
+        return []
+    tag_ids = _insert_ids(db, models.Tag, len(new_tags))
+    primary = {}
+    for tag_id, names in zip(tag_ids, new_tags):
+        l, n = next(iter(names.items()))
+        primary[(l, n)] = tag_id
+    inserted = {
+        (row.language_code, row.name) for row in db.execute(
+            pg_insert(models.TagName).on_conflict_do_nothing().returning(
+                models.TagName.language_code, models.TagName.name
+            ),
+            [{"tag_id": tag_id, "language_code": l, "name": n} for (l, n), tag_id in sorted(primary.items())]
+        )
+    }
+
+    lost = [key for key in primary if key not in inserted]
+    if lost:
+        # 다른 트랜잭션이 먼저 만든 태그를 사용
+        winners = {
+            (row.language_code, row.name): row.tag_id for row in db.execute(
+                select(models.TagName.language_code, models.TagName.name, models.TagName.tag_id).where(
+                    tuple_(models.TagName.language_code, models.TagName.name).in_(lost)
+                )
+            )
+        }
+        db.execute(delete(models.Tag).where(models.Tag.id.in_([primary[key] for key in lost])))
+        for key in lost:
+            primary[key] = winners[key]
+        # 지운 태그 id 가 이름 → id 캐시에 남지 않도록
+        tag_name_cache.invalidate([name for _, name in lost])
+
+    result = [primary[next(iter(names.items()))] for names in new_tags]
+    owned = set(tag_ids)
+    secondary_rows = sorted(
+        ({"tag_id": tag_id, "language_code": l, "name": n}
+         for tag_id, names in zip(result, new_tags) if tag_id in owned
+         for l, n in list(names.items())[1:]),
+        key=lambda row: (row["language_code"], row["name"])
+    )
+    if secondary_rows:
+        db.execute(pg_insert(models.TagName).on_conflict_do_nothing(), secondary_rows)
+    return result
+
+
+def _add_company_tags(db: Session, rows: List[Dict[str, int]]) -> List[int]:
+    """
+    company_tags 를 한 번의 INSERT ... ON CONFLICT DO NOTHING 으로 추가하고 태그별 회사 수를 갱신.
+    실제로 추가된 매핑의 tag_id 목록을 반환 (이미 있던 매핑/동시에 추가된 매핑은 제외)
+    """
+    rows = sorted({(row["company_id"], row["tag_id"]) for row in rows})
+    if not rows:
+        return []
+    added_tag_ids = db.scalars(
+        pg_insert(models.CompanyTag).on_conflict_do_nothing().returning(models.CompanyTag.tag_id),
+        [{"company_id": company_id, "tag_id": tag_id} for company_id, tag_id in rows]
+    ).all()
+    apply_tag_count_deltas(db, count_deltas(added_tag_ids))
+    return added_tag_ids
+
+
 class CompanyService(CompanyServiceInterface):
     def autocomplete_company(
-            self, db: Session, query: str, lang: str
+            self, db: Session, query: str, lang: str, limit: Optional[int] = None,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
     ) -> List[schemas.CompanyAutocompleteSchema]:
-        lang_config_map = {
-            "ko": "simple",
-            "en": "english",
-            "ja": "simple",
-            "tw": "simple"
-        }
-        # config = lang_config_map.get(lang, "simple")  # 현재 미사용, 추후 FTS 적용 시 활용
-        q = db.query(models.CompanyName).filter(
+        if mode == schemas.SearchMode.FTS:
+            return self._autocomplete_fts(db, query, lang, limit)
+        if mode == schemas.SearchMode.FUZZY:
+            return self._autocomplete_fuzzy(db, query, lang, limit)
+        if autocomplete_index.ready:
+            return autocomplete_index.search(query, lang, limit)
+        q = db.query(models.CompanyName.name.label("company_name")).filter(
             models.CompanyName.language_code == lang,
             models.CompanyName.name.ilike(f"%{query}%")
-        ).all()
-        return [schemas.CompanyAutocompleteSchema(company_name=c.name) for c in q]
+        )
+        if limit is not None:
+            q = q.limit(limit)
+        return rows_to_models(schemas.CompanyAutocompleteSchema, q.all())
+
+    def _autocomplete_fts(
+            self, db: Session, query: str, lang: str, limit: Optional[int]
+    ) -> List[schemas.CompanyAutocompleteSchema]:
+        """name_tsv GIN 인덱스 + websearch_to_tsquery 매칭, ts_rank 순"""
+        tsquery = func.websearch_to_tsquery(_fts_config(lang), query)
+        q = db.query(models.CompanyName.name.label("company_name")).filter(
+            models.CompanyName.language_code == lang,
+            models.CompanyName.name_tsv.op("@@")(tsquery)
+        ).order_by(func.ts_rank(models.CompanyName.name_tsv, tsquery).desc(), models.CompanyName.id)
+        if limit is not None:
+            q = q.limit(limit)
+        return rows_to_models(schemas.CompanyAutocompleteSchema, q.all())
+
+    def _autocomplete_fuzzy(
+            self, db: Session, query: str, lang: str, limit: Optional[int]
+    ) -> List[schemas.CompanyAutocompleteSchema]:
+        """
+        pg_trgm 기반 오타 허용 자동완성. 후보는 trigram GIN 인덱스로 `query <% name` 을 만족하는 이름이고,
+        prefix 일치 > word_similarity > similarity > 짧은 이름 순으로 상위 K 개만 반환한다.
+        """
+        top_k = min(limit, FUZZY_TOP_K) if limit is not None else FUZZY_TOP_K
+        # <% 연산자는 세션 GUC 임계값을 쓰므로 현재 트랜잭션에만 언어별 값을 설정
+        db.execute(select(func.set_config(
+            "pg_trgm.word_similarity_threshold", str(FUZZY_THRESHOLDS.get(lang, 0.3)), True
+        )))
+        name = models.CompanyName.name
+        q = db.query(name.label("company_name")).filter(
+            models.CompanyName.language_code == lang,
+            literal(query).op("<%")(name)
+        ).order_by(
+            name.istartswith(query, autoescape=True).desc(),
+            func.word_similarity(query, name).desc(),
+            func.similarity(query, name).desc(),
+            func.length(name),
+            models.CompanyName.id,
+        ).limit(top_k)
+        return rows_to_models(schemas.CompanyAutocompleteSchema, q.all())
 
     def get_company(
             self, db: Session, company_name: str, lang: str
     ) -> Optional[schemas.CompanyResponseSchema]:
+        if READ_MODEL_ENABLED:
+            response = get_company_from_read_model(db, company_name, lang)
+            if response is not None:
+                return response
+            # read model 행이 없으면(백필 전 데이터 등) 원본 테이블에서 조회
         company = _get_company_by_name(db, company_name)
         if not company:
             return None
@@ -60,39 +360,39 @@ class CompanyService(CompanyServiceInterface):
             tags=tag_names
         )
 
+    def lookup_companies(
+            self, db: Session, company_names: List[str], lang: str
+    ) -> List[schemas.CompanyLookupResultSchema]:
+        # 이름 → 회사, 언어 fallback, 태그명 정렬까지 한 문장으로 조회
+        responses = lookup_company_responses(db, company_names, lang)
+        return [schemas.CompanyLookupResultSchema(query=name, company=responses.get(name)) for name in company_names]
+
     def create_company(
             self, db: Session, company: schemas.CompanyCreateSchema, lang: str
     ) -> Optional[schemas.CompanyResponseSchema]:
-        # 이미 존재하는 회사명 체크
-        for l, name in company.company_name.dict().items():
-            if name and db.query(models.CompanyName).filter(models.CompanyName.name == name).first():
-                return None  # 이미 존재하면 None 반환
-
+        # 이미 존재하는 회사명 체크 (모든 언어 이름을 한 번에)
+        company_names = _payload_names(company.company_name)
+        if not company_names:
+            # 빈 목록으로 executemany 하면 INSERT ... DEFAULT VALUES 가 되므로 쓰기 전에 거부
+            raise ValueError("company_name requires at least one name")
+        if company_name_cache.resolve_many(db, company_names):
+            return None  # 이미 존재하면 None 반환
         db_company = models.Company()
         db.add(db_company)
         db.flush()
-        for l, name in company.company_name.dict().items():
-            if name:
-                db.add(models.CompanyName(company_id=db_company.id, language_code=l, name=name))
-
-        for tag in company.tags or []:
-            tag_obj = None
-            # 언어별 태그명으로 태그 찾기
-            for l, tname in tag.tag_name.dict().items():
-                if tname:
-                    tag_obj = _get_tag_by_name(db, tname)
-                    if tag_obj:
-                        break
-            if not tag_obj:
-                tag_obj = models.Tag()
-                db.add(tag_obj)
-                db.flush()
-                for l, tname in tag.tag_name.dict().items():
-                    if tname:
-                        db.add(models.TagName(tag_id=tag_obj.id, language_code=l, name=tname))
-            if not db.query(models.CompanyTag).filter_by(company_id=db_company.id, tag_id=tag_obj.id).first():
-                db.add(models.CompanyTag(company_id=db_company.id, tag_id=tag_obj.id))
+        db.execute(insert(models.CompanyName), [
+            {"company_id": db_company.id, "language_code": l, "name": name}
+            for l, name in company.company_name.dict().items() if name
+        ])
+        tag_ids = _resolve_tag_ids(db, company.tags or [])
+        _add_company_tags(db, [{"company_id": db_company.id, "tag_id": tag_id} for tag_id in tag_ids])
+        refresh_company_read_model(db, [db_company.id])
+        record_changes(db, [change(
+            COMPANY_CREATED, db_company.id, tag_ids, [l for l, n in company.company_name.dict().items() if n]
+        )])
         db.commit()
+        autocomplete_index.add_company_names(db_company.id, company.company_name.dict())
+        db_company = _load_company(db, db_company.id)
 
         company_name_localized = get_localized_name(db_company.names, lang)
         tag_names = _get_company_tag_names(db_company, lang)
@@ -101,23 +401,229 @@ class CompanyService(CompanyServiceInterface):
             tags=tag_names
         )
 
+    def create_companies(
+            self, db: Session, companies: List[schemas.CompanyCreateSchema], lang: str
+    ) -> List[schemas.CompanyBatchResultSchema]:
+        payloads = [{l: n for l, n in c.company_name.dict().items() if n} for c in companies]
+
+        # 이미 존재하는 회사명은 IN 쿼리 한 번으로 확인
+        all_names = [name for names in payloads for name in names.values()]
+        existing_names = set(company_name_cache.resolve_many(db, all_names))
+
+        statuses = []
+        claimed_names = set()
+        to_create = []
+        for index, names in enumerate(payloads):
+            if not names:
+                statuses.append(schemas.BatchItemStatus.INVALID)
+            elif any(n in existing_names for n in names.values()):
+                statuses.append(schemas.BatchItemStatus.EXISTS)
+            elif any(n in claimed_names for n in names.values()):
+                statuses.append(schemas.BatchItemStatus.DUPLICATE)
+            else:
+                statuses.append(schemas.BatchItemStatus.CREATED)
+                claimed_names.update(names.values())
+                to_create.append(index)
+
+        company_ids = _insert_ids(db, models.Company, len(to_create))
+        company_id_by_index = dict(zip(to_create, company_ids))
+        name_rows = [
+            {"company_id": company_id_by_index[i], "language_code": l, "name": n}
+            for i in to_create for l, n in payloads[i].items()
+        ]
+        if name_rows:
+            db.execute(insert(models.CompanyName), name_rows)
+
+        tags = [tag for i in to_create for tag in companies[i].tags or []]
+        tag_ids = iter(_resolve_tag_ids(db, tags))
+        mapping_rows = [
+            {"company_id": company_id_by_index[i], "tag_id": next(tag_ids)}
+            for i in to_create for _ in companies[i].tags or []
+        ]
+        _add_company_tags(db, mapping_rows)
+        refresh_company_read_model(db, company_ids)
+        company_tag_ids: Dict[int, List[int]] = {}
+        for row in mapping_rows:
+            company_tag_ids.setdefault(row["company_id"], []).append(row["tag_id"])
+        record_changes(db, [
+            change(COMPANY_CREATED, company_id_by_index[i], company_tag_ids.get(company_id_by_index[i], []), payloads[i])
+            for i in to_create
+        ])
+        db.commit()
+        for i in to_create:
+            autocomplete_index.add_company_names(company_id_by_index[i], payloads[i])
+
+        created = {}
+        if company_ids:
+            created = {c.id: c for c in db.query(models.Company).options(*_company_load_options()).filter(
+                models.Company.id.in_(company_ids)
+            )}
+        return [
+            schemas.CompanyBatchResultSchema(
+                index=index,
+                status=item_status,
+                company=_to_company_response(created[company_id_by_index[index]], lang)
+                if item_status == schemas.BatchItemStatus.CREATED else None
+            )
+            for index, item_status in enumerate(statuses)
+        ]
+
     def search_by_tag(
-            self, db: Session, query: str, lang: str
+            self, db: Session, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
     ) -> List[schemas.TagSearchResponseSchema]:
-        tag_names = db.query(models.TagName).filter(
+        return self.search_by_tag_page(db, query, lang, mode).items
+
+    def search_by_tag_page(
+            self, db: Session, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING,
+            limit: Optional[int] = None, cursor: Optional[int] = None
+    ) -> schemas.TagSearchPageSchema:
+        if mode == schemas.SearchMode.FTS:
+            # 관련도 순이므로 keyset 페이지네이션 없이 limit 만 적용
+            return schemas.TagSearchPageSchema(items=self._search_by_tag_fts(db, query, lang, limit))
+        if mode == schemas.SearchMode.BOOLEAN:
+            return self._search_by_tag_boolean(db, query, lang, limit, cursor)
+
+        # 태그명 trigram 인덱스로 매칭 → (tag_id, company_id) 인덱스로 회사 id → 회사명까지 한 문장으로 조회.
+        # company_id 순 keyset 페이지네이션 (cursor = 이전 페이지 마지막 company_id)
+        matched = select(models.CompanyTag.company_id).join(
+            models.TagName, models.TagName.tag_id == models.CompanyTag.tag_id
+        ).where(
             models.TagName.name.contains(query)
-        ).all()
-        company_ids = set()
-        companies = []
-        for tag_name in tag_names:
-            tag = tag_name.tag
-            for ct in tag.companies:
-                company = ct.company
-                if company.id not in company_ids:
-                    company_name_localized = get_localized_name(company.names, lang)
-                    companies.append(schemas.TagSearchResponseSchema(company_name=company_name_localized))
-                    company_ids.add(company.id)
-        return companies
+        ).distinct()
+        if cursor is not None:
+            matched = matched.where(models.CompanyTag.company_id > cursor)
+        matched = matched.subquery()
+        stmt = select(
+            matched.c.company_id,
+            _localized_company_name(matched.c.company_id, lang).label("company_name")
+        ).order_by(matched.c.company_id)
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        rows = db.execute(stmt).all()
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1].company_id
+        return schemas.TagSearchPageSchema(
+            items=rows_to_models(schemas.TagSearchResponseSchema, rows),
+            next_cursor=next_cursor
+        )
+
+    def _search_by_tag_boolean(
+            self, db: Session, query: str, lang: str, limit: Optional[int], cursor: Optional[int]
+    ) -> schemas.TagSearchPageSchema:
+        """
+        다중 태그 AND/OR/NOT 검색 (backend/utils/tag_query.py).
+        쿼리 태그들의 company_tags 행만 company_id 로 GROUP BY 하고, OR 그룹마다
+        "포함 태그를 모두 가짐(count = n) AND 제외 태그가 없음" 을 HAVING 으로 평가해 한 문장으로 조회한다.
+        """
+        groups = parse_tag_query(query)
+        tag_ids = tag_name_cache.resolve_many(db, {name for include, exclude in groups for name in include + exclude})
+        conditions, include_ids, all_ids = [], set(), set()
+        ct = models.CompanyTag
+        for include, exclude in groups:
+            if any(name not in tag_ids for name in include):
+                # 없는 태그를 모두 가질 수는 없으므로 이 그룹은 매칭되지 않음
+                continue
+            group_include = sorted({tag_ids[name] for name in include})
+            group_exclude = sorted({tag_ids[name] for name in exclude if name in tag_ids})
+            condition = func.count(distinct(ct.tag_id)).filter(ct.tag_id.in_(group_include)) == len(group_include)
+            if group_exclude:
+                condition = and_(condition, func.count().filter(ct.tag_id.in_(group_exclude)) == 0)
+            conditions.append(condition)
+            include_ids.update(group_include)
+            all_ids.update(group_include, group_exclude)
+        if not conditions:
+            return schemas.TagSearchPageSchema(items=[])
+
+        matched = select(
+            ct.company_id,
+            func.count(distinct(ct.tag_id)).filter(ct.tag_id.in_(sorted(include_ids))).label("matched_tags"),
+        ).where(ct.tag_id.in_(sorted(all_ids)))
+        if cursor is not None:
+            matched = matched.where(ct.company_id > cursor)
+        matched = matched.group_by(ct.company_id).having(or_(*conditions)).subquery()
+        stmt = select(
+            matched.c.company_id,
+            matched.c.matched_tags,
+            _localized_company_name(matched.c.company_id, lang).label("company_name"),
+        ).order_by(matched.c.company_id)
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        rows = db.execute(stmt).all()
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1].company_id
+        return schemas.TagSearchPageSchema(
+            items=rows_to_models(schemas.TagSearchResponseSchema, rows),
+            next_cursor=next_cursor
+        )
+
+    def _search_by_tag_fts(
+            self, db: Session, query: str, lang: str, limit: Optional[int]
+    ) -> List[schemas.TagSearchResponseSchema]:
+        # 태그명은 언어 구분 없이 검색하므로 각 행의 언어 설정에 맞는 tsquery 로 매칭
+        match, rank = _fts_any_language(models.TagName, query)
+        q = db.query(models.CompanyTag.company_id).join(
+            models.TagName, models.TagName.tag_id == models.CompanyTag.tag_id
+        ).filter(match).group_by(models.CompanyTag.company_id).order_by(
+            func.max(rank).desc(), models.CompanyTag.company_id
+        )
+        if limit is not None:
+            q = q.limit(limit)
+        return _to_tag_search_responses(db, [row.company_id for row in q], lang)
+
+    def tag_facets(
+            self, db: Session, lang: str, prefix: Optional[str] = None, tags: Optional[List[str]] = None,
+            limit: int = 50
+    ) -> List[schemas.TagFacetSchema]:
+        """
+        필터가 없으면 tag_counts 카운터를 (company_count, tag_id) 인덱스 역방향으로 상위 limit 개만 읽는다.
+        필터가 있으면 필터에 맞는 회사들의 company_tags 만 태그별로 센다. (전체 company_tags 집계는 하지 않음)
+        """
+        if not prefix and not tags:
+            stmt = select(
+                models.TagCount.company_count,
+                _localized_tag_name(models.TagCount.tag_id, lang).label("tag_name"),
+            ).where(models.TagCount.company_count > 0).order_by(
+                models.TagCount.company_count.desc(), models.TagCount.tag_id.desc()
+            ).limit(limit)
+            return [schemas.TagFacetSchema(tag_name=row.tag_name, company_count=row.company_count)
+                    for row in db.execute(stmt) if row.tag_name is not None]
+
+        ct = models.CompanyTag
+        company_filters = []
+        if tags:
+            tag_ids = tag_name_cache.resolve_many(db, tags)
+            if len(tag_ids) < len(set(tags)):
+                return []
+            ids = sorted(set(tag_ids.values()))
+            company_filters.append(ct.company_id.in_(
+                select(ct.company_id).where(ct.tag_id.in_(ids)).group_by(ct.company_id).having(
+                    func.count(distinct(ct.tag_id)) == len(ids)
+                )
+            ))
+        if prefix:
+            # 회사명(어느 언어든) prefix 일치. ILIKE 는 company_names.name trigram 인덱스를 사용
+            company_filters.append(ct.company_id.in_(
+                select(models.CompanyName.company_id).where(
+                    models.CompanyName.name.ilike(f"{_escape_like(prefix)}%", escape="/")
+                )
+            ))
+        counts = select(ct.tag_id, func.count().label("company_count")).where(*company_filters).group_by(
+            ct.tag_id
+        ).order_by(func.count().desc(), ct.tag_id.desc()).limit(limit).subquery()
+        stmt = select(
+            counts.c.company_count,
+            _localized_tag_name(counts.c.tag_id, lang).label("tag_name"),
+        ).order_by(counts.c.company_count.desc(), counts.c.tag_id.desc())
+        return [schemas.TagFacetSchema(tag_name=row.tag_name, company_count=row.company_count)
+                for row in db.execute(stmt) if row.tag_name is not None]
 
     def add_tags_to_company(
             self,
@@ -129,23 +635,16 @@ class CompanyService(CompanyServiceInterface):
         company = _get_company_by_name(db, company_name)
         if not company:
             return None
-        for tag in tags:
-            tag_obj = None
-            for l, tname in tag.tag_name.dict().items():
-                if tname:
-                    tag_obj = _get_tag_by_name(db, tname)
-                    if tag_obj:
-                        break
-            if not tag_obj:
-                tag_obj = models.Tag()
-                db.add(tag_obj)
-                db.flush()
-                for l, tname in tag.tag_name.dict().items():
-                    if tname:
-                        db.add(models.TagName(tag_id=tag_obj.id, language_code=l, name=tname))
-            if not db.query(models.CompanyTag).filter_by(company_id=company.id, tag_id=tag_obj.id).first():
-                db.add(models.CompanyTag(company_id=company.id, tag_id=tag_obj.id))
+        tag_ids = _resolve_tag_ids(db, tags)
+        added_tag_ids = _add_company_tags(db, [{"company_id": company.id, "tag_id": tag_id} for tag_id in tag_ids])
+        # 태그 변경도 회사 변경으로 보고 updated_at 갱신 (export 의 updated_since 기준)
+        company.updated_at = datetime.utcnow()
+        refresh_company_read_model(db, [company.id])
+        if added_tag_ids:
+            record_changes(db, [change(TAGS_ADDED, company.id, added_tag_ids,
+                                       [l for tag in tags for l, n in tag.tag_name.dict().items() if n])])
         db.commit()
+        company = _load_company(db, company.id)
 
         company_name_localized = get_localized_name(company.names, lang)
         tag_names = _get_company_tag_names(company, lang)
@@ -164,11 +663,17 @@ class CompanyService(CompanyServiceInterface):
         if not tag:
             return None
 
-        mapping = db.query(models.CompanyTag).filter_by(company_id=company.id, tag_id=tag.id).first()
-        if mapping:
-            db.delete(mapping)
+        # 동시에 같은 매핑을 지우는 요청이 있어도 실제로 지운 쪽만 카운터를 줄인다
+        deleted = db.scalars(delete(models.CompanyTag).where(
+            models.CompanyTag.company_id == company.id, models.CompanyTag.tag_id == tag.id
+        ).returning(models.CompanyTag.tag_id)).all()
+        if deleted:
+            apply_tag_count_deltas(db, count_deltas(deleted, -1))
+            company.updated_at = datetime.utcnow()
+            refresh_company_read_model(db, [company.id])
+            record_changes(db, [change(TAG_REMOVED, company.id, deleted, {n.language_code for n in tag.names})])
             db.commit()
-            db.refresh(company)
+            company = _load_company(db, company.id)
 
         company_name_localized = get_localized_name(company.names, lang)
         tag_names = _get_company_tag_names(company, lang)
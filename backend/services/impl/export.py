@@ -0,0 +1,128 @@
+"""
+전체 회사/태그 카탈로그 NDJSON export.
+
+companies 는 server-side cursor(yield_per) 로 id 순으로 읽고, EXPORT_BATCH_SIZE 개마다
+회사명/태그명을 IN 쿼리로 한 번에 붙여 내보낸다. 메모리에는 한 batch 만 올라간다.
+"""
+import os
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Sequence
+
+from sqlalchemy import exists, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend import models, schemas
+
+EXPORT_BATCH_SIZE = int(os.environ.get("EXPORT_BATCH_SIZE", "1000"))
+# 워터마크 직전에 시작했지만 export 스냅샷 이후에 커밋된 쓰기를 놓치지 않도록 겹쳐서 받는 구간
+EXPORT_WATERMARK_LAG = timedelta(seconds=float(os.environ.get("EXPORT_WATERMARK_LAG_SECONDS", "60")))
+
+
+def to_utc_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """updated_at 컬럼은 UTC naive datetime 이므로 timezone 이 있는 입력은 UTC 로 바꿔 비교한다"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _companies_stmt(lang: Optional[str], updated_since: Optional[datetime]):
+    stmt = select(models.Company.id, models.Company.updated_at).order_by(models.Company.id)
+    if lang is not None:
+        stmt = stmt.where(exists().where(
+            models.CompanyName.company_id == models.Company.id,
+            models.CompanyName.language_code == lang,
+        ))
+    if updated_since is not None:
+        stmt = stmt.where(models.Company.updated_at >= updated_since)
+    return stmt
+
+
+def _names_stmt(company_ids: List[int], lang: Optional[str]):
+    stmt = select(models.CompanyName.company_id, models.CompanyName.language_code, models.CompanyName.name).where(
+        models.CompanyName.company_id.in_(company_ids)
+    ).order_by(models.CompanyName.company_id, models.CompanyName.id)
+    if lang is not None:
+        stmt = stmt.where(models.CompanyName.language_code == lang)
+    return stmt
+
+
+def _tags_stmt(company_ids: List[int], lang: Optional[str]):
+    stmt = select(
+        models.CompanyTag.company_id, models.TagName.tag_id, models.TagName.language_code, models.TagName.name
+    ).join(models.TagName, models.TagName.tag_id == models.CompanyTag.tag_id).where(
+        models.CompanyTag.company_id.in_(company_ids)
+    ).order_by(models.CompanyTag.company_id, models.TagName.tag_id, models.TagName.id)
+    if lang is not None:
+        stmt = stmt.where(models.TagName.language_code == lang)
+    return stmt
+
+
+def _build_records(company_rows: Sequence, name_rows, tag_rows) -> List[schemas.ExportCompanySchema]:
+    names: Dict[int, Dict[str, str]] = {}
+    for company_id, language_code, name in name_rows:
+        names.setdefault(company_id, {})[language_code] = name
+    tags: Dict[int, Dict[int, Dict[str, str]]] = {}
+    for company_id, tag_id, language_code, name in tag_rows:
+        tags.setdefault(company_id, {}).setdefault(tag_id, {})[language_code] = name
+    return [
+        schemas.ExportCompanySchema(
+            id=company_id,
+            names=names.get(company_id, {}),
+            tags=[schemas.ExportTagSchema(id=tag_id, names=tag_names)
+                  for tag_id, tag_names in tags.get(company_id, {}).items()],
+            updated_at=updated_at,
+        )
+        for company_id, updated_at in company_rows
+    ]
+
+
+def load_records(db: Session, company_ids: List[int]) -> List[schemas.ExportCompanySchema]:
+    """회사 id 목록의 export 레코드 (id 순, 없는 회사는 제외). 변경 이벤트로 외부 인덱스를 갱신할 때 사용"""
+    if not company_ids:
+        return []
+    company_rows = db.execute(select(models.Company.id, models.Company.updated_at).where(
+        models.Company.id.in_(company_ids)
+    ).order_by(models.Company.id)).all()
+    ids = [row.id for row in company_rows]
+    return _build_records(company_rows, db.execute(_names_stmt(ids, None)), db.execute(_tags_stmt(ids, None)))
+
+
+def iter_export(
+        db: Session, lang: Optional[str] = None, updated_since: Optional[datetime] = None,
+        batch_size: int = EXPORT_BATCH_SIZE
+) -> Iterator[schemas.ExportCompanySchema]:
+    result = db.execute(_companies_stmt(lang, updated_since).execution_options(yield_per=batch_size))
+    for partition in result.partitions():
+        company_ids = [row.id for row in partition]
+        yield from _build_records(
+            partition, db.execute(_names_stmt(company_ids, lang)), db.execute(_tags_stmt(company_ids, lang))
+        )
+
+
+async def aiter_export(
+        db: AsyncSession, lang: Optional[str] = None, updated_since: Optional[datetime] = None,
+        batch_size: int = EXPORT_BATCH_SIZE
+) -> AsyncIterator[schemas.ExportCompanySchema]:
+    result = await db.stream(_companies_stmt(lang, updated_since).execution_options(yield_per=batch_size))
+    async for partition in result.partitions():
+        company_ids = [row.id for row in partition]
+        for record in _build_records(
+                partition,
+                await db.execute(_names_stmt(company_ids, lang)),
+                await db.execute(_tags_stmt(company_ids, lang)),
+        ):
+            yield record
+
+
+def _watermark(now: datetime) -> datetime:
+    return now - EXPORT_WATERMARK_LAG
+
+
+def export_watermark(db: Session) -> datetime:
+    """다음 증분 export 의 updated_since 로 쓸 값 (DB 시각 - EXPORT_WATERMARK_LAG)"""
+    return _watermark(db.execute(select(func.timezone("utc", func.now()))).scalar_one())
+
+
+async def async_export_watermark(db: AsyncSession) -> datetime:
+    return _watermark((await db.execute(select(func.timezone("utc", func.now())))).scalar_one())
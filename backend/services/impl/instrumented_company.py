@@ -0,0 +1,87 @@
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from backend import schemas
+from backend.services.impl.proxy import CompanyServiceProxy
+from backend.utils.request_metrics import service_duration
+
+
+@contextmanager
+def _timed(method: str):
+    begin = time.perf_counter()
+    try:
+        yield
+    finally:
+        service_duration.observe(time.perf_counter() - begin, method)
+
+
+class InstrumentedCompanyService(CompanyServiceProxy):
+    """메서드별 처리 시간을 service_method_duration_seconds 히스토그램에 기록하는 서비스"""
+
+    def autocomplete_company(
+            self, db: Session, query: str, lang: str, limit: Optional[int] = None,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
+    ) -> List[schemas.CompanyAutocompleteSchema]:
+        with _timed("autocomplete_company"):
+            return self.service.autocomplete_company(db, query, lang, limit, mode)
+
+    def get_company(
+            self, db: Session, company_name: str, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        with _timed("get_company"):
+            return self.service.get_company(db, company_name, lang)
+
+    def lookup_companies(
+            self, db: Session, company_names: List[str], lang: str
+    ) -> List[schemas.CompanyLookupResultSchema]:
+        with _timed("lookup_companies"):
+            return self.service.lookup_companies(db, company_names, lang)
+
+    def create_company(
+            self, db: Session, company: schemas.CompanyCreateSchema, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        with _timed("create_company"):
+            return self.service.create_company(db, company, lang)
+
+    def create_companies(
+            self, db: Session, companies: List[schemas.CompanyCreateSchema], lang: str
+    ) -> List[schemas.CompanyBatchResultSchema]:
+        with _timed("create_companies"):
+            return self.service.create_companies(db, companies, lang)
+
+    def search_by_tag(
+            self, db: Session, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
+    ) -> List[schemas.TagSearchResponseSchema]:
+        with _timed("search_by_tag"):
+            return self.service.search_by_tag(db, query, lang, mode)
+
+    def search_by_tag_page(
+            self, db: Session, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING,
+            limit: Optional[int] = None, cursor: Optional[int] = None
+    ) -> schemas.TagSearchPageSchema:
+        with _timed("search_by_tag_page"):
+            return self.service.search_by_tag_page(db, query, lang, mode, limit, cursor)
+
+    def tag_facets(
+            self, db: Session, lang: str, prefix: Optional[str] = None, tags: Optional[List[str]] = None,
+            limit: int = 50
+    ) -> List[schemas.TagFacetSchema]:
+        with _timed("tag_facets"):
+            return self.service.tag_facets(db, lang, prefix, tags, limit)
+
+    def add_tags_to_company(
+            self, db: Session, company_name: str, tags: List[schemas.TagCreateSchema], lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        with _timed("add_tags_to_company"):
+            return self.service.add_tags_to_company(db, company_name, tags, lang)
+
+    def delete_tag_from_company(
+            self, db: Session, company_name: str, tag_name: str, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        with _timed("delete_tag_from_company"):
+            return self.service.delete_tag_from_company(db, company_name, tag_name, lang)
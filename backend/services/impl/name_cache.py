@@ -0,0 +1,112 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from backend import models
+
+NAME_CACHE_SIZE = int(os.environ.get("NAME_CACHE_SIZE", "100000"))
+
+
+class NameResolutionCache:
+    """
+    이름(어느 언어든) → 소유 객체 id 캐시 (bounded LRU).
+    서비스 쓰기 경로는 커밋된 이름을 바꾸거나 지우지 않으므로 다른 프로세스의 쓰기로 stale 해지지 않는다.
+    예외는 migrations/008(중복 태그 병합, tag_names 를 다른 태그로 옮기거나 삭제)이며, backend.migrate 가 적용 후
+    같은 프로세스의 캐시를 비운다. 이미 떠 있는 다른 프로세스는 재시작해야 한다.
+    _create_tags 가 동시 생성 경쟁에서 진 태그의 이름도 invalidate 한다. (진 쪽 이름은 커밋되지 않지만 방어적으로)
+    없는 이름(miss)은 캐시하지 않으므로 새로 생성된 이름은 바로 조회된다.
+    """
+
+    def __init__(self, name_model, owner_column: str, max_size: int = NAME_CACHE_SIZE):
+        self.name_model = name_model
+        self.owner_column = getattr(name_model, owner_column)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._items: "OrderedDict[str, int]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def resolve_many(self, db: Session, names: Iterable[str]) -> Dict[str, int]:
+        """이름 목록을 id 로 변환. 캐시에 없는 이름은 IN 쿼리 한 번으로 채운다"""
+        result = {}
+        missing = []
+        with self._lock:
+            for name in dict.fromkeys(names):
+                owner_id = self._items.get(name)
+                if owner_id is None:
+                    missing.append(name)
+                else:
+                    self._items.move_to_end(name)
+                    result[name] = owner_id
+            self.hits += len(result)
+            self.misses += len(missing)
+        if not missing:
+            return result
+
+        found = {}
+        # 같은 이름이 여러 개면 먼저 등록된 것(id 가 작은 것)을 사용
+        for name, owner_id in db.query(self.name_model.name, self.owner_column).filter(
+                self.name_model.name.in_(missing)
+        ).order_by(self.name_model.id.desc()):
+            found[name] = owner_id
+        result.update(found)
+        self._store(found)
+        return result
+
+    def resolve(self, db: Session, name: str) -> Optional[int]:
+        return self.resolve_many(db, [name]).get(name)
+
+    def get(self, name: str) -> Optional[int]:
+        """DB 조회 없이 캐시만 확인"""
+        with self._lock:
+            owner_id = self._items.get(name)
+            if owner_id is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(name)
+            self.hits += 1
+            return owner_id
+
+    def put(self, name: str, owner_id: int) -> None:
+        """다른 쿼리로 알게 된 이름 → id 를 캐시에 기록"""
+        self._store({name: owner_id})
+
+    def _store(self, items: Dict[str, int]) -> None:
+        if self.max_size <= 0 or not items:
+            return
+        with self._lock:
+            self._items.update(items)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def preload(self, db: Session, limit: int) -> int:
+        """먼저 등록된 이름부터 limit 개를 미리 채운다 (worker 시작 시 warmup)"""
+        limit = min(limit, self.max_size)
+        if limit <= 0:
+            return 0
+        rows = db.query(self.name_model.name, self.owner_column).order_by(self.name_model.id).limit(limit)
+        items = {}
+        for name, owner_id in rows:
+            items.setdefault(name, owner_id)
+        self._store(items)
+        return len(items)
+
+    def invalidate(self, names: Iterable[str]) -> None:
+        with self._lock:
+            for name in names:
+                self._items.pop(name, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._items), "max_size": self.max_size}
+
+
+company_name_cache = NameResolutionCache(models.CompanyName, "company_id")
+tag_name_cache = NameResolutionCache(models.TagName, "tag_id")
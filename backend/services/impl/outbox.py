@@ -0,0 +1,222 @@
+"""
+변경 이벤트 transactional outbox 와 dispatcher.
+
+쓰기 경로는 commit 직전에 record_changes 로 outbox_events 에 이벤트를 같은 트랜잭션으로 기록한다.
+기록 전에 트랜잭션 단위 advisory lock 을 잡으므로 이벤트 id 순서가 커밋 순서와 같고,
+dispatcher 는 "마지막으로 처리한 id 보다 큰 이벤트" 만 읽으면 빠짐없이 받을 수 있다.
+
+OutboxDispatcher 는 백그라운드 스레드에서 sink 마다 offset 이후의 이벤트를 묶음으로 읽어 넘긴다.
+  - durable sink: offset 을 outbox_offsets 에 저장하고, 행 lock(SKIP LOCKED) 으로 여러 worker 중 하나만 처리
+  - 그 외 sink: 프로세스 메모리 offset (worker 마다 모든 이벤트를 받음)
+replay(sink, from_id) 로 offset 을 되돌려 다시 받을 수 있다. (보존 기간 OUTBOX_RETENTION_HOURS 이내)
+"""
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from backend import models, schemas
+from backend.services.interfaces.outbox import OutboxSinkInterface
+from backend.utils.util import get_env_bool
+
+OUTBOX_ENABLED = get_env_bool("OUTBOX_ENABLED")
+OUTBOX_BATCH_SIZE = int(os.environ.get("OUTBOX_BATCH_SIZE", "500"))
+# 새 이벤트가 없을 때 다시 확인하는 간격(초). 같은 프로세스의 쓰기는 커밋 직후 바로 깨운다
+OUTBOX_POLL_SECONDS = float(os.environ.get("OUTBOX_POLL_SECONDS", "0.5"))
+OUTBOX_RETENTION_HOURS = float(os.environ.get("OUTBOX_RETENTION_HOURS", "168"))
+# pg_advisory_xact_lock 키 (backend/migrate.py 의 키와 다른 고정값)
+OUTBOX_LOCK_KEY = 7_421_002
+
+COMPANY_CREATED = "company.created"
+TAGS_ADDED = "company.tags_added"
+TAG_REMOVED = "company.tag_removed"
+
+# 같은 프로세스에서 커밋된 이벤트가 있으면 dispatcher 를 바로 깨운다
+_wakeup = threading.Event()
+
+
+def _notify(session) -> None:
+    _wakeup.set()
+
+
+def change(kind: str, company_id: int, tag_ids: Iterable[int] = (),
+           languages: Iterable[str] = ()) -> Dict[str, object]:
+    """
+    이벤트 한 건. languages 는 변경된 회사/태그가 자기 이름을 가진 언어이며,
+    다른 언어 응답도 fallback 으로 바뀔 수 있다.
+    """
+    return {"kind": kind, "company_id": company_id, "tag_ids": sorted(set(tag_ids)),
+            "languages": sorted(set(languages))}
+
+
+def record_changes(db: Session, changes: List[Dict[str, object]]) -> None:
+    """쓰기 트랜잭션의 commit 직전에 호출 (lock 은 commit 까지 유지되므로 마지막 문장으로 둔다)"""
+    if not OUTBOX_ENABLED or not changes:
+        return
+    db.execute(select(func.pg_advisory_xact_lock(OUTBOX_LOCK_KEY)))
+    now = datetime.utcnow()
+    db.execute(insert(models.OutboxEvent), [{**c, "created_at": now} for c in changes])
+    event.listen(db, "after_commit", _notify, once=True)
+
+
+def _to_event(row: models.OutboxEvent) -> schemas.ChangeEventSchema:
+    return schemas.ChangeEventSchema(
+        id=row.id, kind=row.kind, company_id=row.company_id, tag_ids=list(row.tag_ids),
+        languages=list(row.languages), created_at=row.created_at,
+    )
+
+
+def fetch_events(db: Session, after_id: int, limit: int = OUTBOX_BATCH_SIZE) -> List[schemas.ChangeEventSchema]:
+    return [_to_event(row) for row in db.scalars(
+        select(models.OutboxEvent).where(models.OutboxEvent.id > after_id).order_by(models.OutboxEvent.id).limit(limit)
+    )]
+
+
+def latest_event_id(db: Session) -> int:
+    return db.execute(select(func.coalesce(func.max(models.OutboxEvent.id), 0))).scalar_one()
+
+
+class OutboxDispatcher:
+    def __init__(self, sinks: List[OutboxSinkInterface], session_factory=None, batch_size: int = OUTBOX_BATCH_SIZE):
+        self.sinks = {sink.name: sink for sink in sinks}
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        # durable 이 아닌 sink 의 메모리 offset
+        self.offsets: Dict[str, int] = {}
+        self.handled: Dict[str, int] = {name: 0 for name in self.sinks}
+        self.errors: Dict[str, Optional[str]] = {name: None for name in self.sinks}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_prune = 0.0
+
+    def _session(self) -> Session:
+        if self.session_factory is None:
+            from backend.database import SessionLocal
+            self.session_factory = SessionLocal
+        return self.session_factory()
+
+    def prepare(self) -> None:
+        """메모리 offset 을 현재 마지막 id 로 두고 sink 를 시작 (sink 는 이후 이벤트만 받으면 됨)"""
+        with self._session() as db:
+            latest = latest_event_id(db)
+            for name, sink in self.sinks.items():
+                if not sink.durable:
+                    self.offsets[name] = latest
+                sink.start(db)
+            # 처음 등록되는 durable sink 도 현재 이후부터 받음 (이전 이벤트는 replay 로)
+            durable = [{"sink": name, "last_event_id": latest} for name, sink in self.sinks.items() if sink.durable]
+            if durable:
+                db.execute(pg_insert(models.OutboxOffset).on_conflict_do_nothing(), durable)
+            db.commit()
+
+    def _dispatch_local(self, db: Session, sink: OutboxSinkInterface) -> int:
+        events = fetch_events(db, self.offsets[sink.name], self.batch_size)
+        if events:
+            sink.handle(db, events)
+            self.offsets[sink.name] = events[-1].id
+        db.rollback()
+        return len(events)
+
+    def _dispatch_durable(self, db: Session, sink: OutboxSinkInterface) -> int:
+        # 다른 worker 가 이 sink 를 처리 중이면 건너뜀
+        offset = db.scalars(select(models.OutboxOffset).where(
+            models.OutboxOffset.sink == sink.name
+        ).with_for_update(skip_locked=True)).first()
+        if offset is None:
+            db.rollback()
+            return 0
+        events = fetch_events(db, offset.last_event_id, self.batch_size)
+        if events:
+            sink.handle(db, events)
+            offset.last_event_id = events[-1].id
+            offset.updated_at = datetime.utcnow()
+        db.commit()
+        return len(events)
+
+    def dispatch_once(self) -> int:
+        """sink 마다 한 묶음씩 처리하고 처리한 이벤트 수를 반환"""
+        total = 0
+        with self._session() as db:
+            for name, sink in self.sinks.items():
+                try:
+                    count = (self._dispatch_durable if sink.durable else self._dispatch_local)(db, sink)
+                except Exception as e:  # 실패한 묶음은 offset 을 올리지 않고 다음 회차에 다시 시도
+                    db.rollback()
+                    self.errors[name] = repr(e)
+                    continue
+                self.errors[name] = None
+                self.handled[name] += count
+                total += count
+        return total
+
+    def replay(self, sink_name: str, from_id: int = 0) -> None:
+        """sink 의 offset 을 from_id 직전으로 되돌려 이후 이벤트를 다시 전달"""
+        sink = self.sinks[sink_name]
+        if not sink.durable:
+            self.offsets[sink_name] = max(from_id - 1, 0)
+        else:
+            with self._session() as db:
+                set_durable_offset(db, sink_name, max(from_id - 1, 0))
+                db.commit()
+        _wakeup.set()
+
+    def prune(self) -> int:
+        """보존 기간이 지났고 모든 durable sink 가 처리한 이벤트 삭제"""
+        with self._session() as db:
+            done = db.execute(select(func.min(models.OutboxOffset.last_event_id)).where(
+                models.OutboxOffset.sink.in_([n for n, s in self.sinks.items() if s.durable])
+            )).scalar()
+            stmt = delete(models.OutboxEvent).where(
+                models.OutboxEvent.created_at < datetime.utcnow() - timedelta(hours=OUTBOX_RETENTION_HOURS)
+            )
+            if done is not None:
+                stmt = stmt.where(models.OutboxEvent.id <= done)
+            deleted = db.execute(stmt).rowcount
+            db.commit()
+        return deleted
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if self.dispatch_once() >= self.batch_size:
+                    continue  # 밀린 이벤트가 더 있으면 바로 다음 묶음
+                if time.monotonic() - self._last_prune > 3600:
+                    self._last_prune = time.monotonic()
+                    self.prune()
+            except Exception as e:  # DB 장애 등. 다음 회차에 다시 시도
+                print(f"outbox dispatch failed: {e!r}")
+            _wakeup.wait(OUTBOX_POLL_SECONDS)
+            _wakeup.clear()
+
+    def start(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self.prepare()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="outbox-dispatcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        _wakeup.set()
+
+    def stats(self) -> Dict[str, object]:
+        with self._session() as db:
+            latest = latest_event_id(db)
+            durable = dict(db.execute(select(models.OutboxOffset.sink, models.OutboxOffset.last_event_id)).all())
+        sinks = {}
+        for name, sink in self.sinks.items():
+            offset = durable.get(name, 0) if sink.durable else self.offsets.get(name, 0)
+            sinks[name] = {"durable": sink.durable, "offset": offset, "lag": latest - offset,
+                           "handled": self.handled[name], "error": self.errors[name], **sink.stats()}
+        return {"enabled": OUTBOX_ENABLED, "latest_event_id": latest, "sinks": sinks}
+
+
+def set_durable_offset(db: Session, sink_name: str, last_event_id: int) -> None:
+    db.execute(pg_insert(models.OutboxOffset).values(sink=sink_name, last_event_id=last_event_id).on_conflict_do_update(
+        index_elements=[models.OutboxOffset.sink], set_={"last_event_id": last_event_id, "updated_at": datetime.utcnow()}
+    ))
@@ -0,0 +1,180 @@
+"""
+outbox 변경 이벤트를 받는 sink 구현.
+
+  - cache: 프로세스 내 응답 캐시/카탈로그 스냅샷 무효화, 자동완성 인덱스에 새 회사명 추가 (다른 worker 의 쓰기도 반영)
+  - ndjson: 이벤트를 파일에 한 줄씩 추가 (외부 파이프라인 전달용, durable)
+  - index: 프로세스 내 검색 인덱스(토큰 → 회사 id) 증분 갱신. 외부 검색 엔진 동기화의 대용
+"""
+import os
+import re
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend import models, schemas
+from backend.services.impl.autocomplete_index import AUTOCOMPLETE_INDEX_ENABLED, AutocompleteIndex, autocomplete_index
+from backend.services.impl.cached_company import CachedCompanyService
+from backend.services.impl.catalog_snapshot import CATALOG_SNAPSHOT_ENABLED, CatalogSnapshotHolder, catalog_snapshot
+from backend.services.impl.company import CompanyService
+from backend.services.impl.export import iter_export, load_records
+from backend.services.impl.outbox import COMPANY_CREATED
+from backend.services.interfaces.cache import CacheBackendInterface
+from backend.services.interfaces.outbox import OutboxSinkInterface
+
+# 사용할 sink 이름 (쉼표 구분)
+OUTBOX_SINKS = [name.strip() for name in os.environ.get("OUTBOX_SINKS", "cache").split(",") if name.strip()]
+OUTBOX_NDJSON_PATH = os.environ.get("OUTBOX_NDJSON_PATH", "outbox_events.ndjson")
+
+_TOKEN = re.compile(r"\w+")
+
+
+class CacheInvalidationSink(OutboxSinkInterface):
+    name = "cache"
+
+    def __init__(self, cached_service: Optional[CachedCompanyService] = None,
+                 snapshot: Optional[CatalogSnapshotHolder] = None, index: Optional[AutocompleteIndex] = None):
+        self.cached_service = cached_service
+        self.snapshot = snapshot
+        self.index = index
+        self.invalidated = 0
+        self.indexed = 0
+
+    def handle(self, db: Session, events: List[schemas.ChangeEventSchema]) -> None:
+        if self.snapshot is not None:
+            self.snapshot.mark_dirty()
+        if self.cached_service is None and self.index is None:
+            return
+        company_ids = {e.company_id for e in events}
+        rows = db.execute(select(
+            models.CompanyName.company_id, models.CompanyName.language_code, models.CompanyName.name
+        ).where(models.CompanyName.company_id.in_(company_ids))).all()
+        self.add_created_names(events, rows)
+        if self.cached_service is None:
+            return
+        tag_ids = {tag_id for e in events for tag_id in e.tag_ids}
+        company_names = {(language_code, name) for _, language_code, name in rows}
+        tag_names = set(db.scalars(select(models.TagName.name).where(models.TagName.tag_id.in_(tag_ids)))) \
+            if tag_ids else set()
+        self.invalidated += self.cached_service.invalidate(
+            company_names, tag_names, new_company=any(e.kind == COMPANY_CREATED for e in events)
+        )
+
+    def add_created_names(self, events: List[schemas.ChangeEventSchema], rows) -> None:
+        """
+        생성 이벤트의 회사명((company_id, language_code, name) 행)을 자동완성 인덱스에 추가.
+        같은 worker 에서 생성되어 이미 추가된 이름은 인덱스가 무시한다.
+        """
+        if self.index is None:
+            return
+        created = {e.company_id for e in events if e.kind == COMPANY_CREATED}
+        names: Dict[int, Dict[str, str]] = {}
+        for company_id, language_code, name in rows:
+            if company_id in created:
+                names.setdefault(company_id, {})[language_code] = name
+        for company_id, company_names in names.items():
+            self.index.add_company_names(company_id, company_names)
+        self.indexed += len(names)
+
+    def stats(self) -> Dict[str, int]:
+        return {"invalidated_keys": self.invalidated, "indexed_companies": self.indexed}
+
+
+class NdjsonFileSink(OutboxSinkInterface):
+    name = "ndjson"
+    durable = True
+
+    def __init__(self, path: str = OUTBOX_NDJSON_PATH):
+        self.path = path
+        self.written = 0
+
+    def handle(self, db: Session, events: List[schemas.ChangeEventSchema]) -> None:
+        # offset 커밋 전에 실패하면 같은 묶음을 다시 쓰므로 소비자는 id 로 중복을 걸러야 함 (at-least-once)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(e.model_dump_json() + "\n" for e in events))
+            f.flush()
+            os.fsync(f.fileno())
+        self.written += len(events)
+
+    def stats(self) -> Dict[str, int]:
+        return {"written": self.written}
+
+
+class SearchIndexSink(OutboxSinkInterface):
+    """회사명/태그명(모든 언어) 토큰의 역색인. start 에서 전체를 적재하고 이후 이벤트로 바뀐 회사만 다시 색인"""
+    name = "index"
+
+    def __init__(self):
+        self.documents: Dict[int, schemas.ExportCompanySchema] = {}
+        self.postings: Dict[str, Set[int]] = {}
+        self.reindexed = 0
+
+    @staticmethod
+    def tokens(record: schemas.ExportCompanySchema) -> Set[str]:
+        names = list(record.names.values()) + [n for tag in record.tags for n in tag.names.values()]
+        return {token.lower() for name in names for token in _TOKEN.findall(name)}
+
+    def _remove(self, company_id: int) -> None:
+        record = self.documents.pop(company_id, None)
+        if record is None:
+            return
+        for token in self.tokens(record):
+            ids = self.postings.get(token)
+            if ids is not None:
+                ids.discard(company_id)
+                if not ids:
+                    del self.postings[token]
+
+    def _add(self, record: schemas.ExportCompanySchema) -> None:
+        self.documents[record.id] = record
+        for token in self.tokens(record):
+            self.postings.setdefault(token, set()).add(record.id)
+
+    def start(self, db: Session) -> None:
+        self.documents, self.postings = {}, {}
+        for record in iter_export(db):
+            self._add(record)
+
+    def handle(self, db: Session, events: List[schemas.ChangeEventSchema]) -> None:
+        company_ids = sorted({e.company_id for e in events})
+        self.apply(company_ids, load_records(db, company_ids))
+
+    def apply(self, company_ids: List[int], records: List[schemas.ExportCompanySchema]) -> None:
+        """company_ids 의 문서를 records 로 교체 (records 에 없는 회사는 삭제된 것으로 본다)"""
+        for company_id in company_ids:
+            self._remove(company_id)
+        for record in records:
+            self._add(record)
+        self.reindexed += len(company_ids)
+
+    def search(self, term: str) -> List[int]:
+        """term 의 모든 토큰을 포함한 회사 id (id 순)"""
+        tokens = [token.lower() for token in _TOKEN.findall(term)]
+        if not tokens:
+            return []
+        postings = sorted((self.postings.get(token, set()) for token in tokens), key=len)
+        return sorted(set.intersection(*postings))
+
+    def stats(self) -> Dict[str, int]:
+        return {"documents": len(self.documents), "tokens": len(self.postings), "reindexed": self.reindexed}
+
+
+def build_sinks(response_cache: Optional[CacheBackendInterface],
+                names: List[str] = OUTBOX_SINKS) -> List[OutboxSinkInterface]:
+    """OUTBOX_SINKS 설정대로 sink 를 만든다"""
+    sinks: List[OutboxSinkInterface] = []
+    for name in names:
+        if name == CacheInvalidationSink.name:
+            # invalidate 는 캐시 백엔드만 사용하므로 같은 캐시를 감싼 인스턴스면 충분
+            cached = CachedCompanyService(CompanyService(), response_cache) if response_cache is not None else None
+            sinks.append(CacheInvalidationSink(
+                cached, catalog_snapshot if CATALOG_SNAPSHOT_ENABLED else None,
+                autocomplete_index if AUTOCOMPLETE_INDEX_ENABLED else None,
+            ))
+        elif name == NdjsonFileSink.name:
+            sinks.append(NdjsonFileSink())
+        elif name == SearchIndexSink.name:
+            sinks.append(SearchIndexSink())
+        else:
+            raise ValueError(f"Unknown outbox sink: {name}")
+    return sinks
@@ -0,0 +1,71 @@
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from backend import schemas
+from backend.services.interfaces.company import CompanyServiceInterface
+
+
+class CompanyServiceProxy(CompanyServiceInterface):
+    """
+    다른 CompanyServiceInterface 구현을 감싸는 서비스의 기반 클래스.
+    모든 메서드를 감싼 서비스로 위임하므로, 하위 클래스는 필요한 메서드만 override 한다.
+    """
+
+    def __init__(self, service: CompanyServiceInterface):
+        self.service = service
+
+    def autocomplete_company(
+            self, db: Session, query: str, lang: str, limit: Optional[int] = None,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
+    ) -> List[schemas.CompanyAutocompleteSchema]:
+        return self.service.autocomplete_company(db, query, lang, limit, mode)
+
+    def get_company(
+            self, db: Session, company_name: str, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        return self.service.get_company(db, company_name, lang)
+
+    def lookup_companies(
+            self, db: Session, company_names: List[str], lang: str
+    ) -> List[schemas.CompanyLookupResultSchema]:
+        return self.service.lookup_companies(db, company_names, lang)
+
+    def create_company(
+            self, db: Session, company: schemas.CompanyCreateSchema, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        return self.service.create_company(db, company, lang)
+
+    def create_companies(
+            self, db: Session, companies: List[schemas.CompanyCreateSchema], lang: str
+    ) -> List[schemas.CompanyBatchResultSchema]:
+        return self.service.create_companies(db, companies, lang)
+
+    def search_by_tag(
+            self, db: Session, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
+    ) -> List[schemas.TagSearchResponseSchema]:
+        return self.service.search_by_tag(db, query, lang, mode)
+
+    def search_by_tag_page(
+            self, db: Session, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING,
+            limit: Optional[int] = None, cursor: Optional[int] = None
+    ) -> schemas.TagSearchPageSchema:
+        return self.service.search_by_tag_page(db, query, lang, mode, limit, cursor)
+
+    def tag_facets(
+            self, db: Session, lang: str, prefix: Optional[str] = None, tags: Optional[List[str]] = None,
+            limit: int = 50
+    ) -> List[schemas.TagFacetSchema]:
+        return self.service.tag_facets(db, lang, prefix, tags, limit)
+
+    def add_tags_to_company(
+            self, db: Session, company_name: str, tags: List[schemas.TagCreateSchema], lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        return self.service.add_tags_to_company(db, company_name, tags, lang)
+
+    def delete_tag_from_company(
+            self, db: Session, company_name: str, tag_name: str, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        return self.service.delete_tag_from_company(db, company_name, tag_name, lang)
@@ -0,0 +1,148 @@
+"""
+company_read_models 유지/조회.
+
+한 회사의 (언어별) 응답은 회사명/태그명 fallback 과 정렬까지 SQL 한 문장으로 다시 계산한다.
+get_localized_name 과 같게 언어 우선순위(요청 언어 + LANGUAGE_FALLBACK_<LANG>) 순으로 이름을 고르고,
+없으면 가장 먼저 등록된 이름을 쓰며, 태그명은 중복 제거 후 코드포인트 순(COLLATE "C", Python sorted 와 동일)으로 정렬한다.
+fallback 설정을 바꾸면 rebuild_company_read_model 로 다시 계산해야 한다.
+"""
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from backend import models, schemas
+from backend.services.impl.name_cache import company_name_cache
+from backend.utils.util import SUPPORTED_LANGUAGES, get_env_bool, language_priority
+
+READ_MODEL_ENABLED = get_env_bool("READ_MODEL_ENABLED")
+
+
+def _response_columns(priority: str) -> str:
+    """회사 c 의 (회사명, 태그명 배열) 컬럼. priority 는 언어 우선순위 varchar[] 식 (array_position 순, 없으면 id 순)"""
+    return f"""(SELECT cn.name FROM company_names cn
+         WHERE cn.company_id = c.id
+         ORDER BY array_position({priority}, cn.language_code) NULLS LAST, cn.id LIMIT 1),
+       COALESCE((SELECT array_agg(DISTINCT t.name COLLATE "C" ORDER BY t.name COLLATE "C")
+                   FROM (SELECT (SELECT tn.name FROM tag_names tn
+                                  WHERE tn.tag_id = ct.tag_id
+                                  ORDER BY array_position({priority}, tn.language_code) NULLS LAST, tn.id
+                                  LIMIT 1) AS name
+                           FROM company_tags ct
+                          WHERE ct.company_id = c.id) t
+                  WHERE t.name IS NOT NULL), '{{}}')"""
+
+
+def _refresh_sql(where: str) -> str:
+    # 언어별 우선순위는 쉼표로 이은 문자열 배열로 넘겨 언어 행마다 string_to_array 로 푼다
+    return """
+INSERT INTO company_read_models (company_id, language_code, company_name, tags, updated_at)
+SELECT c.id, l.code,
+       """ + _response_columns("string_to_array(l.priority, ',')") + """,
+       now() AT TIME ZONE 'utc'
+  FROM companies c
+ CROSS JOIN unnest(CAST(:languages AS varchar[]), CAST(:priorities AS varchar[])) AS l(code, priority)
+ """ + where + """
+ON CONFLICT (company_id, language_code) DO UPDATE
+   SET company_name = EXCLUDED.company_name, tags = EXCLUDED.tags, updated_at = EXCLUDED.updated_at
+"""
+
+
+refresh_statement = text(_refresh_sql("WHERE c.id = ANY(:company_ids)"))
+rebuild_statement = text(_refresh_sql(""))
+
+# 이름(어느 언어든) 목록 → 회사 응답. 같은 이름이 여러 회사에 있으면 먼저 등록된 이름의 회사 (_get_company_by_name 과 같음)
+lookup_statement = text("""
+WITH c AS (
+    SELECT DISTINCT ON (cn.name) cn.name AS query, cn.company_id AS id
+      FROM company_names cn
+     WHERE cn.name = ANY(CAST(:names AS varchar[]))
+     ORDER BY cn.name, cn.id
+)
+SELECT c.query, c.id,
+       """ + _response_columns("CAST(:priority AS varchar[])") + """
+  FROM c
+""")
+
+
+def read_model_params() -> Dict[str, List[str]]:
+    """refresh/rebuild 문의 언어별 bind 값"""
+    return {
+        "languages": list(SUPPORTED_LANGUAGES),
+        "priorities": [",".join(language_priority(lang)) for lang in SUPPORTED_LANGUAGES],
+    }
+
+
+def refresh_company_read_model(db: Session, company_ids: Iterable[int]) -> None:
+    """
+    company_ids 의 read model 행을 현재 트랜잭션 안에서 다시 계산한다.
+    쓰기 경로에서 commit 직전에 호출하므로 원본 테이블과 같은 트랜잭션으로 반영된다.
+    """
+    company_ids = list(company_ids)
+    if not company_ids:
+        return
+    db.flush()
+    db.execute(refresh_statement, {**read_model_params(), "company_ids": company_ids})
+
+
+def rebuild_company_read_model(db: Session) -> None:
+    """전체 회사의 read model 을 다시 계산 (초기 적재 후, 백필, fallback 설정 변경 후)"""
+    db.flush()
+    db.execute(rebuild_statement, read_model_params())
+
+
+def lookup_company_responses(
+        db: Session, names: Iterable[str], lang: str
+) -> Dict[str, schemas.CompanyResponseSchema]:
+    """회사명 목록을 한 문장으로 조회해 {이름: 응답} 으로 반환 (없는 이름은 제외). 조회된 이름 → id 는 캐시한다"""
+    names = sorted(set(names))
+    if not names:
+        return {}
+    responses = {}
+    for query, company_id, company_name, tags in db.execute(
+            lookup_statement, {"names": names, "priority": list(language_priority(lang))}
+    ):
+        company_name_cache.put(query, company_id)
+        responses[query] = schemas.CompanyResponseSchema(company_name=company_name, tags=list(tags))
+    return responses
+
+
+def _to_response(row: models.CompanyReadModel) -> schemas.CompanyResponseSchema:
+    return schemas.CompanyResponseSchema(company_name=row.company_name, tags=list(row.tags))
+
+
+def get_company_from_read_model(
+        db: Session, company_name: str, lang: str
+) -> Optional[schemas.CompanyResponseSchema]:
+    """
+    회사명(어느 언어든)으로 read model 한 행을 조회.
+    이름 → id 캐시 적중 시 PK 조회, 아니면 company_names 이름 인덱스와 조인한 한 문장으로 조회한다.
+    """
+    company_id = company_name_cache.get(company_name)
+    if company_id is not None:
+        row = db.get(models.CompanyReadModel, (company_id, lang))
+        if row is not None:
+            return _to_response(row)
+    row = db.query(models.CompanyReadModel).join(
+        models.CompanyName, models.CompanyName.company_id == models.CompanyReadModel.company_id
+    ).filter(
+        models.CompanyName.name == company_name,
+        models.CompanyReadModel.language_code == lang,
+    ).order_by(models.CompanyName.id).first()
+    if row is None:
+        return None
+    company_name_cache.put(company_name, row.company_id)
+    return _to_response(row)
+
+
+def main():
+    """python -m backend.services.impl.read_model : 전체 read model 재계산 (LANGUAGE_FALLBACK_* 변경 후)"""
+    from backend.database import SessionLocal
+    with SessionLocal() as db:
+        rebuild_company_read_model(db)
+        db.commit()
+    print("company_read_models rebuilt.")
+
+
+if __name__ == "__main__":
+    main()
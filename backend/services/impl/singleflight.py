@@ -0,0 +1,243 @@
+"""
+같은 읽기 요청의 동시 실행 합치기 (single-flight).
+
+같은 키(메서드, 언어, 인자)로 이미 실행 중인 호출이 있으면 새 DB 조회를 시작하지 않고 그 결과(또는 예외)를 함께 받는다.
+먼저 온 호출(leader)만 실행하며, 기다리는 호출은 SINGLE_FLIGHT_TIMEOUT_SECONDS 가 지나면 기다리지 않고 직접 실행한다.
+결과는 완료 즉시 잊으므로 캐시가 아니며, 캐시가 아직 비어 있는 키에 몰린 요청의 중복 조회만 줄인다.
+
+  - SingleFlight: sync 라우트(threadpool) 용. threading.Event 로 대기
+  - AsyncSingleFlight: async 라우트 용. 이벤트 루프 안에서 asyncio.Future 로 대기
+    (async 경로에서 threading 대기를 쓰면 leader 의 greenlet 이 도는 루프 스레드를 막으므로 분리)
+    leader 가 취소되면(클라이언트 연결 끊김, 요청 timeout) 기다리던 호출은 실패하지 않고 다시 합치기를 시도한다.
+    (fn 은 leader 요청의 세션을 쓰므로 leader 취소 후에도 계속 실행하여 공유하지 않는다)
+"""
+import asyncio
+import os
+import threading
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from backend import schemas
+from backend.services.impl.async_company import AsyncCompanyService
+from backend.services.impl.proxy import CompanyServiceProxy
+from backend.services.interfaces.company import CompanyServiceInterface
+from backend.utils.metrics import Counter, registry
+from backend.utils.util import get_env_bool
+
+SINGLE_FLIGHT_ENABLED = get_env_bool("SINGLE_FLIGHT_ENABLED")
+SINGLE_FLIGHT_TIMEOUT_SECONDS = float(os.environ.get("SINGLE_FLIGHT_TIMEOUT_SECONDS", "5"))
+
+# result: leader(직접 실행), coalesced(leader 결과 공유), timeout(기다리다 직접 실행)
+single_flight_total = registry.register(Counter(
+    "single_flight_requests_total", "single-flight 로 처리한 읽기 호출 수", ("method", "result")))
+
+T = TypeVar("T")
+
+# leader 가 취소되어 결과가 없음을 기다리는 호출에 알리는 값
+_LEADER_CANCELLED = object()
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self, timeout: float = SINGLE_FLIGHT_TIMEOUT_SECONDS):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        method = str(key[0]) if isinstance(key, tuple) else str(key)
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+        if not leader:
+            if not call.done.wait(self.timeout):
+                single_flight_total.inc(method, "timeout")
+                return fn()
+            single_flight_total.inc(method, "coalesced")
+            if call.error is not None:
+                raise call.error
+            return call.result
+        single_flight_total.inc(method, "leader")
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"in_flight": len(self._calls), "waiting": sum(c.waiters for c in self._calls.values())}
+
+
+class AsyncSingleFlight:
+    """SingleFlight 의 asyncio 버전 (한 이벤트 루프 안에서만 공유)"""
+
+    def __init__(self, timeout: float = SINGLE_FLIGHT_TIMEOUT_SECONDS):
+        self.timeout = timeout
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        method = str(key[0]) if isinstance(key, tuple) else str(key)
+        future = self._calls.get(key)
+        if future is not None:
+            try:
+                # shield: 기다리던 요청이 취소/timeout 되어도 leader 의 결과 Future 는 그대로 둔다
+                result = await asyncio.wait_for(asyncio.shield(future), self.timeout)
+            except asyncio.TimeoutError:
+                single_flight_total.inc(method, "timeout")
+                return await fn()
+            if result is _LEADER_CANCELLED:
+                return await self.do(key, fn)
+            single_flight_total.inc(method, "coalesced")
+            return result
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        single_flight_total.inc(method, "leader")
+        try:
+            result = await fn()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            # 취소를 기다리는 호출에 전파하지 않는다 (키는 finally 에서 지우므로 그중 하나가 새 leader 가 됨)
+            future.set_result(_LEADER_CANCELLED)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 기다리는 호출이 없으면 "Future exception was never retrieved" 경고가 나지 않도록 소비
+            future.exception()
+            raise
+        finally:
+            del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        return {"in_flight": len(self._calls)}
+
+
+# 라우터/모니터링이 같은 인스턴스를 보도록 모듈 단위로 공유
+single_flight = SingleFlight()
+async_single_flight = AsyncSingleFlight()
+
+
+def _names(values: Optional[List[str]]) -> Optional[tuple]:
+    return tuple(values) if values is not None else None
+
+
+class SingleFlightCompanyService(CompanyServiceProxy):
+    """읽기 메서드의 동시 동일 호출을 합치는 서비스 (sync 경로). 쓰기는 그대로 위임"""
+
+    def __init__(self, service: CompanyServiceInterface, flight: Optional[SingleFlight] = None):
+        super().__init__(service)
+        self.flight = flight or single_flight
+
+    def autocomplete_company(
+            self, db: Session, query: str, lang: str, limit: Optional[int] = None,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
+    ) -> List[schemas.CompanyAutocompleteSchema]:
+        return self.flight.do(("autocomplete_company", lang, mode, limit, query),
+                              lambda: self.service.autocomplete_company(db, query, lang, limit, mode))
+
+    def get_company(
+            self, db: Session, company_name: str, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        return self.flight.do(("get_company", lang, company_name),
+                              lambda: self.service.get_company(db, company_name, lang))
+
+    def lookup_companies(
+            self, db: Session, company_names: List[str], lang: str
+    ) -> List[schemas.CompanyLookupResultSchema]:
+        return self.flight.do(("lookup_companies", lang, _names(company_names)),
+                              lambda: self.service.lookup_companies(db, company_names, lang))
+
+    def search_by_tag(
+            self, db: Session, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
+    ) -> List[schemas.TagSearchResponseSchema]:
+        return self.flight.do(("search_by_tag", lang, mode, query),
+                              lambda: self.service.search_by_tag(db, query, lang, mode))
+
+    def search_by_tag_page(
+            self, db: Session, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING,
+            limit: Optional[int] = None, cursor: Optional[int] = None
+    ) -> schemas.TagSearchPageSchema:
+        return self.flight.do(("search_by_tag_page", lang, mode, limit, cursor, query),
+                              lambda: self.service.search_by_tag_page(db, query, lang, mode, limit, cursor))
+
+    def tag_facets(
+            self, db: Session, lang: str, prefix: Optional[str] = None, tags: Optional[List[str]] = None,
+            limit: int = 50
+    ) -> List[schemas.TagFacetSchema]:
+        return self.flight.do(("tag_facets", lang, prefix, _names(tags), limit),
+                              lambda: self.service.tag_facets(db, lang, prefix, tags, limit))
+
+
+class SingleFlightAsyncCompanyService(AsyncCompanyService):
+    """AsyncCompanyService 의 읽기 메서드에서 동시 동일 호출을 합친다 (run_sync 전에 합치므로 leader 만 DB 를 사용)"""
+
+    def __init__(self, service: Optional[CompanyServiceInterface] = None, flight: Optional[AsyncSingleFlight] = None):
+        super().__init__(service)
+        self.flight = flight or async_single_flight
+
+    async def autocomplete_company(
+            self, db: AsyncSession, query: str, lang: str, limit: Optional[int] = None,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
+    ) -> List[schemas.CompanyAutocompleteSchema]:
+        return await self.flight.do(("autocomplete_company", lang, mode, limit, query),
+                                    lambda: super(SingleFlightAsyncCompanyService, self).autocomplete_company(
+                                        db, query, lang, limit, mode))
+
+    async def get_company(
+            self, db: AsyncSession, company_name: str, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        return await self.flight.do(("get_company", lang, company_name),
+                                    lambda: super(SingleFlightAsyncCompanyService, self).get_company(
+                                        db, company_name, lang))
+
+    async def lookup_companies(
+            self, db: AsyncSession, company_names: List[str], lang: str
+    ) -> List[schemas.CompanyLookupResultSchema]:
+        return await self.flight.do(("lookup_companies", lang, _names(company_names)),
+                                    lambda: super(SingleFlightAsyncCompanyService, self).lookup_companies(
+                                        db, company_names, lang))
+
+    async def search_by_tag(
+            self, db: AsyncSession, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
+    ) -> List[schemas.TagSearchResponseSchema]:
+        return await self.flight.do(("search_by_tag", lang, mode, query),
+                                    lambda: super(SingleFlightAsyncCompanyService, self).search_by_tag(
+                                        db, query, lang, mode))
+
+    async def search_by_tag_page(
+            self, db: AsyncSession, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING,
+            limit: Optional[int] = None, cursor: Optional[int] = None
+    ) -> schemas.TagSearchPageSchema:
+        return await self.flight.do(("search_by_tag_page", lang, mode, limit, cursor, query),
+                                    lambda: super(SingleFlightAsyncCompanyService, self).search_by_tag_page(
+                                        db, query, lang, mode, limit, cursor))
+
+    async def tag_facets(
+            self, db: AsyncSession, lang: str, prefix: Optional[str] = None, tags: Optional[List[str]] = None,
+            limit: int = 50
+    ) -> List[schemas.TagFacetSchema]:
+        return await self.flight.do(("tag_facets", lang, prefix, _names(tags), limit),
+                                    lambda: super(SingleFlightAsyncCompanyService, self).tag_facets(
+                                        db, lang, prefix, tags, limit))
@@ -0,0 +1,107 @@
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from backend import schemas
+from backend.services.impl.catalog_snapshot import CatalogSnapshot, CatalogSnapshotHolder
+from backend.services.impl.proxy import CompanyServiceProxy
+from backend.services.interfaces.company import CompanyServiceInterface
+from backend.utils.tag_query import parse_tag_query
+
+# 스냅샷으로 응답하는 /tags 검색 모드
+_SNAPSHOT_TAG_MODES = (schemas.SearchMode.SUBSTRING, schemas.SearchMode.BOOLEAN)
+
+
+class SnapshotCompanyService(CompanyServiceProxy):
+    """
+    스냅샷이 준비되어 있으면 get_company / lookup_companies / search_by_tag[_page](substring, boolean) 를 DB 대신 인메모리 스냅샷으로 응답하는 서비스.
+    그 외 요청은 감싼 서비스로 위임하고, 쓰기가 성공하면 스냅샷 재빌드를 예약한다.
+    스냅샷 응답은 최대 CATALOG_SNAPSHOT_REFRESH_SECONDS (쓰기가 있었던 worker 는 debounce 시간) 만큼 지연될 수 있다.
+    회사 조회는 스냅샷에 없으면 (재빌드 전에 생성된 회사일 수 있으므로) 감싼 서비스로 다시 조회한다.
+    """
+
+    def __init__(self, service: CompanyServiceInterface, holder: CatalogSnapshotHolder):
+        super().__init__(service)
+        self.holder = holder
+
+    # 읽기
+
+    def get_company(
+            self, db: Session, company_name: str, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        snapshot = self.holder.snapshot
+        result = snapshot.get_company(company_name, lang) if snapshot is not None else None
+        if result is None:
+            return self.service.get_company(db, company_name, lang)
+        return result
+
+    def lookup_companies(
+            self, db: Session, company_names: List[str], lang: str
+    ) -> List[schemas.CompanyLookupResultSchema]:
+        snapshot = self.holder.snapshot
+        if snapshot is None:
+            return self.service.lookup_companies(db, company_names, lang)
+        found = {name: snapshot.get_company(name, lang) for name in company_names}
+        missing = [name for name, company in found.items() if company is None]
+        if missing:
+            found.update((r.query, r.company) for r in self.service.lookup_companies(db, missing, lang))
+        return [schemas.CompanyLookupResultSchema(query=name, company=found[name]) for name in company_names]
+
+    def search_by_tag(
+            self, db: Session, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
+    ) -> List[schemas.TagSearchResponseSchema]:
+        snapshot = self.holder.snapshot
+        if snapshot is None or mode not in _SNAPSHOT_TAG_MODES:
+            return self.service.search_by_tag(db, query, lang, mode)
+        return self._search(snapshot, query, lang, mode).items
+
+    def search_by_tag_page(
+            self, db: Session, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING,
+            limit: Optional[int] = None, cursor: Optional[int] = None
+    ) -> schemas.TagSearchPageSchema:
+        snapshot = self.holder.snapshot
+        if snapshot is None or mode not in _SNAPSHOT_TAG_MODES:
+            return self.service.search_by_tag_page(db, query, lang, mode, limit, cursor)
+        return self._search(snapshot, query, lang, mode, limit, cursor)
+
+    @staticmethod
+    def _search(snapshot: CatalogSnapshot, query: str, lang: str, mode: schemas.SearchMode,
+                limit: Optional[int] = None, cursor: Optional[int] = None) -> schemas.TagSearchPageSchema:
+        if mode == schemas.SearchMode.BOOLEAN:
+            return snapshot.search_by_tags(parse_tag_query(query), lang, limit, cursor)
+        return snapshot.search_by_tag_page(query, lang, limit, cursor)
+
+    # 쓰기
+
+    def create_company(
+            self, db: Session, company: schemas.CompanyCreateSchema, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        result = self.service.create_company(db, company, lang)
+        if result is not None:
+            self.holder.mark_dirty()
+        return result
+
+    def create_companies(
+            self, db: Session, companies: List[schemas.CompanyCreateSchema], lang: str
+    ) -> List[schemas.CompanyBatchResultSchema]:
+        results = self.service.create_companies(db, companies, lang)
+        self.holder.mark_dirty()
+        return results
+
+    def add_tags_to_company(
+            self, db: Session, company_name: str, tags: List[schemas.TagCreateSchema], lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        result = self.service.add_tags_to_company(db, company_name, tags, lang)
+        if result is not None:
+            self.holder.mark_dirty()
+        return result
+
+    def delete_tag_from_company(
+            self, db: Session, company_name: str, tag_name: str, lang: str
+    ) -> Optional[schemas.CompanyResponseSchema]:
+        result = self.service.delete_tag_from_company(db, company_name, tag_name, lang)
+        if result is not None:
+            self.holder.mark_dirty()
+        return result
@@ -0,0 +1,52 @@
+"""
+tag_counts(태그별 회사 수) 카운터 유지.
+
+company_tags 행을 실제로 추가/삭제한 만큼만 같은 트랜잭션에서 증감한다.
+동시에 같은 태그를 증감하는 트랜잭션은 tag_counts 행 lock 으로 직렬화되며, 교착을 피하도록 항상 tag_id 순으로 갱신한다.
+"""
+from typing import Dict, Iterable
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+APPLY_DELTAS_SQL = """
+INSERT INTO tag_counts (tag_id, company_count)
+SELECT d.tag_id, d.delta
+  FROM unnest(CAST(:tag_ids AS integer[]), CAST(:deltas AS integer[])) AS d(tag_id, delta)
+ ORDER BY d.tag_id
+ON CONFLICT (tag_id) DO UPDATE SET company_count = tag_counts.company_count + EXCLUDED.company_count
+"""
+
+apply_deltas_statement = text(APPLY_DELTAS_SQL)
+rebuild_statement = text("""
+INSERT INTO tag_counts (tag_id, company_count)
+SELECT t.id, count(ct.tag_id)
+  FROM tags t
+  LEFT JOIN company_tags ct ON ct.tag_id = t.id
+ GROUP BY t.id
+ON CONFLICT (tag_id) DO UPDATE SET company_count = EXCLUDED.company_count
+""")
+
+
+def count_deltas(tag_ids: Iterable[int], delta: int = 1) -> Dict[int, int]:
+    """추가(delta=1)/삭제(delta=-1)된 company_tags 행의 tag_id 목록을 태그별 증감으로 집계"""
+    deltas: Dict[int, int] = {}
+    for tag_id in tag_ids:
+        deltas[tag_id] = deltas.get(tag_id, 0) + delta
+    return deltas
+
+
+def apply_tag_count_deltas(db: Session, deltas: Dict[int, int]) -> None:
+    """태그별 회사 수 증감을 현재 트랜잭션에서 반영 (쓰기 경로에서 commit 직전에 호출)"""
+    deltas = {tag_id: delta for tag_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    tag_ids = sorted(deltas)
+    db.flush()
+    db.execute(apply_deltas_statement, {"tag_ids": tag_ids, "deltas": [deltas[t] for t in tag_ids]})
+
+
+def rebuild_tag_counts(db: Session) -> None:
+    """전체 태그의 회사 수를 다시 계산 (초기 적재 후, 카운터 보정)"""
+    db.flush()
+    db.execute(rebuild_statement)
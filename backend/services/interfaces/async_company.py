@@ -0,0 +1,111 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend import schemas
+
+
+class AsyncCompanyServiceInterface(ABC):
+    """CompanyServiceInterface 의 async 버전 (AsyncSession 사용)"""
+
+    @abstractmethod
+    async def autocomplete_company(
+            self, db: AsyncSession, query: str, lang: str, limit: Optional[int] = None,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
+    ) -> List[schemas.CompanyAutocompleteSchema]:
+        """
+        자동완성 기능을 위해 쿼리에 일치하는 회사 목록을 반환합니다.
+        limit 이 주어지면 최대 limit 개까지만 반환합니다.
+        mode 가 fts 이면 언어별 full-text search 로 매칭하고 관련도 순으로 반환합니다.
+        """
+        pass
+
+    @abstractmethod
+    async def get_company(
+            self, db: AsyncSession, company_name: str, lang: str
+    ) -> schemas.CompanyResponseSchema:
+        """
+        회사 이름으로 회사의 상세 정보를 반환합니다.
+        """
+        pass
+
+    @abstractmethod
+    async def lookup_companies(
+            self, db: AsyncSession, company_names: List[str], lang: str
+    ) -> List[schemas.CompanyLookupResultSchema]:
+        """
+        여러 회사명(어느 언어든)의 상세 정보를 요청 순서대로 한 번에 반환합니다. 없는 회사는 company 가 None 입니다.
+        """
+        pass
+
+    @abstractmethod
+    async def create_company(
+            self, db: AsyncSession, company: schemas.CompanyCreateSchema, lang: str
+    ) -> schemas.CompanyResponseSchema:
+        """
+        새로운 회사를 생성하고 해당 회사의 상세 정보를 반환합니다.
+        """
+        pass
+
+    @abstractmethod
+    async def create_companies(
+            self, db: AsyncSession, companies: List[schemas.CompanyCreateSchema], lang: str
+    ) -> List[schemas.CompanyBatchResultSchema]:
+        """
+        여러 회사를 한 트랜잭션으로 생성하고, 입력 순서대로 항목별 결과를 반환합니다.
+        """
+        pass
+
+    @abstractmethod
+    async def search_by_tag(
+            self, db: AsyncSession, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
+    ) -> List[schemas.TagSearchResponseSchema]:
+        """
+        태그 검색에 일치하는 회사 목록을 반환합니다.
+        mode 가 fts 이면 태그명 full-text search 로 매칭하고 관련도 순으로 반환합니다.
+        """
+        pass
+
+    @abstractmethod
+    async def search_by_tag_page(
+            self, db: AsyncSession, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING,
+            limit: Optional[int] = None, cursor: Optional[int] = None
+    ) -> schemas.TagSearchPageSchema:
+        """
+        태그 검색 결과를 company_id 순 keyset 페이지로 반환합니다.
+        cursor 는 이전 페이지의 next_cursor 이며, 마지막 페이지이면 next_cursor 는 None 입니다.
+        (fts 모드는 관련도 순이므로 cursor 없이 limit 만 적용합니다.)
+        """
+        pass
+
+    @abstractmethod
+    async def tag_facets(
+            self, db: AsyncSession, lang: str, prefix: Optional[str] = None, tags: Optional[List[str]] = None,
+            limit: int = 50
+    ) -> List[schemas.TagFacetSchema]:
+        """
+        태그별 회사 수를 회사 수 내림차순으로 최대 limit 개 반환합니다.
+        prefix(회사명 prefix) 나 tags(함께 가진 태그명) 가 주어지면 해당 회사들 안에서 셉니다.
+        """
+        pass
+
+    @abstractmethod
+    async def add_tags_to_company(
+            self, db: AsyncSession, company_name: str, tags: List[schemas.TagCreateSchema], lang: str
+    ) -> schemas.CompanyResponseSchema:
+        """
+        회사에 태그를 추가하고, 갱신된 회사의 상세 정보를 반환합니다.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_tag_from_company(
+            self, db: AsyncSession, company_name: str, tag_name: str, lang: str
+    ) -> schemas.CompanyResponseSchema:
+        """
+        회사에서 태그를 제거하고, 갱신된 회사의 상세 정보를 반환합니다.
+        """
+        pass
@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional
+
+
+class CacheBackendInterface(ABC):
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """
+        키에 해당하는 값을 반환합니다. 없거나 만료되었으면 None 을 반환합니다.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str, deps: Iterable[str] = ()) -> None:
+        """
+        값을 저장합니다. 만료 시간(TTL)은 백엔드 설정을 따릅니다.
+        deps 는 값이 의존하는 이름이며, invalidate 로 같은 이름에 등록된 키를 함께 삭제합니다.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, keys: Iterable[str]) -> int:
+        """
+        키 목록을 삭제하고 삭제된 개수를 반환합니다.
+        """
+        pass
+
+    @abstractmethod
+    def invalidate(self, deps: Iterable[str]) -> int:
+        """
+        deps 중 하나라도 의존하는 키를 삭제하고 삭제된 개수를 반환합니다. (전체 키를 훑지 않음)
+        """
+        pass
+
+    @abstractmethod
+    def keys(self, prefix: str) -> List[str]:
+        """
+        prefix 로 시작하는 키 목록을 반환합니다.
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        """
+        hit/miss/eviction 등 캐시 통계를 반환합니다.
+        """
+        pass
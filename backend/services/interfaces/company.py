@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -9,10 +9,13 @@ from backend import schemas
 class CompanyServiceInterface(ABC):
     @abstractmethod
     def autocomplete_company(
-            self, db: Session, query: str, lang: str
+            self, db: Session, query: str, lang: str, limit: Optional[int] = None,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
     ) -> List[schemas.CompanyAutocompleteSchema]:
         """
         자동완성 기능을 위해 쿼리에 일치하는 회사 목록을 반환합니다.
+        limit 이 주어지면 최대 limit 개까지만 반환합니다.
+        mode 가 fts 이면 언어별 full-text search 로 매칭하고 관련도 순으로 반환합니다.
         """
         pass
 
@@ -25,21 +28,68 @@ class CompanyServiceInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    def lookup_companies(
+            self, db: Session, company_names: List[str], lang: str
+    ) -> List[schemas.CompanyLookupResultSchema]:
+        """
+        여러 회사명(어느 언어든)의 상세 정보를 요청 순서대로 한 번에 반환합니다. 없는 회사는 company 가 None 입니다.
+        """
+        pass
+
     @abstractmethod
     def create_company(
             self, db: Session, company: schemas.CompanyCreateSchema, lang: str
     ) -> schemas.CompanyResponseSchema:
         """
         새로운 회사를 생성하고 해당 회사의 상세 정보를 반환합니다.
+        회사명이 하나도 없으면 ValueError 를 발생시킵니다.
+        """
+        pass
+
+    @abstractmethod
+    def create_companies(
+            self, db: Session, companies: List[schemas.CompanyCreateSchema], lang: str
+    ) -> List[schemas.CompanyBatchResultSchema]:
+        """
+        여러 회사를 한 트랜잭션으로 생성하고, 입력 순서대로 항목별 결과를 반환합니다.
         """
         pass
 
     @abstractmethod
     def search_by_tag(
-            self, db: Session, query: str, lang: str
+            self, db: Session, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING
     ) -> List[schemas.TagSearchResponseSchema]:
         """
         태그 검색에 일치하는 회사 목록을 반환합니다.
+        mode 가 fts 이면 태그명 full-text search 로 매칭하고 관련도 순으로 반환합니다.
+        """
+        pass
+
+    @abstractmethod
+    def search_by_tag_page(
+            self, db: Session, query: str, lang: str,
+            mode: schemas.SearchMode = schemas.SearchMode.SUBSTRING,
+            limit: Optional[int] = None, cursor: Optional[int] = None
+    ) -> schemas.TagSearchPageSchema:
+        """
+        태그 검색 결과를 company_id 순 keyset 페이지로 반환합니다.
+        cursor 는 이전 페이지의 next_cursor 이며, 마지막 페이지이면 next_cursor 는 None 입니다.
+        (fts 모드는 관련도 순이므로 cursor 없이 limit 만 적용합니다.)
+        boolean 모드는 query 를 다중 태그 AND/OR/NOT 식으로 해석하고 (잘못된 식이면 ValueError),
+        항목마다 일치한 태그 수(matched_tags)를 채웁니다.
+        """
+        pass
+
+    @abstractmethod
+    def tag_facets(
+            self, db: Session, lang: str, prefix: Optional[str] = None, tags: Optional[List[str]] = None,
+            limit: int = 50
+    ) -> List[schemas.TagFacetSchema]:
+        """
+        태그별 회사 수를 회사 수 내림차순으로 최대 limit 개 반환합니다.
+        prefix(회사명 prefix) 나 tags(함께 가진 태그명) 가 주어지면 해당 회사들 안에서 셉니다.
         """
         pass
 
@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+from sqlalchemy.orm import Session
+
+from backend import schemas
+
+
+class OutboxSinkInterface(ABC):
+    # dispatcher 가 offset 을 구분하는 이름
+    name: str = ""
+    # True 이면 offset 을 outbox_offsets 테이블에 두고 여러 프로세스 중 하나만 처리한다.
+    # False 이면 프로세스마다 메모리 offset 으로 모든 이벤트를 받는다. (프로세스 내 캐시/인덱스)
+    durable: bool = False
+
+    def start(self, db: Session) -> None:
+        """
+        dispatcher 시작 시 한 번 호출됩니다. 메모리 상태를 가진 sink 는 여기서 전체 상태를 적재합니다.
+        """
+        pass
+
+    @abstractmethod
+    def handle(self, db: Session, events: List[schemas.ChangeEventSchema]) -> None:
+        """
+        id 순으로 정렬된 이벤트 묶음을 처리합니다. 예외가 나면 같은 묶음을 다시 받습니다.
+        """
+        pass
+
+    def stats(self) -> Dict[str, int]:
+        return {}
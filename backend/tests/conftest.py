@@ -0,0 +1,43 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from backend.database import engine, read_engine
+from backend.main import app
+
+
+class QueryCounter:
+    """엔진에서 실행된 SQL 문을 기록"""
+
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def reset(self):
+        self.statements.clear()
+
+
+@pytest.fixture
+def api():
+    return TestClient(app)
+
+
+@pytest.fixture
+def count_queries():
+    """
+    테스트 중 실행된 SQL 문 개수를 세는 fixture.
+    N+1 lazy loading 이 다시 생기면 문장 수가 데이터 크기에 비례해 늘어나므로 테스트가 실패합니다.
+    """
+    counter = QueryCounter()
+    engines = {engine, read_engine}
+    for e in engines:
+        event.listen(e, "before_cursor_execute", counter)
+    yield counter
+    for e in engines:
+        event.remove(e, "before_cursor_execute", counter)
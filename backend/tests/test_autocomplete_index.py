@@ -0,0 +1,75 @@
+import uuid
+from datetime import datetime
+
+from backend import schemas
+from backend.database import SessionLocal
+from backend.services.impl.autocomplete_index import AutocompleteIndex
+from backend.services.impl.company import CompanyService
+
+
+def _build():
+    index = AutocompleteIndex()
+    index.build_from_rows([
+        (1, "ko", "주식회사 링크드코리아"),
+        (2, "ko", "스피링크"),
+        (3, "ko", "링크"),
+        (4, "ko", "링크드인코리아"),
+        (5, "en", "LinkedIn"),
+    ])
+    return index
+
+
+def _names(results):
+    return [r.company_name for r in results]
+
+
+def test_prefix_before_infix_and_shorter_first():
+    """
+    prefix 일치가 infix 일치보다 먼저, 같은 그룹 내에서는 짧은 이름이 먼저 나와야 합니다.
+    """
+    index = _build()
+    assert _names(index.search("링크", "ko")) == [
+        "링크",
+        "링크드인코리아",
+        "스피링크",
+        "주식회사 링크드코리아",
+    ]
+    assert _names(index.search("링크", "ko", limit=2)) == ["링크", "링크드인코리아"]
+
+
+def test_single_character_and_case_insensitive():
+    """
+    1글자 쿼리와 대소문자 무시(ILIKE) 검색이 가능해야 합니다.
+    """
+    index = _build()
+    assert _names(index.search("스", "ko")) == ["스피링크"]
+    assert _names(index.search("lINK", "en")) == ["LinkedIn"]
+    assert _names(index.search("link", "ja")) == []
+
+
+def test_incremental_add():
+    """
+    회사 생성 후 증분 반영된 이름이 검색되어야 합니다.
+    """
+    index = _build()
+    index.add_company_names(6, {"ko": "링크플로우", "en": None})
+    index.add_company_names(6, {"ko": "링크플로우"})
+    assert _names(index.search("플로", "ko")) == ["링크플로우"]
+
+
+def test_catch_up_adds_companies_created_after_build():
+    """
+    물려받은 인덱스는 catch_up 으로 빌드 이후 다른 프로세스에서 생성된 회사도 검색되어야 합니다.
+    """
+    index = AutocompleteIndex()
+    index.build_from_rows([])
+    index.built_at = datetime.utcnow()
+    suffix = uuid.uuid4().hex[:8]
+    with SessionLocal() as db:
+        CompanyService().create_company(db, schemas.CompanyCreateSchema(
+            company_name=schemas.CompanyNameSchema(ko=f"따라잡기_{suffix}", tw=f"追趕_{suffix}"), tags=[]
+        ), "ko")
+        assert index.search(suffix, "ko") == []
+        assert index.catch_up(db) >= 2
+    assert _names(index.search(f"따라잡기_{suffix}", "ko")) == [f"따라잡기_{suffix}"]
+    assert _names(index.search(suffix, "tw")) == [f"追趕_{suffix}"]
@@ -0,0 +1,54 @@
+import uuid
+
+from backend.routers.company import BATCH_MAX_COMPANIES
+
+
+def _company(ko=None, en=None, tags=()):
+    return {
+        "company_name": {"ko": ko, "en": en},
+        "tags": [{"tag_name": {"ko": f"{t}_ko", "en": f"{t}_en"}} for t in tags],
+    }
+
+
+def test_create_companies_statuses(api):
+    """
+    입력 순서대로 created / exists(이미 있는 회사명) / duplicate(같은 요청 안의 앞 항목과 이름이 겹침) /
+    invalid(회사명 없음) 를 반환하고, invalid 항목은 생성하지 않아야 합니다.
+    """
+    suffix = uuid.uuid4().hex[:8]
+    resp = api.post("/companies:batch", json=[
+        _company(ko=f"일괄회사_{suffix}", en=f"batch_{suffix}", tags=[f"일괄태그_{suffix}"]),
+        _company(en=f"batch_{suffix}"),
+        _company(),
+        _company(ko="", en=None),
+        _company(ko=f"일괄회사2_{suffix}"),
+    ], headers=[("x-wanted-language", "en")])
+    assert resp.status_code == 200
+    assert resp.json() == [
+        {"index": 0, "status": "created",
+         "company": {"company_name": f"batch_{suffix}", "tags": [f"일괄태그_{suffix}_en"]}},
+        {"index": 1, "status": "duplicate", "company": None},
+        {"index": 2, "status": "invalid", "company": None},
+        {"index": 3, "status": "invalid", "company": None},
+        {"index": 4, "status": "created", "company": {"company_name": f"일괄회사2_{suffix}", "tags": []}},
+    ]
+
+    resp = api.post("/companies:batch", json=[_company(ko=f"일괄회사_{suffix}")],
+                    headers=[("x-wanted-language", "ko")])
+    assert resp.json() == [{"index": 0, "status": "exists", "company": None}]
+    assert api.get(f"/companies/batch_{suffix}", headers=[("x-wanted-language", "ko")]).json() == {
+        "company_name": f"일괄회사_{suffix}", "tags": [f"일괄태그_{suffix}_ko"]
+    }
+
+
+def test_create_companies_batch_limit(api):
+    resp = api.post("/companies:batch", json=[_company(ko=f"c{i}") for i in range(BATCH_MAX_COMPANIES + 1)])
+    assert resp.status_code == 400
+
+
+def test_create_company_without_names(api):
+    """
+    회사명이 하나도 없는 회사 추가 요청은 아무것도 쓰지 않고 422 를 반환해야 합니다.
+    """
+    resp = api.post("/companies", json=_company(ko="", en=None), headers=[("x-wanted-language", "ko")])
+    assert resp.status_code == 422
@@ -0,0 +1,33 @@
+from backend.benchmarks.generate import generate_rows
+from backend.benchmarks.stats import percentile, summarize
+from backend.utils.init_db_from_csv import parse_row
+
+
+def test_generated_rows_are_loadable_and_deterministic():
+    """
+    생성된 행은 init_db_from_csv 형식으로 파싱되어야 하고(tw 포함), 같은 seed 면 같은 데이터가 나와야 합니다.
+    """
+    rows = list(generate_rows(companies=200, tags=50, tags_per_company=3, seed=1))
+    assert rows == list(generate_rows(companies=200, tags=50, tags_per_company=3, seed=1))
+
+    seen = set()
+    for row in rows:
+        company_names, tags = parse_row(row)
+        names = {name for name in company_names.values() if name}
+        assert names and not names & seen
+        seen |= names
+        assert 1 <= len(tags) <= 3
+        assert all(set(tag) == {"ko", "en", "ja", "tw"} for tag in tags)
+
+
+def test_summary_percentiles():
+    """
+    p50/p95/p99 는 nearest-rank 로 계산하고 ms 단위로 보고해야 합니다.
+    """
+    latencies = [i / 1000 for i in range(1, 101)]
+    assert percentile(sorted(latencies), 99) == 0.099
+    summary = summarize(latencies, elapsed=2.0, errors=1)
+    assert (summary["p50_ms"], summary["p95_ms"], summary["p99_ms"]) == (50.0, 95.0, 99.0)
+    assert summary["throughput_rps"] == 50.0
+    assert summary["errors"] == 1
+    assert summarize([], elapsed=1.0)["count"] == 0
@@ -0,0 +1,147 @@
+import csv
+import uuid
+
+from sqlalchemy import func
+
+from backend import models
+from backend.database import SessionLocal
+from backend.utils.bulk_load_from_csv import _dedup_key, _tag_name_owners, load
+
+FIELDS = ["company_ko", "company_en", "company_ja", "tag_ko", "tag_en", "tag_ja"]
+
+
+def _write_csv(path, suffix):
+    rows = []
+    for i in range(5):
+        tags = [t for t in range(3) if t <= i % 3]
+        rows.append({
+            "company_ko": f"적재회사_{suffix}_{i}", "company_en": f"load_company_{suffix}_{i}", "company_ja": "",
+            "tag_ko": "|".join(f"적재태그_{suffix}_{t}" for t in tags),
+            "tag_en": "|".join(f"load_tag_{suffix}_{t}" for t in tags),
+            "tag_ja": "",
+        })
+    # 같은 회사가 다른 chunk 에 다시 나오는 행 (태그 하나 추가)
+    rows.append({**rows[0], "tag_ko": f"적재태그_{suffix}_2", "tag_en": f"load_tag_{suffix}_2"})
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return len(rows)
+
+
+def _assert_loaded(suffix):
+    with SessionLocal() as db:
+        company_ids = [row.company_id for row in db.query(models.CompanyName.company_id).filter(
+            models.CompanyName.language_code == "ko", models.CompanyName.name.like(f"적재회사_{suffix}_%")
+        )]
+        assert len(company_ids) == len(set(company_ids)) == 5
+        tag_ids = {}
+        for row in db.query(models.TagName.tag_id, models.TagName.name).filter(
+                models.TagName.language_code == "ko", models.TagName.name.like(f"적재태그_{suffix}_%")):
+            tag_ids.setdefault(row.name, []).append(row.tag_id)
+        assert sorted(tag_ids) == [f"적재태그_{suffix}_{t}" for t in range(3)]
+        assert all(len(ids) == 1 for ids in tag_ids.values())
+
+        # 회사 0 은 두 행에 나오므로 태그 0, 2 를 가짐 → 태그별 회사 수 0: 5, 1: 3, 2: 2
+        expected = {0: 5, 1: 3, 2: 2}
+        for t, count in expected.items():
+            tag_id = tag_ids[f"적재태그_{suffix}_{t}"][0]
+            mapped = db.query(func.count()).select_from(models.CompanyTag).filter(
+                models.CompanyTag.tag_id == tag_id).scalar()
+            assert mapped == count
+            assert db.get(models.TagCount, tag_id).company_count == count
+
+
+def test_chunked_load_resume_and_reload_are_idempotent(tmp_path):
+    """
+    chunk 단위 적재 후 resume 으로 다시 실행하면 checkpoint 이후 행이 없어 아무것도 추가되지 않고,
+    checkpoint 없이 처음부터 다시 적재해도 기존 행과 중복 제거되어 회사/태그/매핑/태그별 회사 수가 그대로여야 합니다.
+    """
+    suffix = uuid.uuid4().hex[:8]
+    csv_path = tmp_path / "load.csv"
+    checkpoint = str(tmp_path / "load.checkpoint")
+    total = _write_csv(csv_path, suffix)
+
+    assert load(str(csv_path), chunk_size=2, checkpoint_path=checkpoint) == total
+    _assert_loaded(suffix)
+
+    assert load(str(csv_path), chunk_size=2, resume=True, checkpoint_path=checkpoint) == total
+    _assert_loaded(suffix)
+
+    assert load(str(csv_path), chunk_size=4, checkpoint_path=checkpoint) == total
+    _assert_loaded(suffix)
+
+
+def test_dedup_key_covers_tw_only_names():
+    assert _dedup_key({"ko": None, "en": "Wanted", "ja": None}) == ("en", "Wanted")
+    assert _dedup_key({"ko": "", "en": None, "ja": None, "tw": "台灣公司"}) == ("tw", "台灣公司")
+    assert _dedup_key({"ko": None, "en": "", "ja": None}) is None
+
+
+def test_load_tw_only_companies_and_tags(tmp_path):
+    """
+    tw 이름만 있는 회사는 빠지지 않고, tw 이름만 있는 태그는 이름마다 서로 다른 태그로 적재되어야 합니다.
+    """
+    suffix = uuid.uuid4().hex[:8]
+    csv_path = tmp_path / "tw.csv"
+    fields = FIELDS + ["company_tw", "tag_tw"]
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerow({**dict.fromkeys(fields, ""), "company_tw": f"台灣公司_{suffix}_1",
+                         "tag_tw": f"台標_{suffix}_a|台標_{suffix}_b"})
+        writer.writerow({**dict.fromkeys(fields, ""), "company_tw": f"台灣公司_{suffix}_2", "tag_tw": f"台標_{suffix}_b"})
+    load(str(csv_path), chunk_size=1, checkpoint_path=str(tmp_path / "tw.checkpoint"))
+
+    with SessionLocal() as db:
+        companies = dict(db.query(models.CompanyName.name, models.CompanyName.company_id).filter(
+            models.CompanyName.language_code == "tw", models.CompanyName.name.like(f"台灣公司_{suffix}_%")
+        ).all())
+        tags = dict(db.query(models.TagName.name, models.TagName.tag_id).filter(
+            models.TagName.language_code == "tw", models.TagName.name.like(f"台標_{suffix}_%")
+        ).all())
+        assert len(companies) == 2
+        assert len(set(tags.values())) == 2
+        mapped = {(row.company_id, row.tag_id) for row in db.query(models.CompanyTag).filter(
+            models.CompanyTag.company_id.in_(companies.values()))}
+        assert mapped == {
+            (companies[f"台灣公司_{suffix}_1"], tags[f"台標_{suffix}_a"]),
+            (companies[f"台灣公司_{suffix}_1"], tags[f"台標_{suffix}_b"]),
+            (companies[f"台灣公司_{suffix}_2"], tags[f"台標_{suffix}_b"]),
+        }
+        assert db.get(models.TagCount, tags[f"台標_{suffix}_b"]).company_count == 2
+
+
+def test_tag_name_owners_prefer_dedup_key():
+    """
+    새 태그끼리 (언어, 이름)이 겹치면 그 이름이 중복 제거 키인 태그가 가져야 합니다. (순서와 무관)
+    """
+    new_tags = {("ko", "비"): {"ko": "비", "en": "X"}, ("en", "X"): {"ko": None, "en": "X"}}
+    assert _tag_name_owners(new_tags) == {("ko", "비"): ("ko", "비"), ("en", "X"): ("en", "X")}
+    new_tags = {("ko", "가"): {"ko": "가", "en": "Y"}, ("ko", "나"): {"ko": "나", "en": "Y"}}
+    assert _tag_name_owners(new_tags)[("en", "Y")] == ("ko", "가")
+
+
+def test_load_colliding_tag_names_in_one_chunk(tmp_path):
+    """
+    한 chunk 의 새 태그가 다른 새 태그의 키 이름을 다른 언어로 가져도, 모든 태그가 자기 키 이름을 가져야 합니다.
+    """
+    suffix = uuid.uuid4().hex[:8]
+    csv_path = tmp_path / "collide.csv"
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerow({**dict.fromkeys(FIELDS, ""), "company_ko": f"충돌회사_{suffix}",
+                         "tag_ko": f"충돌태그_{suffix}|", "tag_en": f"clash_{suffix}|clash_{suffix}"})
+    load(str(csv_path), checkpoint_path=str(tmp_path / "collide.checkpoint"))
+
+    with SessionLocal() as db:
+        company_id = db.query(models.CompanyName.company_id).filter(
+            models.CompanyName.name == f"충돌회사_{suffix}").scalar()
+        tag_ids = [row.tag_id for row in db.query(models.CompanyTag.tag_id).filter(
+            models.CompanyTag.company_id == company_id)]
+        names = {(row.tag_id, row.language_code): row.name for row in db.query(models.TagName).filter(
+            models.TagName.tag_id.in_(tag_ids))}
+        assert len(tag_ids) == 2
+        assert sorted(names.values()) == sorted([f"충돌태그_{suffix}", f"clash_{suffix}"])
+        assert {tag_id for tag_id, _ in names} == set(tag_ids)
@@ -0,0 +1,146 @@
+from backend import models, schemas
+from backend.utils import util
+from backend.services.impl.catalog_snapshot import CatalogSnapshot, CatalogSnapshotHolder
+from backend.services.impl.snapshot_company import SnapshotCompanyService
+from backend.utils.tag_query import parse_tag_query
+
+
+def _build():
+    return CatalogSnapshot(
+        company_ids=[3, 1, 2],
+        tag_ids=[10, 11, 12],
+        company_names=[
+            (1, "ko", "원티드랩"),
+            (1, "en", "Wantedlab"),
+            (2, "en", "Linked"),
+            (3, "ja", "テスト"),
+            (3, "ko", "원티드랩"),  # 중복 이름은 먼저 등록된 회사(1)로 조회
+        ],
+        tag_names=[
+            (10, "ko", "태그_4"),
+            (10, "en", "tag_4"),
+            (11, "ko", "태그_16"),
+            (12, "en", "tag_20"),
+        ],
+        company_tags=[(1, 10), (1, 11), (2, 10), (3, 10), (3, 12), (3, 12)],
+    )
+
+
+def _names(page):
+    return [item.company_name for item in page.items]
+
+
+def test_get_company_localized_with_fallback():
+    """
+    언어 이름이 없으면 먼저 등록된 이름을 쓰고, 태그명은 중복 제거 후 정렬되어야 합니다.
+    """
+    snapshot = _build()
+    assert snapshot.get_company("Wantedlab", "ko") == schemas.CompanyResponseSchema(
+        company_name="원티드랩", tags=["태그_16", "태그_4"]
+    )
+    assert snapshot.get_company("원티드랩", "en").company_name == "Wantedlab"
+    assert snapshot.get_company("テスト", "ko").tags == ["tag_20", "태그_4"]
+    assert snapshot.get_company("없는회사", "ko") is None
+
+
+def test_language_fallback_chain(monkeypatch):
+    """
+    요청 언어 이름이 없으면 설정된 fallback 순서로 고르고, 체인에 없으면 가장 먼저 등록된 이름을 써야 합니다.
+    (스냅샷과 get_localized_name 이 같은 규칙)
+    """
+    monkeypatch.setitem(util.LANGUAGE_PRIORITIES, "tw", ("tw", "ko", "en"))
+    snapshot = _build()
+    assert snapshot.get_company("テスト", "tw").company_name == "원티드랩"
+    assert snapshot.get_company("Linked", "tw").company_name == "Linked"
+    assert snapshot.get_company("テスト", "en").company_name == "テスト"
+
+    names = [models.CompanyName(language_code="ja", name="テスト"), models.CompanyName(language_code="ko", name="원티드랩")]
+    assert util.get_localized_name(names, "tw") == "원티드랩"
+    assert util.get_localized_name(names, "en") == "テスト"
+    assert util.get_localized_name(names, "ja") == "テスト"
+
+
+def test_search_by_tag_page_keyset():
+    """
+    태그 부분 일치 결과가 company_id 순이고 cursor/limit 로 이어서 조회할 수 있어야 합니다.
+    """
+    snapshot = _build()
+    first = snapshot.search_by_tag_page("tag_", "ko", limit=2)
+    assert _names(first) == ["원티드랩", "Linked"]
+    assert first.next_cursor == 2
+    second = snapshot.search_by_tag_page("tag_", "ko", limit=2, cursor=first.next_cursor)
+    assert _names(second) == ["원티드랩"]
+    assert second.next_cursor is None
+    assert _names(snapshot.search_by_tag_page("_16", "en")) == ["Wantedlab"]
+    # DB 의 LIKE 와 같이 대소문자를 구분
+    assert _names(snapshot.search_by_tag_page("TAG", "ko")) == []
+
+
+def test_posting_intersection_and_union():
+    snapshot = _build()
+    tag = {tag_id: index for index, tag_id in enumerate(snapshot.tag_ids)}
+    assert snapshot.companies_with_all([tag[10], tag[12]]) == [2]
+    assert snapshot.companies_with_all([tag[11], tag[12]]) == []
+    assert snapshot.companies_with_any([tag[11], tag[12]]) == [0, 2]
+
+
+class _StubService:
+    def __init__(self):
+        self.calls = []
+
+    def get_company(self, db, company_name, lang):
+        self.calls.append("get_company")
+        return None
+
+    def lookup_companies(self, db, company_names, lang):
+        self.calls.append(("lookup_companies", company_names))
+        return [schemas.CompanyLookupResultSchema(
+            query=name, company=schemas.CompanyResponseSchema(company_name=name, tags=[]) if name == "새회사" else None
+        ) for name in company_names]
+
+    def create_company(self, db, company, lang):
+        return schemas.CompanyResponseSchema(company_name="x", tags=[])
+
+
+def test_service_uses_snapshot_when_ready():
+    """
+    스냅샷이 없거나 스냅샷에 없는 회사면 감싼 서비스로 위임하고, 쓰기 성공 시 재빌드를 예약해야 합니다.
+    """
+    stub = _StubService()
+    holder = CatalogSnapshotHolder()
+    service = SnapshotCompanyService(stub, holder)
+    assert service.get_company(None, "원티드랩", "ko") is None
+    assert stub.calls == ["get_company"]
+
+    holder.snapshot = _build()
+    assert service.get_company(None, "원티드랩", "ko").company_name == "원티드랩"
+    assert stub.calls == ["get_company"]
+    # 스냅샷에 없는 회사(재빌드 전에 생성된 회사일 수 있음)는 감싼 서비스로 다시 조회
+    assert service.get_company(None, "방금만든회사", "ko") is None
+    assert stub.calls == ["get_company", "get_company"]
+
+    results = service.lookup_companies(None, ["새회사", "원티드랩", "없는회사"], "ko")
+    assert [(r.query, r.company and r.company.company_name) for r in results] == [
+        ("새회사", "새회사"), ("원티드랩", "원티드랩"), ("없는회사", None)
+    ]
+    assert stub.calls[-1] == ("lookup_companies", ["새회사", "없는회사"])
+
+    assert not holder._dirty.is_set()
+    service.create_company(None, None, "ko")
+    assert holder._dirty.is_set()
+    assert holder.stats()["companies"] == 3
+
+
+def test_boolean_tag_search():
+    """
+    AND/OR/NOT 그룹을 posting 교집합/합집합으로 평가하고 일치 태그 수를 채워야 합니다.
+    """
+    snapshot = _build()
+    page = snapshot.search_by_tags(parse_tag_query("tag_4 AND tag_20"), "en")
+    assert [(item.company_name, item.matched_tags) for item in page.items] == [("テスト", 2)]
+    page = snapshot.search_by_tags(parse_tag_query("tag_4 NOT tag_20 OR 태그_16"), "en", limit=1)
+    assert [(item.company_name, item.matched_tags) for item in page.items] == [("Wantedlab", 2)]
+    assert page.next_cursor == 1
+    page = snapshot.search_by_tags(parse_tag_query("tag_4 NOT tag_20 OR 태그_16"), "en", cursor=1)
+    assert [(item.company_name, item.matched_tags) for item in page.items] == [("Linked", 1)]
+    assert snapshot.search_by_tags(parse_tag_query("없는태그 OR tag_20"), "ko").items[0].matched_tags == 1
@@ -0,0 +1,91 @@
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func
+
+from backend import models, schemas
+from backend.database import SessionLocal
+from backend.services.impl.company import CompanyService
+from backend.services.impl.name_cache import tag_name_cache
+
+WRITERS = 8
+
+
+def _run_parallel(func, args_list):
+    """모든 writer 가 동시에 시작하도록 barrier 로 맞춰 실행하고 결과(또는 예외)를 모은다"""
+    barrier = threading.Barrier(len(args_list))
+
+    def run(args):
+        barrier.wait()
+        with SessionLocal() as db:
+            return func(db, *args)
+
+    with ThreadPoolExecutor(max_workers=len(args_list)) as pool:
+        return list(pool.map(run, args_list))
+
+
+def _company_names(count):
+    with SessionLocal() as db:
+        return [row.name for row in db.query(models.CompanyName.name).filter(
+            models.CompanyName.language_code == "ko"
+        ).order_by(models.CompanyName.company_id).limit(count)]
+
+
+def _tag(suffix):
+    return schemas.TagCreateSchema(tag_name=schemas.TagNameSchema(ko=f"동시태그_{suffix}", en=f"concurrent_{suffix}"))
+
+
+def test_parallel_writers_create_one_tag():
+    """
+    여러 요청이 같은 새 태그를 동시에 여러 회사에 추가해도 오류 없이 태그는 하나만 생기고,
+    모든 회사에 연결되며 태그별 회사 수가 정확해야 합니다.
+    """
+    suffix = uuid.uuid4().hex[:8]
+    companies = _company_names(WRITERS)
+    with SessionLocal() as db:
+        max_tag_id = db.query(func.max(models.Tag.id)).scalar() or 0
+    service = CompanyService()
+    results = _run_parallel(
+        lambda db, name: service.add_tags_to_company(db, name, [_tag(suffix)], "ko"),
+        [(name,) for name in companies]
+    )
+    assert all(f"동시태그_{suffix}" in result.tags for result in results)
+
+    with SessionLocal() as db:
+        tag_ids = {row.tag_id for row in db.query(models.TagName.tag_id).filter(
+            models.TagName.name.in_([f"동시태그_{suffix}", f"concurrent_{suffix}"])
+        )}
+        assert len(tag_ids) == 1
+        tag_id = tag_ids.pop()
+        assert db.query(models.CompanyTag).filter_by(tag_id=tag_id).count() == len(companies)
+        assert db.get(models.TagCount, tag_id).company_count == len(companies)
+        # 진 쪽이 미리 만든 tags 행은 남지 않아야 함
+        assert db.query(models.Tag).outerjoin(models.TagName).filter(
+            models.Tag.id > max_tag_id, models.TagName.id.is_(None)
+        ).count() == 0
+
+
+def test_parallel_writers_same_company_are_idempotent():
+    """
+    같은 회사에 같은 태그를 동시에 추가/삭제해도 unique 위반 없이 매핑은 하나이고 카운터가 맞아야 합니다.
+    """
+    suffix = uuid.uuid4().hex[:8]
+    company = _company_names(1)[0]
+    service = CompanyService()
+    _run_parallel(
+        lambda db, name: service.add_tags_to_company(db, name, [_tag(suffix), _tag(suffix)], "ko"),
+        [(company,)] * WRITERS
+    )
+    with SessionLocal() as db:
+        tag_id = tag_name_cache.resolve(db, f"동시태그_{suffix}")
+        assert db.query(models.CompanyTag).filter_by(tag_id=tag_id).count() == 1
+        assert db.get(models.TagCount, tag_id).company_count == 1
+
+    _run_parallel(
+        lambda db, name: service.delete_tag_from_company(db, name, f"동시태그_{suffix}", "ko"),
+        [(company,)] * WRITERS
+    )
+    with SessionLocal() as db:
+        assert db.query(models.CompanyTag).filter_by(tag_id=tag_id).count() == 0
+        assert db.get(models.TagCount, tag_id).company_count == 0
@@ -0,0 +1,30 @@
+from datetime import datetime, timedelta, timezone
+
+from backend.services.impl.export import _build_records, to_utc_naive
+
+
+def test_build_records_groups_names_and_tags_per_company():
+    """
+    batch 단위로 조회한 회사명/태그명 행을 회사별 레코드로 묶고, 이름/태그가 없는 회사도 내보내야 합니다.
+    """
+    updated_at = datetime(2024, 1, 1)
+    records = _build_records(
+        [(1, updated_at), (2, updated_at)],
+        [(1, "ko", "원티드랩"), (1, "en", "Wantedlab")],
+        [(1, 10, "ko", "태그_4"), (1, 10, "en", "tag_4"), (1, 11, "ko", "태그_9")],
+    )
+    assert [r.model_dump() for r in records] == [
+        {"id": 1, "names": {"ko": "원티드랩", "en": "Wantedlab"}, "updated_at": updated_at,
+         "tags": [{"id": 10, "names": {"ko": "태그_4", "en": "tag_4"}}, {"id": 11, "names": {"ko": "태그_9"}}]},
+        {"id": 2, "names": {}, "updated_at": updated_at, "tags": []},
+    ]
+
+
+def test_updated_since_is_compared_in_utc():
+    """
+    timezone 이 있는 updated_since 는 UTC naive 로 변환되어야 합니다. (updated_at 은 utcnow 로 저장)
+    """
+    kst = timezone(timedelta(hours=9))
+    assert to_utc_naive(datetime(2024, 1, 1, 9, tzinfo=kst)) == datetime(2024, 1, 1, 0)
+    assert to_utc_naive(datetime(2024, 1, 1, 9)) == datetime(2024, 1, 1, 9)
+    assert to_utc_naive(None) is None
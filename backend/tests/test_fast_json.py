@@ -0,0 +1,55 @@
+from typing import List
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from backend import schemas
+from backend.benchmarks.serialize_bench import make_rows
+from backend.utils import fast_json
+from backend.utils.fast_json import dump_models, list_response, rows_to_models
+
+
+def test_rows_to_models_and_dump():
+    """
+    SQL 행은 컬럼 label 로 스키마 필드에 매핑되고(나머지 컬럼은 무시), exclude_none 이면 None 필드를 빼고 직렬화해야 합니다.
+    """
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        rows = conn.execute(text(
+            "SELECT 1 AS company_id, '원티드랩' AS company_name, NULL AS matched_tags "
+            "UNION ALL SELECT 2, 'Wanted Lab', 3"
+        )).all()
+    items = rows_to_models(schemas.TagSearchResponseSchema, rows)
+    assert items == [
+        schemas.TagSearchResponseSchema(company_name="원티드랩"),
+        schemas.TagSearchResponseSchema(company_name="Wanted Lab", matched_tags=3),
+    ]
+    assert rows_to_models(schemas.TagSearchResponseSchema, []) == []
+    expected = '[{"company_name":"원티드랩"},{"company_name":"Wanted Lab","matched_tags":3}]'.encode()
+    assert dump_models(schemas.TagSearchResponseSchema, items, exclude_none=True) == expected
+    # 검증을 켜면 행도 그대로 받는다
+    assert dump_models(schemas.TagSearchResponseSchema, rows, exclude_none=True, validate=True) == expected
+
+
+def test_list_response_matches_response_model(monkeypatch):
+    """
+    FAST_JSON_ENABLED 이면 response_model 경로와 같은 본문을 내고, 주입된 response 의 헤더도 유지해야 합니다.
+    """
+    app = FastAPI()
+    items = rows_to_models(schemas.TagSearchResponseSchema, make_rows(3, matched_tags=2))
+
+    @app.get("/tags", response_model=List[schemas.TagSearchResponseSchema], response_model_exclude_none=True)
+    def tags(response: Response):
+        response.headers["X-Next-Cursor"] = "3"
+        return list_response(schemas.TagSearchResponseSchema, items, response, exclude_none=True)
+
+    client = TestClient(app)
+    default = client.get("/tags")
+    monkeypatch.setattr(fast_json, "FAST_JSON_ENABLED", True)
+    fast = client.get("/tags")
+    assert fast.json() == default.json() == [
+        {"company_name": f"벤치회사_{i}", "matched_tags": 2} for i in (1, 2, 3)
+    ]
+    assert fast.headers["X-Next-Cursor"] == default.headers["X-Next-Cursor"] == "3"
+    assert fast.headers["content-type"] == "application/json"
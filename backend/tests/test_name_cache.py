@@ -0,0 +1,64 @@
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, event
+from sqlalchemy.orm import Session, declarative_base
+
+from backend.services.impl.name_cache import NameResolutionCache
+
+Base = declarative_base()
+
+
+class Name(Base):
+    __tablename__ = "names"
+    id = Column(Integer, primary_key=True)
+    owner_id = Column(Integer, nullable=False)
+    name = Column(String, nullable=False)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([
+            Name(id=1, owner_id=10, name="원티드랩"),
+            Name(id=2, owner_id=10, name="Wantedlab"),
+            Name(id=3, owner_id=20, name="tag_1"),
+            Name(id=4, owner_id=30, name="tag_1"),
+        ])
+        session.commit()
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        session.statements = statements
+        yield session
+
+
+def test_resolve_many_single_query_then_cached(db):
+    """
+    캐시에 없는 이름들은 쿼리 한 번으로 채우고, 이후 조회는 쿼리 없이 캐시에서 응답해야 합니다.
+    같은 이름이 여러 개면 먼저 등록된 id 를 사용합니다.
+    """
+    cache = NameResolutionCache(Name, "owner_id")
+    assert cache.resolve_many(db, ["원티드랩", "Wantedlab", "tag_1", "없음"]) == {
+        "원티드랩": 10, "Wantedlab": 10, "tag_1": 20,
+    }
+    assert len(db.statements) == 1
+    assert cache.resolve(db, "tag_1") == 20
+    assert len(db.statements) == 1
+    # 없는 이름은 캐시하지 않음
+    assert cache.resolve(db, "없음") is None
+    assert len(db.statements) == 2
+
+
+def test_bounded_and_invalidate(db):
+    """
+    최대 크기를 넘으면 오래된 항목이 제거되고, 무효화된 이름은 다시 DB 에서 조회해야 합니다.
+    """
+    cache = NameResolutionCache(Name, "owner_id", max_size=2)
+    for name in ["원티드랩", "Wantedlab", "tag_1"]:
+        cache.resolve(db, name)
+    assert cache.stats()["size"] == 2
+    assert cache.get("원티드랩") is None
+
+    cache.invalidate(["tag_1"])
+    assert cache.get("tag_1") is None
+    assert cache.resolve(db, "tag_1") == 20
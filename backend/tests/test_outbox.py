@@ -0,0 +1,92 @@
+import json
+from datetime import datetime
+
+from backend import schemas
+from backend.services.impl.autocomplete_index import AutocompleteIndex
+from backend.services.impl.outbox import COMPANY_CREATED, TAG_REMOVED, TAGS_ADDED, change
+from backend.services.impl.outbox_sinks import CacheInvalidationSink, NdjsonFileSink, SearchIndexSink
+
+
+def _event(event_id, kind, company_id, tag_ids=()):
+    return schemas.ChangeEventSchema(
+        id=event_id, kind=kind, company_id=company_id, tag_ids=list(tag_ids), languages=["ko"],
+        created_at=datetime(2024, 1, 1),
+    )
+
+
+class _NamesDb:
+    """company_names 조회 결과만 돌려주는 세션 대용"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute(self, statement):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+def _record(company_id, names, tags):
+    return schemas.ExportCompanySchema(
+        id=company_id, names=names,
+        tags=[schemas.ExportTagSchema(id=tag_id, names=tag_names) for tag_id, tag_names in tags],
+        updated_at=datetime(2024, 1, 1),
+    )
+
+
+def test_change_dedups_tags_and_languages():
+    assert change(COMPANY_CREATED, 1, [3, 2, 3], ["ko", "en", "ko"]) == {
+        "kind": COMPANY_CREATED, "company_id": 1, "tag_ids": [2, 3], "languages": ["en", "ko"]
+    }
+
+
+def test_ndjson_sink_appends_events(tmp_path):
+    """
+    이벤트는 id 순으로 한 줄씩 이어 쓰여야 합니다.
+    """
+    path = tmp_path / "events.ndjson"
+    sink = NdjsonFileSink(str(path))
+    sink.handle(None, [_event(1, COMPANY_CREATED, 10, [4])])
+    sink.handle(None, [_event(2, TAG_REMOVED, 10, [4]), _event(3, COMPANY_CREATED, 11)])
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [line["id"] for line in lines] == [1, 2, 3]
+    assert lines[1]["kind"] == TAG_REMOVED and lines[1]["tag_ids"] == [4]
+    assert sink.stats() == {"written": 3}
+
+
+def test_search_index_sink_reindexes_changed_companies():
+    """
+    바뀐 회사만 다시 색인하고, 이전 토큰은 지워지며 없어진 회사는 색인에서 빠져야 합니다.
+    """
+    sink = SearchIndexSink()
+    sink.apply([1, 2], [
+        _record(1, {"ko": "원티드랩", "en": "Wanted Lab"}, [(4, {"ko": "태그_4", "en": "tag_4"})]),
+        _record(2, {"en": "Linked Lab"}, [(4, {"en": "tag_4"})]),
+    ])
+    assert sink.search("lab") == [1, 2]
+    assert sink.search("wanted TAG_4") == [1]
+
+    # 회사 1 의 태그 삭제, 회사 2 는 삭제됨
+    sink.apply([1, 2], [_record(1, {"ko": "원티드랩", "en": "Wanted Lab"}, [])])
+    assert sink.search("tag_4") == []
+    assert sink.search("lab") == [1]
+    assert "linked" not in sink.postings
+    assert sink.stats() == {"documents": 1, "tokens": 3, "reindexed": 4}
+
+
+def test_cache_sink_adds_created_companies_to_autocomplete_index():
+    """
+    다른 worker 에서 생성된 회사의 이벤트를 받으면 자동완성 인덱스에서 그 회사명이 검색되어야 합니다. (생성 이벤트만 추가)
+    """
+    index = AutocompleteIndex()
+    index.build_from_rows([(1, "ko", "원티드랩")])
+    sink = CacheInvalidationSink(index=index)
+    assert index.search("링크", "ko") == []
+
+    sink.handle(_NamesDb([(1, "ko", "원티드랩"), (2, "ko", "링크드랩"), (2, "en", "Linked Lab")]), [
+        _event(1, TAGS_ADDED, 1, [4]), _event(2, COMPANY_CREATED, 2),
+    ])
+    assert [item.company_name for item in index.search("랩", "ko")] == ["링크드랩", "원티드랩"]
+    assert [item.company_name for item in index.search("linked", "en")] == ["Linked Lab"]
+    assert sink.stats() == {"invalidated_keys": 0, "indexed_companies": 1}
@@ -0,0 +1,121 @@
+def test_autocomplete_query_count(api, count_queries):
+    """
+    자동완성은 결과 수와 무관하게 1개의 SQL 문으로 처리되어야 합니다.
+    """
+    resp = api.get("/search?query=a", headers=[("x-wanted-language", "en")])
+    assert resp.status_code == 200
+    assert count_queries.count <= 1, count_queries.statements
+
+
+def test_get_company_query_count(api, count_queries):
+    """
+    회사 조회는 태그 수와 무관하게 일정한 수의 SQL 문으로 처리되어야 합니다.
+    (회사 + 회사명 + 회사-태그 매핑 + 태그 + 태그명)
+    """
+    resp = api.get("/companies/COVENANT", headers=[("x-wanted-language", "ko")])
+    assert resp.status_code == 200
+    assert count_queries.count <= 5, count_queries.statements
+
+
+def test_search_by_tag_query_count(api, count_queries):
+    """
+    태그 검색은 매칭되는 회사 수와 무관하게 일정한 수의 SQL 문으로 처리되어야 합니다.
+    """
+    resp = api.get("/tags?query=tag_1", headers=[("x-wanted-language", "ko")])
+    assert resp.status_code == 200
+    assert len(resp.json()) > 5
+    assert count_queries.count <= 1, count_queries.statements
+
+
+def test_get_company_read_model_query_count(api, count_queries, monkeypatch):
+    """
+    read model 사용 시 회사 조회는 원본 테이블 조회와 같은 응답을 SQL 문 1개로 반환해야 합니다.
+    """
+    from backend.services.impl import company as company_impl
+    headers = [("x-wanted-language", "en")]
+    expected = api.get("/companies/COVENANT", headers=headers).json()
+
+    monkeypatch.setattr(company_impl, "READ_MODEL_ENABLED", True)
+    count_queries.reset()
+    resp = api.get("/companies/COVENANT", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json() == expected
+    assert count_queries.count <= 1, count_queries.statements
+
+
+def test_export_query_count(api, count_queries):
+    """
+    export 는 회사 수와 무관하게 batch 당 일정한 수의 SQL 문(회사 cursor + 회사명 + 태그명)으로 처리되어야 합니다.
+    """
+    resp = api.get("/export")
+    assert resp.status_code == 200
+    lines = resp.text.splitlines()
+    assert len(lines) > 5
+    assert "X-Export-Watermark" in resp.headers
+    assert count_queries.count <= 4, count_queries.statements
+
+
+def test_fuzzy_autocomplete_is_ranked_and_bounded(api, count_queries):
+    """
+    mode=fuzzy 는 오타가 있어도 후보를 찾고, 상위 K 개만 (임계값 설정 + 조회) 2개의 SQL 문으로 반환해야 합니다.
+    """
+    resp = api.get("/search?query=COVENAMT&mode=fuzzy&limit=3", headers=[("x-wanted-language", "en")])
+    assert resp.status_code == 200
+    names = [item["company_name"] for item in resp.json()]
+    assert names[0] == "COVENANT"
+    assert len(names) <= 3
+    assert count_queries.count <= 2, count_queries.statements
+
+
+def test_boolean_tag_search(api, count_queries):
+    """
+    mode=boolean 은 AND 결과가 OR 결과의 부분집합이고, 일치 태그 수와 함께
+    (태그명 → id + GROUP BY/HAVING 조회) 2개 이하의 SQL 문으로 반환해야 합니다.
+    """
+    headers = [("x-wanted-language", "en")]
+    both = api.get("/tags", params={"query": "tag_16 AND tag_4", "mode": "boolean"}, headers=headers).json()
+    either = api.get("/tags", params={"query": "tag_16 OR tag_4", "mode": "boolean"}, headers=headers).json()
+    assert {item["company_name"] for item in both} <= {item["company_name"] for item in either}
+    assert all(item["matched_tags"] == 2 for item in both)
+    assert all(item["matched_tags"] in (1, 2) for item in either)
+
+    count_queries.reset()
+    resp = api.get("/tags", params={"query": "tag_16 NOT tag_4", "mode": "boolean", "limit": 2}, headers=headers)
+    assert resp.status_code == 200
+    assert all(item["matched_tags"] == 1 for item in resp.json())
+    assert count_queries.count <= 2, count_queries.statements
+
+    resp = api.get("/tags", params={"query": "NOT tag_4", "mode": "boolean"}, headers=headers)
+    assert resp.status_code == 400
+
+
+def test_tag_facets_use_counter(api, count_queries):
+    """
+    필터 없는 facet 은 tag_counts 카운터 1개의 SQL 문으로 조회하고,
+    카운터 값은 실제 태그 검색 결과 수 및 필터(함께 가진 태그) 집계와 같아야 합니다.
+    """
+    headers = [("x-wanted-language", "en")]
+    facets = api.get("/tags/facets", params={"limit": 1000}, headers=headers).json()
+    assert count_queries.count <= 1, count_queries.statements
+    counts = {facet["tag_name"]: facet["company_count"] for facet in facets}
+    companies = api.get("/tags", params={"query": "tag_16", "mode": "boolean"}, headers=headers).json()
+    assert counts["tag_16"] == len(companies)
+
+    filtered = api.get("/tags/facets", params={"tag": "tag_16", "limit": 1000}, headers=headers).json()
+    assert {"tag_name": "tag_16", "company_count": len(companies)} in filtered
+
+
+def test_lookup_companies_single_query(api, count_queries):
+    """
+    여러 회사명 조회는 이름 수와 무관하게 SQL 문 1개로, 회사별 조회와 같은 응답을 요청 순서대로 반환해야 합니다.
+    """
+    headers = [("x-wanted-language", "tw")]
+    names = ["COVENANT", "원티드랩", "없는회사", "COVENANT"]
+    resp = api.post("/companies:lookup", json=names, headers=headers)
+    assert resp.status_code == 200
+    assert count_queries.count <= 1, count_queries.statements
+    results = resp.json()
+    assert [item["query"] for item in results] == names
+    assert results[2]["company"] is None
+    for item in results[:2]:
+        assert item["company"] == api.get(f"/companies/{item['query']}", headers=headers).json()
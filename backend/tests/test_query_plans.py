@@ -0,0 +1,78 @@
+import warnings
+
+import pytest
+
+from backend.benchmarks.plans import check_case, diff_shapes, summarize_plan
+from backend.utils.util import get_env_bool
+
+# 합성 데이터를 적재하므로 버릴 수 있는 DB 에서만 실행 (CI 의 plan 단계에서 PLAN_REGRESSION_ENABLED=true)
+PLAN_REGRESSION_ENABLED = get_env_bool("PLAN_REGRESSION_ENABLED")
+# baseline 이 없는 케이스는 현재 계획으로 기록 (CI 의 plan 단계에서 true, 기록된 파일은 artifact 로 받아 커밋)
+PLAN_BASELINE_BOOTSTRAP = get_env_bool("PLAN_BASELINE_BOOTSTRAP")
+
+_PLAN = [{
+    "Plan": {
+        "Node Type": "Limit", "Actual Rows": 3, "Actual Loops": 1, "Shared Hit Blocks": 40, "Shared Read Blocks": 2,
+        "Plans": [{
+            "Node Type": "Nested Loop", "Actual Rows": 3, "Actual Loops": 1,
+            "Plans": [
+                {"Node Type": "Seq Scan", "Relation Name": "tag_names", "Actual Rows": 2, "Actual Loops": 1,
+                 "Rows Removed by Filter": 4998},
+                {"Node Type": "Index Only Scan", "Relation Name": "company_tags",
+                 "Index Name": "idx_company_tags_tag_company", "Actual Rows": 2, "Actual Loops": 2},
+            ],
+        }],
+    },
+    "Execution Time": 1.5,
+}]
+
+
+def test_summarize_and_check_plan():
+    """
+    계획 요약은 트리 모양/사용 인덱스/Seq Scan 이 읽은 행 수/버퍼를 담고,
+    예산을 넘거나 기대 인덱스가 없으면 위반으로 보고해야 합니다.
+    """
+    summary = summarize_plan(_PLAN)
+    assert summary["shape"] == [
+        "Limit",
+        "  Nested Loop",
+        "    Seq Scan on tag_names",
+        "    Index Only Scan on company_tags using idx_company_tags_tag_company",
+    ]
+    assert summary["indexes"] == ["idx_company_tags_tag_company"]
+    assert summary["seq_scans"] == [{"relation": "tag_names", "rows": 5000}]
+    assert (summary["buffers"], summary["rows"]) == (42, 3)
+
+    expectation = {"indexes": ["idx_company_tags_tag_company"], "max_buffers": 100, "max_rows": 10}
+    assert check_case([summary], expectation, max_seq_scan_rows=5000) == []
+    errors = check_case([summary], {**expectation, "indexes": ["idx_tag_names_name_trgm"], "max_buffers": 10},
+                        max_seq_scan_rows=1000)
+    assert len(errors) == 3
+    assert "seq scan on tag_names read 5000 rows" in errors[1]
+
+
+def test_diff_shapes():
+    shape = summarize_plan(_PLAN)["shape"]
+    assert diff_shapes([shape], [shape]) == []
+    changed = [line.replace("Seq Scan on tag_names", "Bitmap Heap Scan on tag_names") for line in shape]
+    diff = diff_shapes([shape], [changed])
+    assert "-    Seq Scan on tag_names" in diff and "+    Bitmap Heap Scan on tag_names" in diff
+
+
+@pytest.mark.skipif(not PLAN_REGRESSION_ENABLED, reason="PLAN_REGRESSION_ENABLED 가 아니면 건너뜀")
+def test_service_query_plans():
+    """
+    합성 데이터에서 서비스 쿼리가 기대 인덱스를 쓰고, 큰 Seq Scan 없이 예산 이내이며, baseline 과 계획 모양이 같아야 합니다.
+    """
+    from backend.benchmarks import plans
+    from backend.database import SessionLocal
+
+    with SessionLocal() as db:
+        plans.seed(db)
+    report = plans.run(bootstrap=PLAN_BASELINE_BOOTSTRAP)
+    bootstrapped = [name for name, result in report.items() if result["bootstrapped"]]
+    if bootstrapped:
+        warnings.warn(f"plan baselines recorded for {bootstrapped} in {plans.PLAN_BASELINE_PATH}; commit the file")
+    failures = {name: result["errors"] + result["diff"] for name, result in report.items()
+                if result["errors"] or result["diff"]}
+    assert not failures, failures
@@ -0,0 +1,91 @@
+import logging
+import sqlite3
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from backend.utils import request_metrics
+from backend.utils.metrics import Histogram
+from backend.utils.pool_metrics import PoolMetrics, instrumented_pool_class
+from backend.utils.request_metrics import (
+    RequestMetricsMiddleware, TimedJSONResponse, install_serialization_timer, install_sql_hooks
+)
+
+
+def _app(engine):
+    install_sql_hooks(engine)
+    install_serialization_timer()
+    app = FastAPI(default_response_class=TimedJSONResponse)
+    app.add_middleware(RequestMetricsMiddleware)
+
+    @app.get("/items/{name}")
+    def item(name: str):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT :name"), {"name": name})
+        return {"name": name}
+
+    return app
+
+
+def test_records_route_language_statements_and_slow_queries(monkeypatch, caplog):
+    """
+    라우트 템플릿/언어별로 요청 수, SQL 문 수가 기록되고, 느린 쿼리는 bound parameter 와 함께 로그에 남아야 합니다.
+    """
+    engine = create_engine("sqlite://")
+    client = TestClient(_app(engine))
+    labels = ("/items/{name}", "GET", "en")
+    before = request_metrics.request_statements.count(*labels)
+
+    monkeypatch.setattr(request_metrics, "SLOW_QUERY_MS", 0)
+    with caplog.at_level(logging.WARNING, logger=request_metrics.__name__):
+        resp = client.get("/items/abc", headers={"x-wanted-language": "en"})
+    assert resp.status_code == 200
+
+    assert request_metrics.request_statements.count(*labels) == before + 1
+    assert request_metrics.requests_total.value(*labels, "200") >= 1
+    assert request_metrics.slow_queries_total.value("/items/{name}") >= 2
+    assert any("abc" in record.getMessage() and "/items/{name}" in record.getMessage() for record in caplog.records)
+
+    body = request_metrics.render_metrics()
+    assert 'http_request_sql_statements_bucket{route="/items/{name}",method="GET",lang="en",le="2.0"}' in body
+    assert "# TYPE http_request_serialize_seconds histogram" in body
+
+
+def test_histogram_exposition_is_cumulative():
+    """
+    Prometheus 히스토그램 버킷은 누적 개수로, +Inf 버킷은 전체 개수로 출력되어야 합니다.
+    """
+    histogram = Histogram("demo_seconds", "demo", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 5.0):
+        histogram.observe(value, "/a")
+    assert histogram.render()[2:] == [
+        'demo_seconds_bucket{route="/a",le="0.1"} 1',
+        'demo_seconds_bucket{route="/a",le="1.0"} 2',
+        'demo_seconds_bucket{route="/a",le="+Inf"} 3',
+        'demo_seconds_sum{route="/a"} 5.55',
+        'demo_seconds_count{route="/a"} 3',
+    ]
+
+
+def test_pool_wait_excludes_connect_time(tmp_path):
+    """
+    새 커넥션을 여는 시간은 checkout 대기 시간이 아니라 연결 시간으로 따로 기록되어야 합니다.
+    """
+    def slow_connect():
+        time.sleep(0.05)
+        return sqlite3.connect(str(tmp_path / "pool.db"), check_same_thread=False)
+
+    metrics = PoolMetrics("test")
+    engine = create_engine("sqlite://", creator=slow_connect, pool_size=1, max_overflow=0,
+                           poolclass=instrumented_pool_class(QueuePool, metrics))
+    for _ in range(2):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    stats = metrics.snapshot(engine.pool)
+    assert (stats["checkouts"], stats["connects"]) == (2, 1)
+    assert stats["connect_seconds_total"] >= 0.05
+    assert stats["wait_seconds_max"] < 0.05
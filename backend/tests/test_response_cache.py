@@ -0,0 +1,187 @@
+import fnmatch
+import time
+
+import pytest
+
+from backend import schemas
+from backend.services.impl import cache as cache_module
+from backend.services.impl.cache import LRUCacheBackend, RedisCacheBackend, build_cache_backend
+from backend.services.impl.cached_company import CachedCompanyService
+from backend.services.impl.proxy import CompanyServiceProxy
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((getattr(self.client, name), args, kwargs))
+
+    def execute(self):
+        return [method(*args, **kwargs) for method, args, kwargs in self.calls]
+
+
+class FakeRedis:
+    """테스트용 Redis 대역 (get/set/delete/scan_iter/sadd/expire/sunion/pipeline, set 값은 만료 없음)"""
+
+    def __init__(self):
+        self.data = {}
+        self.sets = {}
+
+    def get(self, key):
+        item = self.data.get(key)
+        if item is None or item[0] <= time.monotonic():
+            return None
+        return item[1]
+
+    def set(self, key, value, ex=None):
+        self.data[key] = (time.monotonic() + (ex or 3600), value)
+
+    def delete(self, *keys):
+        return sum(1 for key in keys if (self.data.pop(key, None) or self.sets.pop(key, None)) is not None)
+
+    def scan_iter(self, match="*"):
+        return [key for key in list(self.data) + list(self.sets) if fnmatch.fnmatchcase(key, match)]
+
+    def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+
+    def expire(self, key, seconds):
+        pass
+
+    def sunion(self, *keys):
+        return set().union(*(self.sets.get(key, set()) for key in keys))
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class StubService(CompanyServiceProxy):
+    """DB 없이 호출 횟수만 세는 서비스"""
+
+    def __init__(self):
+        super().__init__(None)
+        self.calls = 0
+
+    def get_company(self, db, company_name, lang):
+        self.calls += 1
+        if company_name == "없는회사":
+            return None
+        return schemas.CompanyResponseSchema(company_name=company_name, tags=[])
+
+    def autocomplete_company(self, db, query, lang, limit=None, mode=None):
+        self.calls += 1
+        return [schemas.CompanyAutocompleteSchema(company_name=query)]
+
+    def search_by_tag(self, db, query, lang, mode=None):
+        self.calls += 1
+        return [schemas.TagSearchResponseSchema(company_name=query)]
+
+    def add_tags_to_company(self, db, company_name, tags, lang):
+        return schemas.CompanyResponseSchema(company_name=company_name, tags=[])
+
+
+class StubCachedService(CachedCompanyService):
+    def _company_names(self, db, company_name):
+        return {("ko", "원티드랩"), ("en", "Wantedlab")}
+
+    def _tag_names(self, db, tag_names):
+        return {"태그_4", "tag_4", "タグ_4"} if tag_names else set()
+
+
+@pytest.fixture(params=["memory", "redis"])
+def cache(request):
+    if request.param == "memory":
+        return LRUCacheBackend(max_size=100, ttl=60)
+    return RedisCacheBackend(client=FakeRedis(), ttl=60)
+
+
+def test_lru_ttl_and_eviction():
+    """
+    TTL 이 지난 항목은 miss 이고, 최대 크기를 넘으면 가장 오래 쓰지 않은 항목이 제거되어야 합니다.
+    """
+    cache = LRUCacheBackend(max_size=2, ttl=60)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+
+    expiring = LRUCacheBackend(max_size=2, ttl=0)
+    expiring.set("a", "1")
+    assert expiring.get("a") is None
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert expiring.stats()["expirations"] == 1
+
+
+def test_read_hits_cache(cache):
+    """
+    같은 (경로, 쿼리, 언어) 요청은 두 번째부터 캐시에서 응답해야 합니다. (404 포함)
+    """
+    stub = StubService()
+    service = StubCachedService(stub, cache)
+    for _ in range(2):
+        assert service.get_company(None, "Wantedlab", "ko").company_name == "Wantedlab"
+        assert service.get_company(None, "없는회사", "ko") is None
+        assert service.search_by_tag(None, "tag", "ko")[0].company_name == "tag"
+    assert stub.calls == 3
+    service.get_company(None, "Wantedlab", "en")
+    assert stub.calls == 4
+
+
+def test_write_invalidates_only_affected_keys(cache):
+    """
+    태그 추가 후 해당 회사 조회 키와, 추가된 태그명에 일치하는 태그 검색 키만 무효화되어야 합니다.
+    """
+    stub = StubService()
+    service = StubCachedService(stub, cache)
+    service.get_company(None, "원티드랩", "ko")
+    service.get_company(None, "Wantedlab", "en")
+    service.get_company(None, "COVENANT", "ko")
+    service.search_by_tag(None, "tag_4", "ko")
+    service.search_by_tag(None, "タグ", "en")
+    service.search_by_tag(None, "tag_9", "ko")
+    service.autocomplete_company(None, "원티", "ko")
+
+    service.add_tags_to_company(None, "Wantedlab", [
+        schemas.TagCreateSchema(tag_name=schemas.TagNameSchema(ko="태그_4"))
+    ], "ko")
+
+    assert sorted(cache.keys("resp:")) == [
+        "resp:company:ko:COVENANT",
+        "resp:search:ko:substring::원티",
+        "resp:tags:ko:substring:::tag_9",
+    ]
+
+
+def test_new_company_invalidates_without_scanning(cache, monkeypatch):
+    """
+    새 회사명에 부분 일치하는 자동완성 키와 fts 키만 무효화하고, 캐시 키 전체를 훑지 않아야 합니다.
+    """
+    service = StubCachedService(StubService(), cache)
+    service.autocomplete_company(None, "티드", "ko", mode=schemas.SearchMode.SUBSTRING)
+    service.autocomplete_company(None, "WANTED", "en", mode=schemas.SearchMode.SUBSTRING)
+    service.autocomplete_company(None, "원티드", "ko", mode=schemas.SearchMode.FTS)
+    service.autocomplete_company(None, "코버", "ko", mode=schemas.SearchMode.SUBSTRING)
+    service.autocomplete_company(None, "티드", "en", mode=schemas.SearchMode.SUBSTRING)
+    service.get_company(None, "원티드랩", "en")
+
+    monkeypatch.setattr(cache, "keys", lambda prefix: pytest.fail("keys() must not be used for invalidation"))
+    assert service.invalidate({("ko", "원티드랩"), ("en", "Wantedlab")}, set()) == 4
+    monkeypatch.undo()
+    assert sorted(cache.keys("resp:")) == [
+        "resp:search:en:substring::티드",
+        "resp:search:ko:substring::코버",
+    ]
+
+
+def test_redis_backend_rejected_with_async_db(monkeypatch):
+    monkeypatch.setattr(cache_module, "RESPONSE_CACHE_BACKEND", "redis")
+    with pytest.raises(ValueError):
+        build_cache_backend(async_db=True)
@@ -0,0 +1,131 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from backend.services.impl.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_single_flight_shares_one_call():
+    """
+    같은 키로 동시에 들어온 호출은 한 번만 실행되고 모두 같은 결과를 받아야 합니다.
+    """
+    flight = SingleFlight(timeout=5)
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return ["result"]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        leader = pool.submit(flight.do, ("get_company", "ko", "원티드랩"), slow)
+        started.wait(5)
+        followers = [pool.submit(flight.do, ("get_company", "ko", "원티드랩"), slow) for _ in range(7)]
+        while flight.stats()["waiting"] < 7:
+            threading.Event().wait(0.01)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert flight.stats() == {"in_flight": 0, "waiting": 0}
+
+
+def test_single_flight_propagates_error_and_times_out():
+    """
+    leader 의 예외는 기다리던 호출에도 전달되고, timeout 이 지난 호출은 직접 실행해야 합니다.
+    """
+    flight = SingleFlight(timeout=0.05)
+    started, release = threading.Event(), threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(flight.do, "key", failing)
+        started.wait(5)
+        # leader 가 끝나지 않았으므로 timeout 후 직접 실행
+        assert flight.do("key", lambda: "own") == "own"
+        flight.timeout = 5
+        follower = pool.submit(flight.do, "key", lambda: "unused")
+        while flight.stats()["waiting"] < 2:
+            threading.Event().wait(0.01)
+        release.set()
+        with pytest.raises(ValueError):
+            leader.result()
+        with pytest.raises(ValueError):
+            follower.result()
+
+
+def test_async_single_flight_shares_one_call():
+    """
+    asyncio 경로에서도 같은 키의 동시 호출은 한 번만 실행되고, 키가 다르면 따로 실행되어야 합니다.
+    """
+    flight = AsyncSingleFlight(timeout=5)
+    calls = []
+
+    async def slow(value):
+        calls.append(value)
+        await asyncio.sleep(0.05)
+        return value
+
+    async def main():
+        return await asyncio.gather(
+            *[flight.do(("search_by_tag", "ko", "tag_1"), lambda: slow("tag_1")) for _ in range(5)],
+            flight.do(("search_by_tag", "ko", "tag_2"), lambda: slow("tag_2")),
+        )
+
+    assert asyncio.run(main()) == ["tag_1"] * 5 + ["tag_2"]
+    assert sorted(calls) == ["tag_1", "tag_2"]
+    assert flight.stats() == {"in_flight": 0}
+
+
+def test_async_single_flight_timeout_and_error():
+    flight = AsyncSingleFlight(timeout=0.01)
+
+    async def failing():
+        await asyncio.sleep(0.05)
+        raise ValueError("boom")
+
+    async def own():
+        return "own"
+
+    async def main():
+        return await asyncio.gather(flight.do("key", failing), flight.do("key", own), return_exceptions=True)
+
+    error, result = asyncio.run(main())
+    assert isinstance(error, ValueError) and result == "own"
+
+
+def test_async_single_flight_leader_cancelled():
+    """
+    leader 가 취소되어도 기다리던 호출은 취소되지 않고, 그중 하나가 새 leader 로 실행하여 결과를 공유해야 합니다.
+    """
+    flight = AsyncSingleFlight(timeout=5)
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        leader = asyncio.ensure_future(flight.do("key", slow))
+        await asyncio.sleep(0.01)
+        waiters = [asyncio.ensure_future(flight.do("key", slow)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*waiters)
+        return leader, results
+
+    leader, results = asyncio.run(main())
+    assert leader.cancelled()
+    assert results == ["result"] * 3
+    assert len(calls) == 2
+    assert flight.stats() == {"in_flight": 0}
@@ -0,0 +1,23 @@
+import re
+
+from backend import migrate
+from backend.utils import warmup
+
+
+def test_ready_only_after_warmup(api, monkeypatch):
+    """
+    warmup 이 끝나기 전에는 readiness probe 가 503, 끝난 뒤에는 200 이어야 합니다.
+    """
+    monkeypatch.setitem(warmup.state, "ready", False)
+    assert api.get("/monitoring/ready").status_code == 503
+    monkeypatch.setitem(warmup.state, "ready", True)
+    assert api.get("/monitoring/ready").status_code == 200
+
+
+def test_migrations_are_applied_in_numbered_order():
+    """
+    migrate 는 migrations/NNN_*.sql 을 번호 순서대로 적용해야 합니다.
+    """
+    files = migrate._migration_files()
+    assert files and all(re.match(r"\d{3}_\w+\.sql$", f) for f in files)
+    assert files == sorted(files, key=lambda f: int(f[:3]))
@@ -0,0 +1,23 @@
+import pytest
+
+from backend.utils.tag_query import parse_tag_query
+
+
+def test_parse_precedence():
+    """
+    NOT > AND > OR 순으로 묶이고, 연속된 태그는 AND 로 해석되어야 합니다.
+    """
+    assert parse_tag_query("tag_3 AND tag_10 NOT tag_7") == [(["tag_3", "tag_10"], ["tag_7"])]
+    assert parse_tag_query('tag_3 tag_10 OR "태그 1" AND NOT tag_7') == [
+        (["tag_3", "tag_10"], []),
+        (["태그 1"], ["tag_7"]),
+    ]
+    # 소문자는 연산자가 아닌 태그명
+    assert parse_tag_query("and or") == [(["and", "or"], [])]
+
+
+@pytest.mark.parametrize("query", ["", "AND tag_1", "tag_1 OR", "tag_1 NOT", "NOT tag_1", "tag_1 OR NOT tag_2",
+                                   "tag_1 AND OR tag_2", "NOT NOT tag_1", '"tag_1'])
+def test_parse_invalid(query):
+    with pytest.raises(ValueError):
+        parse_tag_query(query)
@@ -0,0 +1,237 @@
+"""
+CSV 대량 적재 (COPY FROM STDIN 기반).
+
+init_db_from_csv 는 행/태그마다 조회 + flush 를 하므로 대용량에서 매우 느리다.
+이 모듈은 CSV 를 스트리밍으로 읽어 회사/태그를 메모리에서 중복 제거하고,
+id 를 시퀀스에서 묶음으로 할당받은 뒤 chunk 단위로 5개 테이블을 COPY 로 적재한다.
+chunk 마다 커밋 후 checkpoint 파일에 처리한 행 수를 기록하므로 --resume 으로 이어서 적재할 수 있다.
+
+    python -m backend.utils.bulk_load_from_csv --csv company_tag_sample.csv --chunk-size 5000 [--resume]
+"""
+import argparse
+import csv
+import io
+import itertools
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from backend.database import engine
+from backend.services.impl.read_model import read_model_params, refresh_statement
+from backend.utils.init_db_from_csv import CSV_FILE_PATH, parse_row
+
+CHUNK_SIZE = int(os.environ.get("INIT_CHUNK_SIZE", "5000"))
+
+# 회사/태그 중복 판단에 사용할 언어 우선순위 (init_db_from_csv 와 동일하게 ko 우선, tw 만 있는 행도 포함)
+DEDUP_LANGUAGES = ("ko", "en", "ja", "tw")
+
+
+def _dedup_key(names: Dict[str, Optional[str]]) -> Optional[Tuple[str, str]]:
+    """우선순위 언어의 첫 이름, 없으면 아무 언어의 이름. 이름이 하나도 없으면 None"""
+    for lang in DEDUP_LANGUAGES + tuple(sorted(names)):
+        if names.get(lang):
+            return lang, names[lang]
+    return None
+
+
+def _tag_name_owners(
+        new_tags: Dict[Tuple[str, str], Dict[str, str]]
+) -> Dict[Tuple[str, str], Tuple[str, str]]:
+    """
+    새 태그들의 (언어, 이름) → 그 이름을 가질 태그의 중복 제거 키.
+    같은 (언어, 이름)을 여러 새 태그가 가지면 그 이름이 중복 제거 키인 태그, 없으면 먼저 나온 태그에 준다.
+    (적재 순서로 정하면 키 이름을 다른 태그에 빼앗겨 이름이 하나도 없는 태그가 생길 수 있음)
+    """
+    owners: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    for key, names in new_tags.items():
+        for lang, name in names.items():
+            if name and ((lang, name) == key or (lang, name) not in owners):
+                owners[(lang, name)] = key
+    return owners
+
+
+def _copy(cursor, table: str, columns: Iterable[str], rows: List[tuple]) -> None:
+    if not rows:
+        return
+    buf = io.StringIO()
+    csv.writer(buf).writerows(rows)
+    buf.seek(0)
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buf)
+
+
+class BulkLoader:
+    def __init__(self, connection):
+        self.connection = connection
+        self.company_ids: Dict[Tuple[str, str], int] = {}
+        self.tag_ids: Dict[Tuple[str, str], int] = {}
+        # 이름이 하나도 없어 건너뛴 회사 행/태그 수
+        self.skipped_rows = 0
+        self.skipped_tags = 0
+
+    def preload(self) -> None:
+        """이미 적재된 회사/태그를 읽어 중복 제거 맵을 채운다 (재시작/증분 적재 대비)"""
+        with self.connection.cursor() as cursor:
+            for table, ids in (("company_names", self.company_ids), ("tag_names", self.tag_ids)):
+                owner = "company_id" if table == "company_names" else "tag_id"
+                cursor.execute(
+                    f"SELECT language_code, name, {owner} FROM {table} WHERE language_code = ANY(%s)",
+                    (list(DEDUP_LANGUAGES),)
+                )
+                for lang, name, owner_id in cursor:
+                    ids.setdefault((lang, name), owner_id)
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS company_tags_stage "
+                "(company_id integer, tag_id integer) ON COMMIT DELETE ROWS"
+            )
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS tag_names_stage "
+                "(tag_id integer, language_code varchar(8), name varchar(255)) ON COMMIT DELETE ROWS"
+            )
+        self.connection.commit()
+
+    def _reserve_ids(self, cursor, table: str, count: int) -> List[int]:
+        if not count:
+            return []
+        cursor.execute(
+            "SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+            (table, count)
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+    def _refresh_read_model(self, cursor, company_ids) -> None:
+        """chunk 에 나온 회사의 read model 을 같은 트랜잭션에서 갱신 (서비스와 같은 SQL 을 psycopg2 용으로 컴파일)"""
+        if not company_ids:
+            return
+        compiled = refresh_statement.bindparams(
+            **read_model_params(), company_ids=sorted(company_ids)
+        ).compile(dialect=engine.dialect)
+        cursor.execute(str(compiled), compiled.params)
+
+    def load_chunk(self, rows: List[dict]) -> None:
+        new_companies: Dict[Tuple[str, str], Dict[str, str]] = {}
+        new_tags: Dict[Tuple[str, str], Dict[str, str]] = {}
+        parsed = []
+        for row in rows:
+            company_names, tags = parse_row(row)
+            company_key = _dedup_key(company_names)
+            if company_key is None:
+                self.skipped_rows += 1
+                continue
+            if company_key not in self.company_ids:
+                new_companies.setdefault(company_key, company_names)
+            tag_keys = []
+            for tag_names in tags:
+                tag_key = _dedup_key(tag_names)
+                if tag_key is None:
+                    self.skipped_tags += 1
+                    continue
+                if tag_key not in self.tag_ids:
+                    new_tags.setdefault(tag_key, tag_names)
+                tag_keys.append(tag_key)
+            parsed.append((company_key, tag_keys))
+
+        now = datetime.utcnow().isoformat()
+        with self.connection.cursor() as cursor:
+            company_ids = dict(zip(new_companies, self._reserve_ids(cursor, "companies", len(new_companies))))
+            tag_ids = dict(zip(new_tags, self._reserve_ids(cursor, "tags", len(new_tags))))
+
+            _copy(cursor, "companies", ("id", "created_at", "updated_at"),
+                  [(company_id, now, now) for company_id in company_ids.values()])
+            _copy(cursor, "company_names", ("company_id", "language_code", "name"),
+                  [(company_ids[key], lang, name)
+                   for key, names in new_companies.items() for lang, name in names.items() if name])
+            _copy(cursor, "tags", ("id", "created_at", "updated_at"),
+                  [(tag_id, now, now) for tag_id in tag_ids.values()])
+            _copy(cursor, "tag_names_stage", ("tag_id", "language_code", "name"),
+                  [(tag_ids[owner], lang, name) for (lang, name), owner in _tag_name_owners(new_tags).items()])
+            # 중복 제거 기준(ko > en > ja > tw)이 아닌 언어의 이름이 이미 다른 태그에 있으면 (언어, 이름) unique 로 건너뜀
+            cursor.execute(
+                "INSERT INTO tag_names (tag_id, language_code, name) "
+                "SELECT tag_id, language_code, name FROM tag_names_stage ORDER BY language_code, name "
+                "ON CONFLICT DO NOTHING"
+            )
+
+            all_company_ids = {**self.company_ids, **company_ids}
+            all_tag_ids = {**self.tag_ids, **tag_ids}
+            _copy(cursor, "company_tags_stage", ("company_id", "tag_id"),
+                  [(all_company_ids[company_key], all_tag_ids[tag_key])
+                   for company_key, tag_keys in parsed for tag_key in tag_keys])
+            # 같은 회사가 여러 행에 나오거나 재시작한 경우의 중복 매핑은 ON CONFLICT 로 무시하고,
+            # 실제로 추가된 매핑 수만 태그별 회사 수(tag_counts)에 더한다
+            cursor.execute(
+                "WITH inserted AS ("
+                " INSERT INTO company_tags (company_id, tag_id)"
+                " SELECT DISTINCT company_id, tag_id FROM company_tags_stage"
+                " ON CONFLICT (company_id, tag_id) DO NOTHING RETURNING tag_id) "
+                "INSERT INTO tag_counts (tag_id, company_count) "
+                "SELECT tag_id, count(*) FROM inserted GROUP BY tag_id ORDER BY tag_id "
+                "ON CONFLICT (tag_id) DO UPDATE SET company_count = tag_counts.company_count + EXCLUDED.company_count"
+            )
+            # 이미 있던 회사에 태그가 붙은 경우도 export 증분에 잡히도록 updated_at 갱신
+            touched = {all_company_ids[company_key] for company_key, _ in parsed}
+            existing = sorted(touched - set(company_ids.values()))
+            if existing:
+                cursor.execute("UPDATE companies SET updated_at = %s WHERE id = ANY(%s)", (now, existing))
+            self._refresh_read_model(cursor, touched)
+        self.connection.commit()
+        # 커밋이 끝난 뒤에만 중복 제거 맵에 반영
+        self.company_ids.update(company_ids)
+        self.tag_ids.update(tag_ids)
+
+
+def _read_checkpoint(path: str) -> int:
+    if not os.path.exists(path):
+        return 0
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("rows", 0)
+
+
+def _write_checkpoint(path: str, rows: int) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"rows": rows}, f)
+    os.replace(tmp_path, path)
+
+
+def load(csv_path: str, chunk_size: int = CHUNK_SIZE, resume: bool = False,
+         checkpoint_path: Optional[str] = None) -> int:
+    """CSV 를 chunk 단위로 적재하고 처리한 전체 행 수를 반환"""
+    checkpoint_path = checkpoint_path or f"{csv_path}.checkpoint"
+    done = _read_checkpoint(checkpoint_path) if resume else 0
+
+    connection = engine.raw_connection()
+    try:
+        loader = BulkLoader(connection)
+        loader.preload()
+        with open(csv_path, newline='', encoding='utf-8') as csvfile:
+            reader = itertools.islice(csv.DictReader(csvfile), done, None)
+            while True:
+                chunk = list(itertools.islice(reader, chunk_size))
+                if not chunk:
+                    break
+                loader.load_chunk(chunk)
+                done += len(chunk)
+                _write_checkpoint(checkpoint_path, done)
+                print(f"{done} rows loaded")
+        if loader.skipped_rows or loader.skipped_tags:
+            print(f"skipped {loader.skipped_rows} rows without company name, "
+                  f"{loader.skipped_tags} tags without name")
+    finally:
+        connection.close()
+    return done
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CSV 대량 적재 (COPY FROM STDIN)")
+    parser.add_argument("--csv", default=CSV_FILE_PATH)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--resume", action="store_true", help="checkpoint 에 기록된 행 이후부터 이어서 적재")
+    parser.add_argument("--checkpoint", default=None, help="checkpoint 파일 경로 (기본: <csv>.checkpoint)")
+    args = parser.parse_args()
+    load(args.csv, args.chunk_size, args.resume, args.checkpoint)
+    print("DB 대량 적재 완료.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+목록 응답(/search, /tags)의 빠른 직렬화 경로.
+
+FastAPI 는 라우트가 반환한 스키마 객체를 response_model 로 다시 검증하고, dict/list 로 바꾼 뒤 json.dumps 로 다시 인코딩한다.
+수천 행 응답에서는 이 과정(과 행마다의 스키마 생성)이 쿼리보다 CPU 를 많이 쓰므로, FAST_JSON_ENABLED 이면
+라우트가 ModelListResponse 를 직접 반환하여 pydantic-core 의 Rust 직렬화(TypeAdapter.dump_json)로
+목록 전체를 중간 dict 없이 한 번에 bytes 로 만든다. (response_model 처리는 건너뜀)
+
+RESPONSE_VALIDATION_ENABLED(기본 true) 이면 직렬화 전에 목록을 스키마로 검증한다.
+서비스가 만든 스키마 객체는 타입 확인만 하고, 행/dict 는 필드까지 검증한다.
+서비스 출력만 내보내는 신뢰된 경로에서는 false 로 검증을 생략할 수 있다.
+"""
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.engine import Row
+
+from backend.utils.request_metrics import SerializeTimer
+from backend.utils.util import get_env_bool
+
+FAST_JSON_ENABLED = get_env_bool("FAST_JSON_ENABLED")
+RESPONSE_VALIDATION_ENABLED = get_env_bool("RESPONSE_VALIDATION_ENABLED", True)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+def rows_to_models(schema, rows: Sequence[Row]) -> List[BaseModel]:
+    """
+    SQL 결과 행(컬럼 label = 필드 이름)을 항목마다 생성자를 부르지 않고 목록 단위로 한 번에 검증하여 스키마 객체로 변환.
+    Row 의 속성 접근은 느리므로 컬럼 이름과 tuple 값을 zip 한 dict 로 넘긴다. (스키마에 없는 컬럼은 무시됨)
+    """
+    if not rows:
+        return []
+    keys = rows[0]._fields
+    return list_adapter(schema).validate_python([dict(zip(keys, row)) for row in rows])
+
+
+def dump_models(schema, items: Sequence[object], exclude_none: bool = False,
+                validate: Optional[bool] = None) -> bytes:
+    adapter = list_adapter(schema)
+    if RESPONSE_VALIDATION_ENABLED if validate is None else validate:
+        items = adapter.validate_python(items, from_attributes=True)
+    return adapter.dump_json(items, exclude_none=exclude_none)
+
+
+class ModelListResponse(Response):
+    media_type = "application/json"
+
+    def __init__(self, schema, items: Sequence[object], exclude_none: bool = False,
+                 validate: Optional[bool] = None, **kwargs):
+        with SerializeTimer():
+            content = dump_models(schema, items, exclude_none, validate)
+        super().__init__(content, **kwargs)
+
+
+def list_response(schema, items: Sequence[object], response: Optional[Response] = None,
+                  exclude_none: bool = False):
+    """
+    FAST_JSON_ENABLED 이면 바로 직렬화한 응답을, 아니면 items 를 그대로 반환 (response_model 로 처리).
+    응답 객체를 직접 반환하면 주입된 response 의 헤더가 적용되지 않으므로 옮겨 담는다.
+    """
+    if not FAST_JSON_ENABLED:
+        return items
+    headers = dict(response.headers) if response is not None else None
+    return ModelListResponse(schema, items, exclude_none, headers=headers)
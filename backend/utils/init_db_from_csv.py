@@ -1,26 +1,28 @@
 import csv
 import os
+from sqlalchemy import tuple_
 from sqlalchemy.orm import Session
 from backend.database import SessionLocal
 from backend.models import Company, CompanyName, Tag, TagName, CompanyTag
+from backend.services.impl.read_model import rebuild_company_read_model
+from backend.services.impl.tag_counts import rebuild_tag_counts
 
 CSV_FILE_PATH = os.environ.get("INIT_CSV_PATH", "company_tag_sample.csv")
 
 def get_or_create_tag(session: Session, tag_names: dict):
     # tag_names: {'ko': ..., 'en': ..., 'ja': ...}
-    # Check if tag exists by ko name (or en/ja fallback)
-    ko_name = tag_names.get("ko")
-    tag = None
-    if ko_name:
-        tag = session.query(Tag).join(TagName).filter(TagName.language_code == "ko", TagName.name == ko_name).first()
+    # 언어별 태그명은 unique 이므로 어느 언어든 (언어, 이름) 이 같은 태그가 있으면 그 태그를 사용
+    pairs = [(lang, name) for lang, name in tag_names.items() if name]
+    tag = session.query(Tag).join(TagName).filter(
+        tuple_(TagName.language_code, TagName.name).in_(pairs)
+    ).order_by(TagName.id).first()
     if not tag:
         tag = Tag()
         session.add(tag)
         session.flush()  # get tag.id
-        for lang, name in tag_names.items():
-            if name:
-                tag_name = TagName(tag_id=tag.id, language_code=lang, name=name)
-                session.add(tag_name)
+        for lang, name in pairs:
+            session.add(TagName(tag_id=tag.id, language_code=lang, name=name))
+        session.flush()  # 다음 행의 조회에서 보이도록
     return tag
 
 def get_or_create_company(session: Session, company_names: dict):
@@ -40,37 +42,53 @@ def get_or_create_company(session: Session, company_names: dict):
                 session.add(company_name)
     return company
 
+def parse_row(row: dict):
+    """CSV 한 줄을 (회사명 dict, 태그명 dict 리스트) 로 변환"""
+    # 회사 이름
+    company_names = {
+        "ko": row.get("company_ko", "").strip() or None,
+        "en": row.get("company_en", "").strip() or None,
+        "ja": row.get("company_ja", "").strip() or None,
+    }
+    # tw 컬럼은 선택 (샘플 CSV 에는 없음)
+    if row.get("company_tw"):
+        company_names["tw"] = row["company_tw"].strip() or None
+    # 태그 이름 (파이프 구분)
+    tag_ko_list = row.get("tag_ko", "").split("|") if row.get("tag_ko") else []
+    tag_en_list = row.get("tag_en", "").split("|") if row.get("tag_en") else []
+    tag_ja_list = row.get("tag_ja", "").split("|") if row.get("tag_ja") else []
+    tag_tw_list = row.get("tag_tw", "").split("|") if row.get("tag_tw") else []
+
+    tags = []
+    tag_count = max(len(tag_ko_list), len(tag_en_list), len(tag_ja_list), len(tag_tw_list))
+    for i in range(tag_count):
+        tag_names = {
+            "ko": tag_ko_list[i].strip() if i < len(tag_ko_list) else None,
+            "en": tag_en_list[i].strip() if i < len(tag_en_list) else None,
+            "ja": tag_ja_list[i].strip() if i < len(tag_ja_list) else None,
+        }
+        if i < len(tag_tw_list):
+            tag_names["tw"] = tag_tw_list[i].strip() or None
+        if any(tag_names.values()):
+            tags.append(tag_names)
+    return company_names, tags
+
+
 def main():
     session = SessionLocal()
     with open(CSV_FILE_PATH, newline='', encoding='utf-8') as csvfile:
         reader = csv.DictReader(csvfile)
         for row in reader:
-            # 회사 이름
-            company_names = {
-                "ko": row.get("company_ko", "").strip() or None,
-                "en": row.get("company_en", "").strip() or None,
-                "ja": row.get("company_ja", "").strip() or None,
-            }
-            # 태그 이름 (파이프 구분)
-            tag_ko_list = row.get("tag_ko", "").split("|") if row.get("tag_ko") else []
-            tag_en_list = row.get("tag_en", "").split("|") if row.get("tag_en") else []
-            tag_ja_list = row.get("tag_ja", "").split("|") if row.get("tag_ja") else []
-
+            company_names, tags = parse_row(row)
             company = get_or_create_company(session, company_names)
-            tag_count = max(len(tag_ko_list), len(tag_en_list), len(tag_ja_list))
-            for i in range(tag_count):
-                tag_names = {
-                    "ko": tag_ko_list[i].strip() if i < len(tag_ko_list) else None,
-                    "en": tag_en_list[i].strip() if i < len(tag_en_list) else None,
-                    "ja": tag_ja_list[i].strip() if i < len(tag_ja_list) else None,
-                }
-                if not any(tag_names.values()):
-                    continue
+            for tag_names in tags:
                 tag = get_or_create_tag(session, tag_names)
                 # CompanyTag 연결 (중복 방지)
                 exists = session.query(CompanyTag).filter_by(company_id=company.id, tag_id=tag.id).first()
                 if not exists:
                     session.add(CompanyTag(company_id=company.id, tag_id=tag.id))
+        rebuild_company_read_model(session)
+        rebuild_tag_counts(session)
         session.commit()
     print("DB 초기 데이터 입력 완료.")
 
@@ -0,0 +1,25 @@
+"""
+durable outbox sink 의 offset 을 되돌려 이벤트를 다시 전달받게 한다. (실행 중인 dispatcher 가 다음 회차에 이어서 보냄)
+프로세스 내 sink(cache, index) 는 worker 재시작 시 전체를 다시 적재하므로 replay 대상이 아니다.
+
+    python -m backend.utils.outbox_replay --sink ndjson --from-id 1
+"""
+import argparse
+
+from backend.database import SessionLocal
+from backend.services.impl.outbox import set_durable_offset
+
+
+def main():
+    parser = argparse.ArgumentParser(description="outbox durable sink replay")
+    parser.add_argument("--sink", required=True)
+    parser.add_argument("--from-id", type=int, default=1, help="이 id 의 이벤트부터 다시 전달 (보존 기간 이내)")
+    args = parser.parse_args()
+    with SessionLocal() as db:
+        set_durable_offset(db, args.sink, max(args.from_id - 1, 0))
+        db.commit()
+    print(f"{args.sink}: replay from event {args.from_id}")
+
+
+if __name__ == "__main__":
+    main()
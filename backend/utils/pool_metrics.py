@@ -0,0 +1,103 @@
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Type
+
+from sqlalchemy import exc
+from sqlalchemy.pool import Pool
+
+# 진행 중인 checkout 에서 새 커넥션을 열기 시작한 시각 (스레드/greenlet 마다 따로, checkout 밖에서는 None)
+_checkout: ContextVar[Optional[List[float]]] = ContextVar("pool_checkout", default=None)
+
+
+class PoolMetrics:
+    """
+    커넥션 풀 checkout 대기 시간/횟수와 새 커넥션 연결 시간 카운터.
+    대기 시간은 풀에 빈 커넥션이 생길 때까지(또는 새 커넥션을 열기 시작할 때까지)만 재며,
+    새 커넥션 연결 시간과 pre-ping 은 포함하지 않는다. 연결 시간은 connect_seconds_* 로 따로 센다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.connects = 0
+        self.connect_seconds_total = 0.0
+        self.connect_seconds_max = 0.0
+
+    def record(self, wait_seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += wait_seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+    def record_connect(self, seconds: float) -> None:
+        with self._lock:
+            self.connects += 1
+            self.connect_seconds_total += seconds
+            self.connect_seconds_max = max(self.connect_seconds_max, seconds)
+
+    def snapshot(self, pool: Pool) -> Dict[str, float]:
+        with self._lock:
+            stats = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+                "connects": self.connects,
+                "connect_seconds_total": self.connect_seconds_total,
+                "connect_seconds_max": self.connect_seconds_max,
+            }
+        # QueuePool 계열만 size/overflow 정보를 가진다
+        for key in ("size", "checkedin", "checkedout", "overflow"):
+            if hasattr(pool, key):
+                stats[key] = getattr(pool, key)()
+        # QueuePool 은 overflow 를 -pool_size 부터 센다
+        if "overflow" in stats:
+            stats["overflow"] = max(stats["overflow"], 0)
+        stats["in_use"] = stats.get("checkedout", 0)
+        return stats
+
+
+class _InstrumentedPoolMixin:
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        if _checkout.get() is not None:
+            # QueuePool 이 다시 시도하며 재귀 호출한 경우 바깥 호출에서 한 번만 기록
+            return super()._do_get()
+        start = time.perf_counter()
+        connect_started: List[float] = []
+        token = _checkout.set(connect_started)
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        finally:
+            _checkout.reset(token)
+        self.metrics.record((connect_started[0] if connect_started else time.perf_counter()) - start)
+        return record
+
+    def _create_connection(self):
+        start = time.perf_counter()
+        connect_started = _checkout.get()
+        if connect_started is not None and not connect_started:
+            connect_started.append(start)
+        record = super()._create_connection()
+        self.metrics.record_connect(time.perf_counter() - start)
+        return record
+
+
+def instrumented_pool_class(pool_class: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    """
+    checkout 대기 시간과 새 커넥션 연결 시간을 metrics 에 기록하는 pool 클래스를 만든다.
+    metrics 를 클래스 속성으로 두어 dispose() 후 pool 이 재생성되어도 카운터가 유지된다.
+    """
+    return type(f"Instrumented{pool_class.__name__}", (_InstrumentedPoolMixin, pool_class), {"metrics": metrics})
@@ -0,0 +1,211 @@
+"""
+요청 단위 계측: 라우트/언어별 전체 시간, SQL 문 수, DB 시간, 직렬화 시간.
+
+- RequestMetricsMiddleware 가 요청마다 RequestStats 를 contextvar 에 두고, 응답이 끝나면 히스토그램에 기록한다.
+  (sync 라우트의 threadpool, AsyncSession 의 greenlet 모두 context 를 복사하므로 같은 객체에 누적된다)
+- install_sql_hooks 는 엔진의 before/after_cursor_execute 로 문장 수와 실행 시간을 누적하고
+  SLOW_QUERY_MS 이상 걸린 문장을 bound parameter 와 함께 로그로 남긴다.
+- install_serialization_timer 는 FastAPI 의 response_model 검증/직렬화 시간을 잰다.
+"""
+import logging
+import os
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+import fastapi.routing
+from sqlalchemy import event
+from starlette.responses import JSONResponse
+
+from backend.database import get_pool_stats
+from backend.utils.metrics import Counter, Gauge, Histogram, registry
+from backend.utils.util import SUPPORTED_LANGUAGES, get_env_bool
+
+REQUEST_METRICS_ENABLED = get_env_bool("REQUEST_METRICS_ENABLED", True)
+SLOW_QUERY_MS = float(os.environ.get("SLOW_QUERY_MS", "200"))
+
+logger = logging.getLogger(__name__)
+
+UNMATCHED_ROUTE = "<unmatched>"
+REQUEST_LABELS = ("route", "method", "lang")
+
+requests_total = registry.register(Counter(
+    "http_requests_total", "처리한 요청 수", REQUEST_LABELS + ("status",)))
+request_duration = registry.register(Histogram(
+    "http_request_duration_seconds", "요청 전체 처리 시간 (응답 본문 전송 완료까지)", REQUEST_LABELS))
+request_db_duration = registry.register(Histogram(
+    "http_request_db_seconds", "요청 중 SQL 실행에 쓴 시간", REQUEST_LABELS))
+request_statements = registry.register(Histogram(
+    "http_request_sql_statements", "요청당 실행한 SQL 문 수", REQUEST_LABELS,
+    buckets=(1, 2, 3, 5, 10, 20, 50, 100, 200, 500)))
+request_serialize_duration = registry.register(Histogram(
+    "http_request_serialize_seconds", "요청 중 응답 검증/직렬화에 쓴 시간", REQUEST_LABELS))
+slow_queries_total = registry.register(Counter(
+    "db_slow_queries_total", f"SLOW_QUERY_MS({SLOW_QUERY_MS:g}ms) 이상 걸린 SQL 문 수", ("route",)))
+service_duration = registry.register(Histogram(
+    "service_method_duration_seconds", "CompanyService 메서드 처리 시간", ("method",)))
+
+
+def _pool_gauge(key: str):
+    def collect():
+        return [((name,), stats.get(key, 0)) for name, stats in get_pool_stats().items()]
+    return collect
+
+
+registry.register(Gauge("db_pool_in_use", "사용 중인 커넥션 수", ("pool",), _pool_gauge("in_use")))
+registry.register(Gauge("db_pool_overflow", "pool_size 를 넘어 연 커넥션 수", ("pool",), _pool_gauge("overflow")))
+registry.register(Gauge("db_pool_checkout_wait_seconds_total", "커넥션 checkout 대기 시간 합계", ("pool",),
+                        _pool_gauge("wait_seconds_total")))
+registry.register(Gauge("db_pool_connect_seconds_total", "새 커넥션 연결 시간 합계 (checkout 대기와 별도)", ("pool",),
+                        _pool_gauge("connect_seconds_total")))
+registry.register(Gauge("db_pool_checkout_timeouts_total", "커넥션 checkout timeout 횟수", ("pool",),
+                        _pool_gauge("timeouts")))
+
+
+class RequestStats:
+    __slots__ = ("scope", "statements", "db_seconds", "serialize_seconds")
+
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.serialize_seconds = 0.0
+
+    @property
+    def route(self) -> str:
+        """라우팅 후 scope 에 들어오는 라우트 템플릿 (/companies/{company_name})"""
+        route = self.scope.get("route")
+        return route.path if route is not None else UNMATCHED_ROUTE
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    return _current.get()
+
+
+# SQL
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.db_seconds += elapsed
+    if elapsed * 1000 >= SLOW_QUERY_MS:
+        route = stats.route if stats is not None else UNMATCHED_ROUTE
+        slow_queries_total.inc(route)
+        logger.warning("slow query (%.1fms, route=%s): %s | params=%r", elapsed * 1000, route, statement, parameters)
+
+
+def _handle_error(exception_context):
+    # 실패한 문장은 after_cursor_execute 가 불리지 않으므로 시작 시각을 버린다
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
+
+
+def install_sql_hooks(*engines) -> None:
+    for e in engines:
+        target = getattr(e, "sync_engine", e)
+        if event.contains(target, "before_cursor_execute", _before_cursor_execute):
+            continue
+        event.listen(target, "before_cursor_execute", _before_cursor_execute)
+        event.listen(target, "after_cursor_execute", _after_cursor_execute)
+        event.listen(target, "handle_error", _handle_error)
+
+
+# 직렬화
+
+class SerializeTimer:
+    """블록 실행 시간을 현재 요청의 직렬화 시간에 더함 (요청 밖에서는 무시)"""
+
+    def __init__(self):
+        self.begin = 0.0
+
+    def __enter__(self):
+        self.begin = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        stats = _current.get()
+        if stats is not None:
+            stats.serialize_seconds += time.perf_counter() - self.begin
+
+
+def install_serialization_timer() -> None:
+    """
+    fastapi.routing.serialize_response(response_model 검증 + jsonable_encoder)를 감싼다.
+    FastAPI 가 모듈 전역 이름으로 호출하므로 모듈 속성을 교체하면 모든 라우트에 적용된다.
+    """
+    original = fastapi.routing.serialize_response
+    if getattr(original, "_timed", False):
+        return
+
+    async def serialize_response(*args, **kwargs):
+        with SerializeTimer():
+            return await original(*args, **kwargs)
+
+    serialize_response._timed = True
+    fastapi.routing.serialize_response = serialize_response
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSON 인코딩(render) 시간도 직렬화 시간에 포함"""
+
+    def render(self, content) -> bytes:
+        with SerializeTimer():
+            return super().render(content)
+
+
+# 미들웨어
+
+def _language(scope) -> str:
+    for key, value in scope.get("headers", ()):
+        if key == b"x-wanted-language":
+            lang = value.decode("latin-1")
+            return lang if lang in SUPPORTED_LANGUAGES else "ko"
+    return "ko"
+
+
+class RequestMetricsMiddleware:
+    """순수 ASGI 미들웨어 (스트리밍 응답도 본문 전송이 끝날 때까지 시간을 잰다)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope)
+        token = _current.set(stats)
+        status_code = 500
+        begin = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            labels = (stats.route, scope["method"], _language(scope))
+            requests_total.inc(*labels, str(status_code))
+            request_duration.observe(time.perf_counter() - begin, *labels)
+            request_db_duration.observe(stats.db_seconds, *labels)
+            request_statements.observe(stats.statements, *labels)
+            request_serialize_duration.observe(stats.serialize_seconds, *labels)
+
+
+def render_metrics() -> str:
+    return registry.render()
@@ -0,0 +1,66 @@
+"""
+/tags?mode=boolean 의 다중 태그 쿼리 파싱.
+
+    tag_3 AND tag_10 NOT tag_7
+    tag_3 tag_10 OR "태그 이름"
+
+태그명은 정확히 일치해야 하며(언어 무관), 공백이 있는 태그명은 따옴표로 감싼다.
+연산자는 대문자 AND / OR / NOT 이고 우선순위는 NOT > AND > OR 이다. (연속된 태그는 AND)
+결과는 OR 로 묶인 그룹 목록이며, 각 그룹은 (모두 가져야 하는 태그, 가지면 안 되는 태그) 이다.
+"""
+import shlex
+from typing import List, Tuple
+
+AND, OR, NOT = "AND", "OR", "NOT"
+# 한 쿼리의 최대 태그 수 (IN 목록/HAVING 식 크기 제한)
+MAX_TAG_QUERY_TERMS = 32
+
+TagQueryGroup = Tuple[List[str], List[str]]
+
+
+def parse_tag_query(query: str) -> List[TagQueryGroup]:
+    """잘못된 쿼리이면 ValueError"""
+    try:
+        tokens = shlex.split(query)
+    except ValueError as e:
+        raise ValueError(f"invalid tag query: {e}")
+    if not tokens:
+        raise ValueError("empty tag query")
+
+    groups: List[TagQueryGroup] = [([], [])]
+    negate = False
+    expect_term = True
+    terms = 0
+    for token in tokens:
+        if token == OR:
+            if expect_term:
+                raise ValueError("OR must follow a tag")
+            groups.append(([], []))
+        elif token == AND:
+            if expect_term:
+                raise ValueError("AND must follow a tag")
+            expect_term = True
+            continue
+        elif token == NOT:
+            if negate:
+                raise ValueError("NOT must be followed by a tag")
+            negate = True
+            continue
+        else:
+            include, exclude = groups[-1]
+            (exclude if negate else include).append(token)
+            negate = False
+            expect_term = False
+            terms += 1
+            continue
+        expect_term = True
+        negate = False
+    if expect_term or negate:
+        raise ValueError("tag query must end with a tag")
+    if terms > MAX_TAG_QUERY_TERMS:
+        raise ValueError(f"too many tags (max {MAX_TAG_QUERY_TERMS})")
+    for include, _ in groups:
+        if not include:
+            # NOT 만 있는 그룹은 전체 회사를 훑어야 하므로 허용하지 않는다
+            raise ValueError("each OR group needs at least one tag without NOT")
+    return groups
@@ -1,18 +1,48 @@
-from typing import Optional
+import os
+from typing import Dict, Optional, Tuple
 
 from fastapi import Header
 
+SUPPORTED_LANGUAGES = ("ko", "en", "ja", "tw")
+
+
+def get_env_bool(key: str, default: bool = False) -> bool:
+    value = os.environ.get(key)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
 
 def get_language(x_wanted_language: Optional[str] = Header(None)):
-    if x_wanted_language not in {"ko", "en", "ja", "tw"}:
+    if x_wanted_language not in SUPPORTED_LANGUAGES:
         return "ko"
     return x_wanted_language
 
 
+def _language_priorities() -> Dict[str, Tuple[str, ...]]:
+    """
+    언어별 이름 선택 순서. 요청 언어 다음에 LANGUAGE_FALLBACK_<LANG> (예: LANGUAGE_FALLBACK_TW=ja,en,ko) 순서로 찾고,
+    모두 없으면 가장 먼저 등록된 이름을 쓴다.
+    """
+    priorities = {}
+    for lang in SUPPORTED_LANGUAGES:
+        chain = [l.strip() for l in os.environ.get(f"LANGUAGE_FALLBACK_{lang.upper()}", "").split(",")]
+        priorities[lang] = tuple(dict.fromkeys([lang] + [l for l in chain if l in SUPPORTED_LANGUAGES]))
+    return priorities
+
+
+LANGUAGE_PRIORITIES = _language_priorities()
+
+
+def language_priority(lang: str) -> Tuple[str, ...]:
+    return LANGUAGE_PRIORITIES.get(lang, (lang,))
+
+
 def get_localized_name(name_objs, lang: str):
     if not name_objs:
         return None
-    name_obj = next((n for n in name_objs if n.language_code == lang), None)
-    if not name_obj:
-        name_obj = name_objs[0]
-    return name_obj.name if name_obj else None
+    by_language = {}
+    for n in name_objs:
+        by_language.setdefault(n.language_code, n)
+    name_obj = next((by_language[l] for l in language_priority(lang) if l in by_language), name_objs[0])
+    return name_obj.name
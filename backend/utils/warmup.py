@@ -0,0 +1,78 @@
+"""
+worker 시작 시 warmup.
+
+요청을 받기 전에 커넥션 풀을 pool_size 만큼 미리 열고, 이름 → id 캐시를 채우고,
+대표 읽기 쿼리를 한 번씩 실행해 SQLAlchemy 컴파일 캐시를 데워서 첫 요청들의 지연을 없앤다.
+동기 엔진 warmup 은 lifespan 의 이벤트 루프를 막지 않도록 스레드에서 실행한다.
+"""
+import asyncio
+import os
+import time
+
+from sqlalchemy import text
+
+from backend import models
+from backend.database import (
+    ASYNC_DB_ENABLED, DB_POOL_SIZE, ReadSessionLocal, async_engine, async_read_engine, engine, read_engine
+)
+from backend.services.impl.company import CompanyService
+from backend.services.impl.name_cache import company_name_cache, tag_name_cache
+from backend.utils.util import get_env_bool
+
+WARMUP_ENABLED = get_env_bool("WARMUP_ENABLED", True)
+# 0 이면 이름 캐시를 미리 채우지 않음
+WARMUP_NAME_CACHE_ROWS = int(os.environ.get("WARMUP_NAME_CACHE_ROWS", "0"))
+
+state = {"ready": False, "seconds": None}
+
+
+def warm_pool(target_engine, size: int = DB_POOL_SIZE) -> None:
+    """커넥션을 size 개 동시에 열었다가 반환하여 pool 에 남겨 둔다"""
+    connections = []
+    try:
+        for _ in range(size):
+            conn = target_engine.connect()
+            conn.execute(text("SELECT 1"))
+            connections.append(conn)
+    finally:
+        for conn in connections:
+            conn.close()
+
+
+async def warm_async_pool(target_engine, size: int = DB_POOL_SIZE) -> None:
+    connections = []
+    try:
+        for _ in range(size):
+            conn = await target_engine.connect()
+            await conn.execute(text("SELECT 1"))
+            connections.append(conn)
+    finally:
+        for conn in connections:
+            await conn.close()
+
+
+def warm_queries() -> None:
+    """대표 읽기 경로를 한 번씩 실행 (응답 캐시를 거치지 않도록 CompanyService 를 직접 사용)"""
+    service = CompanyService()
+    with ReadSessionLocal() as db:
+        sample = db.query(models.CompanyName.name).order_by(models.CompanyName.id).first()
+        service.autocomplete_company(db, "a", "ko", 1)
+        service.search_by_tag_page(db, "a", "ko", limit=1)
+        if sample is not None:
+            service.get_company(db, sample.name, "ko")
+        if WARMUP_NAME_CACHE_ROWS:
+            company_name_cache.preload(db, WARMUP_NAME_CACHE_ROWS)
+            tag_name_cache.preload(db, WARMUP_NAME_CACHE_ROWS)
+
+
+async def run() -> None:
+    begin = time.perf_counter()
+    if WARMUP_ENABLED:
+        for target in {engine, read_engine}:
+            await asyncio.to_thread(warm_pool, target)
+        if ASYNC_DB_ENABLED:
+            for target in {async_engine, async_read_engine}:
+                await warm_async_pool(target)
+        await asyncio.to_thread(warm_queries)
+    state["seconds"] = round(time.perf_counter() - begin, 3)
+    state["ready"] = True
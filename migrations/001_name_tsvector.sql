@@ -0,0 +1,11 @@
+-- company_names / tag_names 에 언어별 설정의 tsvector generated column + GIN 인덱스 추가 (FTS 검색용)
+-- 언어별 설정은 backend/models.py 의 FTS_CONFIGS 와 같아야 한다.
+
+ALTER TABLE company_names ADD COLUMN IF NOT EXISTS name_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector(CASE language_code WHEN 'ko' THEN 'simple'::regconfig WHEN 'en' THEN 'english'::regconfig WHEN 'ja' THEN 'simple'::regconfig WHEN 'tw' THEN 'simple'::regconfig ELSE 'simple'::regconfig END, name)) STORED;
+
+ALTER TABLE tag_names ADD COLUMN IF NOT EXISTS name_tsv tsvector
+    GENERATED ALWAYS AS (to_tsvector(CASE language_code WHEN 'ko' THEN 'simple'::regconfig WHEN 'en' THEN 'english'::regconfig WHEN 'ja' THEN 'simple'::regconfig WHEN 'tw' THEN 'simple'::regconfig ELSE 'simple'::regconfig END, name)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_company_names_name_tsv ON company_names USING gin (name_tsv);
+CREATE INDEX IF NOT EXISTS idx_tag_names_name_tsv ON tag_names USING gin (name_tsv);
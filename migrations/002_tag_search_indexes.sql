@@ -0,0 +1,6 @@
+-- 태그 검색용 인덱스: tag_names.name trigram (LIKE '%q%'), company_tags (tag_id, company_id)
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_tag_names_name_trgm ON tag_names USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_company_tags_tag_company ON company_tags (tag_id, company_id);
@@ -0,0 +1,4 @@
+-- 이름 정확 일치 조회용 B-tree 인덱스 (회사 조회, 중복 체크, 태그 매칭)
+
+CREATE INDEX IF NOT EXISTS idx_company_names_name ON company_names (name);
+CREATE INDEX IF NOT EXISTS idx_tag_names_name ON tag_names (name);
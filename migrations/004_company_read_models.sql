@@ -0,0 +1,31 @@
+-- (회사, 언어) 별 조회 응답 read model 테이블과 초기 백필
+-- 백필은 요청 언어 → 가장 먼저 등록된 이름 순으로만 고르며 LANGUAGE_FALLBACK_* 를 반영하지 않는다.
+-- backend.migrate 는 이 파일을 적용한 뒤 services/impl/read_model.py 의 계산식으로 다시 계산하며,
+-- psql 로 직접 적용했으면 python -m backend.services.impl.read_model 을 실행해야 한다.
+
+CREATE TABLE IF NOT EXISTS company_read_models (
+    company_id integer NOT NULL REFERENCES companies (id),
+    language_code varchar(8) NOT NULL,
+    company_name varchar(255),
+    tags varchar(255)[] NOT NULL DEFAULT '{}',
+    updated_at timestamp without time zone,
+    PRIMARY KEY (company_id, language_code)
+);
+
+INSERT INTO company_read_models (company_id, language_code, company_name, tags, updated_at)
+SELECT c.id, l.code,
+       (SELECT cn.name FROM company_names cn
+         WHERE cn.company_id = c.id
+         ORDER BY (cn.language_code = l.code) DESC, cn.id LIMIT 1),
+       COALESCE((SELECT array_agg(DISTINCT t.name COLLATE "C" ORDER BY t.name COLLATE "C")
+                   FROM (SELECT (SELECT tn.name FROM tag_names tn
+                                  WHERE tn.tag_id = ct.tag_id
+                                  ORDER BY (tn.language_code = l.code) DESC, tn.id LIMIT 1) AS name
+                           FROM company_tags ct
+                          WHERE ct.company_id = c.id) t
+                  WHERE t.name IS NOT NULL), '{}'),
+       now() AT TIME ZONE 'utc'
+  FROM companies c
+ CROSS JOIN unnest(ARRAY['ko', 'en', 'ja', 'tw']::varchar[]) AS l(code)
+ON CONFLICT (company_id, language_code) DO UPDATE
+   SET company_name = EXCLUDED.company_name, tags = EXCLUDED.tags, updated_at = EXCLUDED.updated_at;
@@ -0,0 +1,3 @@
+-- GET /export?updated_since= 증분 조회용 인덱스
+
+CREATE INDEX IF NOT EXISTS idx_companies_updated_at ON companies (updated_at);
@@ -0,0 +1,5 @@
+-- GET /search?mode=fuzzy 용 company_names.name trigram 인덱스
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_company_names_name_trgm ON company_names USING gin (name gin_trgm_ops);
@@ -0,0 +1,15 @@
+-- GET /tags/facets 용 태그별 회사 수 카운터 테이블 + 기존 데이터 백필
+
+CREATE TABLE IF NOT EXISTS tag_counts (
+    tag_id integer PRIMARY KEY REFERENCES tags (id),
+    company_count integer NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_tag_counts_company_count ON tag_counts (company_count, tag_id);
+
+INSERT INTO tag_counts (tag_id, company_count)
+SELECT t.id, count(ct.tag_id)
+  FROM tags t
+  LEFT JOIN company_tags ct ON ct.tag_id = t.id
+ GROUP BY t.id
+ON CONFLICT (tag_id) DO UPDATE SET company_count = EXCLUDED.company_count;
@@ -0,0 +1,48 @@
+-- (language_code, name) 이 같은 태그명을 가진 중복 태그를 가장 먼저 만든 태그로 합친 뒤 unique 제약 추가
+-- 합쳐지는 태그의 회사 매핑/없는 언어 이름은 남는 태그로 옮기고, 태그별 회사 수(tag_counts)를 다시 계산한다
+-- (company_read_models 의 태그명이 바뀔 수 있으므로 backend.migrate 가 적용 후 다시 계산한다.
+--  psql 로 직접 적용했으면 python -m backend.services.impl.read_model 을 실행)
+-- (tag_names 를 옮기거나 지우므로 실행 중인 서버의 이름 → id 캐시가 stale 해진다. 적용 후 서버를 재시작)
+
+DO $$
+BEGIN
+    LOOP
+        CREATE TEMP TABLE IF NOT EXISTS tag_merge (dup integer PRIMARY KEY, keep integer NOT NULL) ON COMMIT DROP;
+        TRUNCATE tag_merge;
+        INSERT INTO tag_merge (dup, keep)
+        SELECT tag_id, min(keep)
+          FROM (SELECT tag_id, min(tag_id) OVER (PARTITION BY language_code, name) AS keep FROM tag_names) t
+         WHERE tag_id <> keep
+         GROUP BY tag_id;
+        EXIT WHEN NOT FOUND;
+
+        INSERT INTO company_tags (company_id, tag_id)
+        SELECT ct.company_id, m.keep FROM company_tags ct JOIN tag_merge m ON ct.tag_id = m.dup
+        ON CONFLICT (company_id, tag_id) DO NOTHING;
+        DELETE FROM company_tags ct USING tag_merge m WHERE ct.tag_id = m.dup;
+
+        -- 남는 태그에 없는 언어의 이름은 옮기고 나머지는 삭제
+        UPDATE tag_names tn SET tag_id = m.keep
+          FROM tag_merge m
+         WHERE tn.tag_id = m.dup
+           AND NOT EXISTS (SELECT 1 FROM tag_names k WHERE k.tag_id = m.keep AND k.language_code = tn.language_code)
+           AND tn.id = (SELECT min(d.id) FROM tag_names d JOIN tag_merge dm ON d.tag_id = dm.dup
+                         WHERE dm.keep = m.keep AND d.language_code = tn.language_code);
+        DELETE FROM tag_names tn USING tag_merge m WHERE tn.tag_id = m.dup;
+
+        DELETE FROM tag_counts tc USING tag_merge m WHERE tc.tag_id = m.dup;
+        DELETE FROM tags t USING tag_merge m WHERE t.id = m.dup;
+    END LOOP;
+
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = '_tag_lang_name_uc') THEN
+        ALTER TABLE tag_names ADD CONSTRAINT _tag_lang_name_uc UNIQUE (language_code, name);
+    END IF;
+END
+$$;
+
+INSERT INTO tag_counts (tag_id, company_count)
+SELECT t.id, count(ct.tag_id)
+  FROM tags t
+  LEFT JOIN company_tags ct ON ct.tag_id = t.id
+ GROUP BY t.id
+ON CONFLICT (tag_id) DO UPDATE SET company_count = EXCLUDED.company_count;
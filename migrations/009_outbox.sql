@@ -0,0 +1,18 @@
+-- 변경 이벤트 outbox 와 sink 별 처리 offset (services/impl/outbox.py)
+
+CREATE TABLE IF NOT EXISTS outbox_events (
+    id bigserial PRIMARY KEY,
+    kind varchar(32) NOT NULL,
+    company_id integer NOT NULL,
+    tag_ids integer[] NOT NULL DEFAULT '{}',
+    languages varchar(8)[] NOT NULL DEFAULT '{}',
+    created_at timestamp without time zone NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_outbox_events_created_at ON outbox_events (created_at);
+
+CREATE TABLE IF NOT EXISTS outbox_offsets (
+    sink varchar(64) PRIMARY KEY,
+    last_event_id bigint NOT NULL DEFAULT 0,
+    updated_at timestamp without time zone
+);